@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from common import MockLLMClient, emit, environment, fixture_documents
+from medlabs_sdk.bulk import BulkExtraction
+from medlabs_sdk.pipeline import BatchItem, MedLabsPipeline
+from medlabs_sdk.providers import PromptedLLMClient, run_batch_file
+
+
+class MockGenerator:
+    """`StructuredGenerator` over the benchmark `MockLLMClient`."""
+
+    model = "bench-model"
+
+    def __init__(self) -> None:
+        self._client = MockLLMClient()
+
+    def generate_structured(self, *, system_prompt: str, **kwargs: Any) -> dict[str, Any]:
+        del system_prompt
+        return self._client.extract_structured(prompt_name="", prompt_version="", **kwargs)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Batch API job files: prepare, finish, resume")
+    parser.add_argument("--copies", type=int, default=100, help="fixture set repetitions")
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def _timed(call: Any, documents: int) -> dict[str, float]:
+    start = perf_counter()
+    call()
+    wall_s = perf_counter() - start
+    return {"wall_s": round(wall_s, 3), "docs_per_sec": round(documents / wall_s, 1)}
+
+
+def main() -> None:
+    args = parse_args()
+    pipeline = MedLabsPipeline(
+        llm_client=PromptedLLMClient(prompt_provider=None, generator=MockGenerator()),
+        prompt_name="medlabs.extract",
+        prompt_version="bench",
+        log_level="WARNING",
+    )
+    items = [
+        BatchItem(source=text, panel=panel) for panel, text in fixture_documents()
+    ] * args.copies
+
+    with tempfile.TemporaryDirectory() as workdir:
+        bulk = BulkExtraction(pipeline, workdir)
+        results_path = Path(workdir) / "results.jsonl"
+        prepare = _timed(lambda: bulk.prepare(items), len(items))
+        run_batch_file(bulk.requests_path, results_path, MockGenerator())
+        finish = _timed(lambda: list(bulk.run(results_path)), len(items))
+        resume = _timed(lambda: list(bulk.run(results_path)), len(items))
+        checkpoint_mb = bulk.checkpoint_path.stat().st_size / 1e6
+
+    emit(
+        {
+            "benchmark": "bulk_extraction",
+            "environment": environment(),
+            "documents": len(items),
+            "prepare": prepare,
+            "finish": finish,
+            "resume_from_checkpoint": resume,
+            "checkpoint_mb": round(checkpoint_mb, 2),
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
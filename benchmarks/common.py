@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import platform
+import resource
+import sys
+from pathlib import Path
+from time import sleep
+from typing import Any
+
+from medlabs_sdk.core.extract import RegexExtractor
+from medlabs_sdk.core.models import RawDocument
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLES_DIR = ROOT / "standard" / "examples" / "v0.1"
+
+
+def load_fixtures() -> list[dict[str, Any]]:
+    return [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(EXAMPLES_DIR.glob("*/*.json"))
+    ]
+
+
+def render_fixture(panel: dict[str, Any]) -> tuple[str, int]:
+    """Render a standard panel back to report text; returns text and result line count."""
+
+    source = panel.get("source", {})
+    lines = [str(source.get("lab_name", "")), str(source.get("raw_text", ""))]
+    result_lines = 0
+    for observation in panel.get("observations", []):
+        raw_text = observation.get("source", {}).get("raw_text")
+        if not raw_text:
+            continue
+        lines.append(raw_text)
+        result_lines += 1
+    return "\n".join(lines), result_lines
+
+
+def fixture_documents() -> list[tuple[str, str]]:
+    """(panel code, rendered text) for every standard example."""
+
+    return [
+        (panel["panel_code"]["code"], render_fixture(panel)[0]) for panel in load_fixtures()
+    ]
+
+
+class MockLLMClient:
+    """Deterministic `LLMClient`: parses the input with the regex templates after a delay."""
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency_s = latency_ms / 1000
+        self.calls = 0
+        self._extractor = RegexExtractor()
+
+    def extract_structured(
+        self,
+        *,
+        prompt_name: str,
+        prompt_version: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+    ) -> dict[str, Any]:
+        del prompt_name, prompt_version, output_schema, temperature
+        self.calls += 1
+        if self.latency_s > 0:
+            sleep(self.latency_s)
+        report = self._extractor.extract(RawDocument(text=input_text))
+        return {
+            "fields": [
+                {
+                    "name_raw": field.name_raw,
+                    "value_raw": field.value_raw,
+                    "unit_raw": field.unit_raw,
+                    "ref_raw": field.ref_raw,
+                    "confidence": 0.95,
+                    "evidence": field.evidence,
+                }
+                for field in report.fields
+            ]
+        }
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    ordered = sorted(values)
+
+    def at(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 4)
+
+    return {"p50": at(0.50), "p95": at(0.95), "p99": at(0.99)}
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def environment() -> dict[str, str]:
+    return {"python": platform.python_version(), "platform": platform.platform()}
+
+
+def emit(result: dict[str, Any], output: Path | None) -> None:
+    text = json.dumps(result, indent=2)
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(text + "\n", encoding="utf-8")
+    print(text)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+# Metrics where a larger value is an improvement; every other timing or memory
+# metric is treated as lower-is-better.
+_HIGHER_IS_BETTER = ("docs_per_sec", "ops_per_sec")
+_LOWER_IS_BETTER = (
+    "p50",
+    "p95",
+    "p99",
+    "wall_s",
+    "peak_rss_mb",
+    "us_per_line",
+    "bytes_per_observation",
+)
+
+
+def flatten(value: Any, prefix: str = "") -> dict[str, float]:
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = ((str(index), item) for index, item in enumerate(value))
+    elif isinstance(value, int | float) and not isinstance(value, bool):
+        return {prefix: float(value)}
+    else:
+        return {}
+
+    flat: dict[str, float] = {}
+    for key, item in items:
+        flat.update(flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+    return flat
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float,
+) -> list[dict[str, Any]]:
+    old = flatten(baseline)
+    new = flatten(current)
+    rows = []
+    for path in sorted(old.keys() & new.keys()):
+        metric = path.rsplit(".", 1)[-1]
+        if metric in _HIGHER_IS_BETTER:
+            sign = -1
+        elif metric in _LOWER_IS_BETTER:
+            sign = 1
+        else:
+            continue
+        if old[path] == 0:
+            continue
+        change = (new[path] - old[path]) / old[path]
+        rows.append(
+            {
+                "metric": path,
+                "baseline": old[path],
+                "current": new[path],
+                "change": round(change, 4),
+                "regression": sign * change > threshold,
+            }
+        )
+    return rows
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare two benchmark JSON outputs")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="relative slowdown reported as a regression",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    rows = compare(
+        json.loads(args.baseline.read_text(encoding="utf-8")),
+        json.loads(args.current.read_text(encoding="utf-8")),
+        args.threshold,
+    )
+    regressions = [row for row in rows if row["regression"]]
+    print(json.dumps({"compared": len(rows), "regressions": regressions}, indent=2))
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import random
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Any
+
+from common import MockLLMClient, emit, environment, fixture_documents, percentiles
+from medlabs_sdk.core.extract import ExtractPolicy
+from medlabs_sdk.pipeline import MedLabsPipeline
+
+
+class HeavyTailClient(MockLLMClient):
+    """Mostly `latency_ms`, but `tail_ratio` of calls stall for `tail_ms`."""
+
+    def __init__(self, latency_ms: float, tail_ms: float, tail_ratio: float, seed: int) -> None:
+        super().__init__()
+        self.base_s = latency_ms / 1000
+        self.tail_s = tail_ms / 1000
+        self.tail_ratio = tail_ratio
+        self._random = random.Random(seed)
+
+    def extract_structured(self, **kwargs: Any) -> dict[str, Any]:
+        slow = self._random.random() < self.tail_ratio
+        sleep(self.tail_s if slow else self.base_s)
+        return super().extract_structured(**kwargs)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Tail latency with and without hedged LLM calls")
+    parser.add_argument("--copies", type=int, default=20, help="fixture set repetitions")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--tail-ms", type=float, default=100.0)
+    parser.add_argument("--tail-ratio", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def run(args: argparse.Namespace, policy: ExtractPolicy | None) -> dict[str, Any]:
+    client = HeavyTailClient(args.latency_ms, args.tail_ms, args.tail_ratio, seed=7)
+    pipeline = MedLabsPipeline(
+        llm_client=client,
+        prompt_name="medlabs.extract",
+        prompt_version="bench",
+        log_level="WARNING",
+        extract_policy=policy,
+    )
+    documents = fixture_documents() * args.copies
+    latencies: list[float] = []
+
+    def parse(document: tuple[str, str]) -> None:
+        panel, text = document
+        start = perf_counter()
+        pipeline.parse_text(text, panel=panel)
+        latencies.append((perf_counter() - start) * 1000)
+
+    start = perf_counter()
+    with pipeline, ThreadPoolExecutor(max_workers=args.workers) as pool:
+        list(pool.map(parse, documents))
+    wall_s = perf_counter() - start
+    return {
+        "documents": len(documents),
+        "llm_calls": client.calls,
+        "wall_s": round(wall_s, 3),
+        "docs_per_sec": round(len(documents) / wall_s, 1),
+        "latency_ms": percentiles(latencies),
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    hedged = ExtractPolicy(
+        hedge=True,
+        hedge_initial_delay_s=args.latency_ms * 3 / 1000,
+        hedge_min_samples=20,
+    )
+    emit(
+        {
+            "benchmark": "extract_resilience",
+            "environment": environment(),
+            "tail_ratio": args.tail_ratio,
+            "no_policy": run(args, None),
+            "hedged": run(args, hedged),
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import argparse
+import json
+from time import perf_counter
+from typing import Any
+
+from common import load_fixtures, render_fixture
+from medlabs_sdk.core.extract import LabTemplate, RegexExtractor, TemplateRegistry
+from medlabs_sdk.core.extract.templates import DEFAULT_TEMPLATES, GENERIC_TEMPLATE
+from medlabs_sdk.core.map import panel_coverage
+from medlabs_sdk.core.models import RawDocument
+from medlabs_sdk.core.normalize import normalize
+
+
+def synthetic_lab_templates(count: int) -> list[LabTemplate]:
+    return [
+        LabTemplate(
+            name=f"lab-{index:02d}",
+            name_pattern=r"[A-Za-z][A-Za-z ]{1,40}?",
+            value_pattern=r"[0-9]+(?:\.[0-9]+)?",
+            unit_pattern=r"\S+",
+            ref_pattern=r"[0-9.]+\s*-\s*[0-9.]+",
+            ref_open="[",
+            ref_close="]",
+            fingerprint=rf"Synthetic Lab {index:02d}\b",
+            priority=10,
+        )
+        for index in range(count)
+    ]
+
+
+def run(
+    registry: TemplateRegistry,
+    documents: list[tuple[str, RawDocument, int]],
+    repeat: int,
+) -> dict[str, Any]:
+    extractor = RegexExtractor(registry)
+    start = perf_counter()
+    for _ in range(repeat):
+        for _, document, _ in documents:
+            extractor.extract(document)
+    elapsed = perf_counter() - start
+
+    extracted = 0
+    expected = 0
+    fast_path_docs = 0
+    for panel_code, document, result_lines in documents:
+        report = extractor.extract(document)
+        extracted += min(len(report.fields), result_lines)
+        expected += result_lines
+        if panel_coverage(normalize(report), panel_code) >= 0.8:
+            fast_path_docs += 1
+
+    total_lines = sum(len(document.text.splitlines()) for _, document, _ in documents) * repeat
+    return {
+        "templates": len(registry.templates),
+        "docs_per_sec": round(len(documents) * repeat / elapsed, 1),
+        "us_per_line": round(elapsed / total_lines * 1e6, 3),
+        "line_recall": round(extracted / expected, 3) if expected else 0.0,
+        "fast_path_docs": fast_path_docs,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Template extraction over standard examples")
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--lab-templates", type=int, default=12)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    documents: list[tuple[str, RawDocument, int]] = []
+    for panel in load_fixtures():
+        text, result_lines = render_fixture(panel)
+        documents.append((panel["panel_code"]["code"], RawDocument(text=text), result_lines))
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "lab_templates",
+                "documents": len(documents),
+                "repeat": args.repeat,
+                "generic_only": run(TemplateRegistry([GENERIC_TEMPLATE]), documents, args.repeat),
+                "default": run(TemplateRegistry(DEFAULT_TEMPLATES), documents, args.repeat),
+                "with_lab_templates": run(
+                    TemplateRegistry(
+                        [*DEFAULT_TEMPLATES, *synthetic_lab_templates(args.lab_templates)]
+                    ),
+                    documents,
+                    args.repeat,
+                ),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from common import MockLLMClient, emit, environment, fixture_documents
+from medlabs_sdk.pipeline import MedLabsPipeline
+from medlabs_sdk.providers import PromptedLLMClient, RouteBackend, RoutingGenerator
+
+
+class EndpointGenerator:
+    """Mock endpoint that serves at most `slots` requests at a time, each `latency_ms` long."""
+
+    def __init__(self, latency_ms: float, slots: int) -> None:
+        self.model = "bench-model"
+        self._client = MockLLMClient(latency_ms)
+        self._slots = threading.Semaphore(slots)
+
+    def generate_structured(self, *, system_prompt: str, **kwargs: Any) -> dict[str, Any]:
+        del system_prompt
+        with self._slots:
+            return self._client.extract_structured(prompt_name="", prompt_version="", **kwargs)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Throughput of one vs several LLM endpoints")
+    parser.add_argument("--copies", type=int, default=10, help="fixture set repetitions")
+    parser.add_argument("--latency-ms", type=float, default=10.0)
+    parser.add_argument("--slots", type=int, default=2, help="concurrent requests per endpoint")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def run(args: argparse.Namespace, latencies_ms: list[float]) -> dict[str, Any]:
+    router = RoutingGenerator(
+        [
+            RouteBackend(f"endpoint-{index}", EndpointGenerator(latency_ms, args.slots))
+            for index, latency_ms in enumerate(latencies_ms)
+        ]
+    )
+    pipeline = MedLabsPipeline(
+        llm_client=PromptedLLMClient(prompt_provider=None, generator=router),
+        prompt_name="medlabs.extract",
+        prompt_version="bench",
+        log_level="WARNING",
+    )
+    documents = fixture_documents() * args.copies
+
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        list(pool.map(lambda item: pipeline.parse_text(item[1], panel=item[0]), documents))
+    wall_s = perf_counter() - start
+    return {
+        "documents": len(documents),
+        "wall_s": round(wall_s, 3),
+        "docs_per_sec": round(len(documents) / wall_s, 1),
+        "backends": {
+            name: {"requests": item["requests"], "latency_ewma_ms": item["latency_ewma_ms"]}
+            for name, item in router.stats().items()
+        },
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    emit(
+        {
+            "benchmark": "llm_routing",
+            "environment": environment(),
+            "one_endpoint": run(args, [args.latency_ms]),
+            # A hosted model plus two slower self-hosted nodes.
+            "three_endpoints": run(args, [args.latency_ms] + [args.latency_ms * 2] * 2),
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
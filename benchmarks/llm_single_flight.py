@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import argparse
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Any
+
+from common import emit, environment, fixture_documents
+from medlabs_sdk.providers import SingleFlightGenerator
+
+
+class FakeModelServer:
+    """Stand-in `StructuredGenerator`: fixed latency, counts calls and peak concurrency."""
+
+    model = "fake-model"
+
+    def __init__(self, latency_ms: float) -> None:
+        self.latency_s = latency_ms / 1000
+        self.calls = 0
+        self.active = 0
+        self.peak_active = 0
+        self._lock = threading.Lock()
+
+    def generate_structured(
+        self,
+        *,
+        system_prompt: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+    ) -> dict[str, Any]:
+        del system_prompt, output_schema, temperature
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        sleep(self.latency_s)
+        with self._lock:
+            self.active -= 1
+        return {"fields": [{"name_raw": input_text[:16]}]}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="LLM calls with and without SingleFlightGenerator")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--callers", type=int, default=32, help="concurrent caller threads")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.5)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--rate-per-second", type=float, default=None)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def _inputs(count: int, duplicate_ratio: float) -> list[str]:
+    rng = random.Random(0)
+    texts = [text for _, text in fixture_documents()]
+    unique = [f"{texts[index % len(texts)]}\n#{index}" for index in range(count)]
+    return [
+        rng.choice(texts) if rng.random() < duplicate_ratio else unique[index]
+        for index in range(count)
+    ]
+
+
+def _run(generator: Any, server: FakeModelServer, inputs: list[str], callers: int) -> dict:
+    def call(text: str) -> None:
+        generator.generate_structured(
+            system_prompt="Extract lab results as JSON.",
+            input_text=text,
+            output_schema={"type": "object"},
+        )
+
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        list(pool.map(call, inputs))
+    wall_s = perf_counter() - start
+    return {
+        "wall_s": round(wall_s, 3),
+        "ops_per_sec": round(len(inputs) / wall_s, 1),
+        "upstream_calls": server.calls,
+        "peak_concurrency": server.peak_active,
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    inputs = _inputs(args.requests, args.duplicate_ratio)
+
+    direct_server = FakeModelServer(args.latency_ms)
+    direct = _run(direct_server, direct_server, inputs, args.callers)
+
+    single_flight_server = FakeModelServer(args.latency_ms)
+    with SingleFlightGenerator(
+        single_flight_server,
+        max_concurrency=args.max_concurrency,
+        rate_per_second=args.rate_per_second,
+    ) as generator:
+        single_flight = _run(generator, single_flight_server, inputs, args.callers)
+        single_flight["coalesced"] = generator.coalesced
+
+    emit(
+        {
+            "benchmark": "llm_single_flight",
+            "environment": environment(),
+            "requests": args.requests,
+            "callers": args.callers,
+            "duplicate_ratio": args.duplicate_ratio,
+            "latency_ms": args.latency_ms,
+            "direct": direct,
+            "single_flight": single_flight,
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
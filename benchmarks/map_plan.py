@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+from itertools import cycle, islice
+from pathlib import Path
+from time import perf_counter
+
+from common import emit, environment, fixture_documents
+from medlabs_sdk.core.extract import RegexExtractor
+from medlabs_sdk.core.map import CounterIds, DeterministicIds, RandomIds, to_standard_panel
+from medlabs_sdk.core.map import to_standard as to_standard_module
+from medlabs_sdk.core.models import NormalizedReport, RawDocument
+from medlabs_sdk.core.normalize import normalize
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="to_standard_panel cost per 1k observations")
+    parser.add_argument("--observations", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    extractor = RegexExtractor()
+    panels: dict[str, list] = {}
+    for panel, text in fixture_documents():
+        report = normalize(extractor.extract(RawDocument(text=text)))
+        panels.setdefault(panel, []).extend(report.observations)
+
+    reports = [
+        (
+            panel,
+            NormalizedReport(
+                document=RawDocument(text="", meta={"document_id": f"bench-{panel}"}),
+                observations=list(islice(cycle(observations), args.observations)),
+            ),
+        )
+        for panel, observations in panels.items()
+    ]
+
+    start = perf_counter()
+    for panel, _ in reports:
+        to_standard_module._PANEL_PLANS.pop(panel, None)
+        to_standard_module._panel_plan(panel)
+    compile_ms = (perf_counter() - start) * 1000 / len(reports)
+
+    strategies = {
+        "random": RandomIds(),
+        "deterministic": DeterministicIds(),
+        "counter": CounterIds(),
+    }
+    per_1k_ms: dict[str, float] = {}
+    for name, ids in strategies.items():
+        start = perf_counter()
+        for _ in range(args.repeat):
+            for panel, report in reports:
+                to_standard_panel(report, panel=panel, ids=ids)
+        elapsed = perf_counter() - start
+        per_1k_ms[name] = elapsed * 1000 / (args.repeat * len(reports)) * (1000 / args.observations)
+
+    emit(
+        {
+            "benchmark": "map_plan",
+            "panels": [panel for panel, _ in reports],
+            "observations_per_panel": args.observations,
+            "environment": environment(),
+            "plan_compile_ms": round(compile_ms, 3),
+            "ms_per_1k_observations": round(per_1k_ms["random"], 3),
+            "ids": {
+                name: {"ms_per_1k_observations": round(value, 3)}
+                for name, value in per_1k_ms.items()
+            },
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
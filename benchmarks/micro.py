@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from common import emit, environment, fixture_documents, percentiles
+from medlabs_sdk.core.extract import RegexExtractor
+from medlabs_sdk.core.map import to_standard_panel
+from medlabs_sdk.core.models import RawDocument
+from medlabs_sdk.core.normalize import normalize
+from medlabs_sdk.core.validate import validate_jsonschema, warm_validators
+
+
+def measure(calls: list[Callable[[], Any]], iterations: int) -> dict[str, Any]:
+    for call in calls:
+        call()
+
+    samples_us: list[float] = []
+    start = perf_counter()
+    for _ in range(iterations):
+        for call in calls:
+            call_start = perf_counter()
+            call()
+            samples_us.append((perf_counter() - call_start) * 1e6)
+    elapsed = perf_counter() - start
+
+    return {
+        "calls": len(samples_us),
+        "ops_per_sec": round(len(samples_us) / elapsed, 1),
+        "us": percentiles(samples_us),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Per-call cost of normalize, to_standard_panel and validate_jsonschema"
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    extractor = RegexExtractor()
+    extracted = [
+        (panel, extractor.extract(RawDocument(text=text))) for panel, text in fixture_documents()
+    ]
+    normalized = [(panel, normalize(report)) for panel, report in extracted]
+    mapped = [to_standard_panel(report, panel=panel) for panel, report in normalized]
+    warm_validators()
+
+    emit(
+        {
+            "benchmark": "micro",
+            "iterations": args.iterations,
+            "fixtures": len(extracted),
+            "environment": environment(),
+            "normalize": measure(
+                [lambda report=report: normalize(report) for _, report in extracted],
+                args.iterations,
+            ),
+            "to_standard_panel": measure(
+                [
+                    lambda report=report, panel=panel: to_standard_panel(report, panel=panel)
+                    for panel, report in normalized
+                ],
+                args.iterations,
+            ),
+            "validate_jsonschema": measure(
+                [
+                    lambda panel=panel: validate_jsonschema(
+                        panel.data,
+                        panel_code=panel.data["panel_code"]["code"],
+                    )
+                    for panel in mapped
+                ],
+                args.iterations,
+            ),
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
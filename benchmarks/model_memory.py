@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from common import emit, environment, fixture_documents
+from medlabs_sdk.core.extract import RegexExtractor
+from medlabs_sdk.core.models import NormalizedObservation, RawDocument
+from medlabs_sdk.core.normalize import normalize_many
+
+
+@dataclass
+class _DictObservation:
+    """NormalizedObservation as it was before slots and the shared empty evidence."""
+
+    code: str
+    value: float | str | bool | None
+    unit: str
+    ref_low: float | None = None
+    ref_high: float | None = None
+    source_name: str = ""
+    confidence: float = 0.0
+    evidence: dict[str, Any] = field(default_factory=dict)
+    flags_raw: str = ""
+    comparator: str = ""
+    original_unit: str = ""
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Memory per observation of the core models")
+    parser.add_argument("--observations", type=int, default=200_000)
+    parser.add_argument("--copies", type=int, default=2000, help="fixture set repetitions")
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def _bytes_per_item(build: Callable[[], list[Any]]) -> tuple[float, int]:
+    gc.collect()
+    tracemalloc.start()
+    items = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(items), len(items)
+
+
+def _observations(cls: type, count: int) -> list[Any]:
+    # Distinct floats, shared strings: the per-instance overhead is what differs.
+    return [cls("wbc", float(index), "10*9/L", 4.0, 10.0, "WBC") for index in range(count)]
+
+
+def main() -> None:
+    args = parse_args()
+    count = args.observations
+    slotted, _ = _bytes_per_item(lambda: _observations(NormalizedObservation, count))
+    dict_based, _ = _bytes_per_item(lambda: _observations(_DictObservation, count))
+
+    extractor = RegexExtractor()
+    reports = [
+        extractor.extract(RawDocument(text=text)) for _, text in fixture_documents()
+    ] * args.copies
+
+    def pipeline_observations() -> list[Any]:
+        return [
+            observation
+            for report in normalize_many(reports)
+            for observation in report.observations
+        ]
+
+    normalized, normalized_count = _bytes_per_item(pipeline_observations)
+
+    emit(
+        {
+            "benchmark": "model_memory",
+            "environment": environment(),
+            "observations": count,
+            "bytes_per_observation": round(slotted, 1),
+            "dict_bytes_per_observation": round(dict_based, 1),
+            "normalize_many": {
+                "observations": normalized_count,
+                "bytes_per_observation": round(normalized, 1),
+            },
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from time import perf_counter
+
+from common import emit, environment, fixture_documents
+from medlabs_sdk.core.extract import RegexExtractor
+from medlabs_sdk.core.models import RawDocument
+from medlabs_sdk.core.normalize import UnitConverter, normalize, normalize_many
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Per-report normalize vs normalize_many")
+    parser.add_argument("--copies", type=int, default=1000, help="fixture set repetitions")
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    extractor = RegexExtractor()
+    reports = [
+        extractor.extract(RawDocument(text=text)) for _, text in fixture_documents()
+    ] * args.copies
+    fields = sum(len(report.fields) for report in reports)
+
+    start = perf_counter()
+    expected = [normalize(report) for report in reports]
+    per_report_s = perf_counter() - start
+
+    start = perf_counter()
+    batched = normalize_many(reports)
+    batch_s = perf_counter() - start
+
+    converter = UnitConverter()
+    start = perf_counter()
+    normalize_many(reports, converter=converter)
+    converted_s = perf_counter() - start
+
+    emit(
+        {
+            "benchmark": "normalize_batch",
+            "reports": len(reports),
+            "fields": fields,
+            "environment": environment(),
+            "identical": batched == expected,
+            "per_report_ns_per_field": round(per_report_s / fields * 1e9, 1),
+            "batch_ns_per_field": round(batch_s / fields * 1e9, 1),
+            "speedup": round(per_report_s / batch_s, 2),
+            "batch_with_conversion_ns_per_field": round(converted_s / fields * 1e9, 1),
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from time import perf_counter
+
+from common import emit, environment, fixture_documents
+from medlabs_sdk.core.extract import RegexExtractor
+from medlabs_sdk.core.models import RawDocument
+from medlabs_sdk.core.normalize import (
+    canonicalize_name,
+    name_cache_stats,
+    normalize_unit,
+    unit_cache_stats,
+)
+from medlabs_sdk.core.normalize.names import _ALIAS_MAP, _canonicalize_name
+from medlabs_sdk.core.normalize.units import _UNIT_ALIASES, _normalize_unit
+
+
+def ns_per_call(func, values: list[str], iterations: int) -> float:
+    start = perf_counter()
+    for _ in range(iterations):
+        for value in values:
+            func(value)
+    return round((perf_counter() - start) / (iterations * len(values)) * 1e9, 1)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Memoized name/unit lookups over the fixture vocabulary"
+    )
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    extractor = RegexExtractor()
+    fields = [
+        field
+        for _, text in fixture_documents()
+        for field in extractor.extract(RawDocument(text=text)).fields
+    ]
+    names = [field.name_raw for field in fields] + list(_ALIAS_MAP)
+    units = [field.unit_raw for field in fields] + list(_UNIT_ALIASES)
+
+    uncached_name = _canonicalize_name.__wrapped__
+    uncached_unit = _normalize_unit.__wrapped__
+    result = {
+        "benchmark": "normalize_memo",
+        "names": len(names),
+        "units": len(units),
+        "environment": environment(),
+        "canonicalize_name_ns": {
+            "uncached": ns_per_call(lambda name: uncached_name(name, 0), names, args.iterations),
+            "memoized": ns_per_call(canonicalize_name, names, args.iterations),
+        },
+        "normalize_unit_ns": {
+            "uncached": ns_per_call(lambda unit: uncached_unit(unit, 0), units, args.iterations),
+            "memoized": ns_per_call(normalize_unit, units, args.iterations),
+        },
+        "name_cache": name_cache_stats(),
+        "unit_cache": unit_cache_stats(),
+    }
+    emit(result, args.output)
+
+
+if __name__ == "__main__":
+    main()
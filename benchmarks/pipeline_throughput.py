@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from collections import defaultdict
+from itertools import cycle, islice
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from common import (
+    MockLLMClient,
+    emit,
+    environment,
+    fixture_documents,
+    peak_rss_mb,
+    percentiles,
+)
+from medlabs_sdk.pipeline import BatchItem, MedLabsPipeline
+from medlabs_sdk.providers.noop_tracer import NoopTracer
+
+
+def run_size(documents: int, *, latency_ms: float, concurrency: int) -> dict[str, Any]:
+    client = MockLLMClient(latency_ms=latency_ms)
+    pipeline = MedLabsPipeline(
+        llm_client=client,
+        prompt_name="medlabs.extract",
+        prompt_version="bench",
+        tracer=NoopTracer(),
+        log_level="WARNING",
+    )
+    items = [
+        BatchItem(source=text, panel=panel, document_meta={"document_id": f"bench-{index}"})
+        for index, (panel, text) in enumerate(islice(cycle(fixture_documents()), documents))
+    ]
+
+    step_durations: dict[str, list[float]] = defaultdict(list)
+    errors = 0
+    start = perf_counter()
+    for item_result in pipeline.parse_many(items, concurrency=concurrency):
+        if not item_result.ok:
+            errors += 1
+        for step in item_result.steps:
+            step_durations[step.pipeline_step].append(step.duration_ms)
+    elapsed = perf_counter() - start
+
+    return {
+        "documents": documents,
+        "errors": errors,
+        "llm_calls": client.calls,
+        "wall_s": round(elapsed, 3),
+        "docs_per_sec": round(documents / elapsed, 1),
+        "steps_ms": {step: percentiles(values) for step, values in step_durations.items()},
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="End-to-end MedLabsPipeline throughput with a mock LLM client"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10_000])
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.child:
+        # One size per interpreter, so ru_maxrss is not inherited from a larger run.
+        result = run_size(args.sizes[0], latency_ms=args.latency_ms, concurrency=args.concurrency)
+        print(json.dumps(result))
+        return
+
+    runs = []
+    for size in args.sizes:
+        completed = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                "--sizes",
+                str(size),
+                "--latency-ms",
+                str(args.latency_ms),
+                "--concurrency",
+                str(args.concurrency),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    emit(
+        {
+            "benchmark": "pipeline_throughput",
+            "latency_ms": args.latency_ms,
+            "concurrency": args.concurrency,
+            "environment": environment(),
+            "runs": runs,
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
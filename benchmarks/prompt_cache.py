@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import argparse
+import json
+from time import perf_counter, sleep
+
+from medlabs_sdk.providers import CachingPromptProvider, StaticPromptProvider
+
+
+class SlowPromptProvider(StaticPromptProvider):
+    """Stand-in for a remote prompt store with a fixed round-trip time."""
+
+    def __init__(self, latency_s: float) -> None:
+        super().__init__({("medlabs.extract", "production"): "Extract lab results as JSON."})
+        self.latency_s = latency_s
+
+    def get_prompt(self, *, prompt_name: str, prompt_version: str) -> str:
+        sleep(self.latency_s)
+        return super().get_prompt(prompt_name=prompt_name, prompt_version=prompt_version)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Prompt lookup latency with and without cache")
+    parser.add_argument("--iterations", type=int, default=100_000)
+    parser.add_argument("--provider-latency-ms", type=float, default=20.0)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    provider = SlowPromptProvider(args.provider_latency_ms / 1000)
+    cached = CachingPromptProvider(provider)
+
+    start = perf_counter()
+    provider.get_prompt(prompt_name="medlabs.extract", prompt_version="production")
+    uncached_us = (perf_counter() - start) * 1e6
+
+    cached.get_prompt(prompt_name="medlabs.extract", prompt_version="production")
+    start = perf_counter()
+    for _ in range(args.iterations):
+        cached.get_prompt(prompt_name="medlabs.extract", prompt_version="production")
+    cached_us = (perf_counter() - start) / args.iterations * 1e6
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "prompt_cache",
+                "iterations": args.iterations,
+                "uncached_us_per_call": round(uncached_us, 1),
+                "cached_us_per_call": round(cached_us, 3),
+                "provider_calls": provider.calls,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import argparse
+import json
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from common import MockLLMClient, emit, environment, fixture_documents
+from medlabs_sdk.core import codec
+from medlabs_sdk.core.models import PipelineResult
+from medlabs_sdk.pipeline import MedLabsPipeline
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="PipelineResult encode/decode throughput")
+    parser.add_argument("--copies", type=int, default=200, help="fixture set repetitions")
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def _stdlib_dumps(result: PipelineResult) -> bytes:
+    return json.dumps(asdict(result), ensure_ascii=False).encode("utf-8")
+
+
+def _measure(
+    results: list[PipelineResult],
+    dumps: Callable[[PipelineResult], bytes],
+    loads: Callable[[bytes], Any],
+) -> dict[str, Any]:
+    start = perf_counter()
+    encoded = [dumps(result) for result in results]
+    encode_s = perf_counter() - start
+
+    start = perf_counter()
+    for data in encoded:
+        loads(data)
+    decode_s = perf_counter() - start
+
+    return {
+        "encode": {"ops_per_sec": round(len(results) / encode_s, 1)},
+        "decode": {"ops_per_sec": round(len(results) / decode_s, 1)},
+        "bytes_per_result": round(sum(map(len, encoded)) / len(encoded), 1),
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    pipeline = MedLabsPipeline(
+        llm_client=MockLLMClient(),
+        prompt_name="medlabs.extract",
+        prompt_version="bench",
+        log_level="WARNING",
+    )
+    results = [
+        pipeline.parse_text(text, panel=panel, document_meta={"document_id": f"bench-{index}"})
+        for index, (panel, text) in enumerate(fixture_documents())
+    ] * args.copies
+
+    formats: dict[str, dict[str, Any]] = {
+        "stdlib_asdict": _measure(results, _stdlib_dumps, json.loads),
+        codec.json_backend(): _measure(
+            results, PipelineResult.to_json_bytes, PipelineResult.from_json_bytes
+        ),
+    }
+    if codec.json_backend() == "orjson":
+        fast = codec._orjson
+        codec._orjson = None
+        try:
+            formats["json_fallback"] = _measure(
+                results, PipelineResult.to_json_bytes, PipelineResult.from_json_bytes
+            )
+        finally:
+            codec._orjson = fast
+    try:
+        formats["msgpack"] = _measure(
+            results, PipelineResult.to_msgpack, PipelineResult.from_msgpack
+        )
+    except RuntimeError:
+        pass
+
+    emit(
+        {
+            "benchmark": "serialization",
+            "results": len(results),
+            "environment": environment(),
+            "formats": formats,
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
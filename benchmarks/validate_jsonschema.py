@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from time import perf_counter
+
+from medlabs_sdk.core.validate import clear_validator_cache, validate_jsonschema, warm_validators
+from medlabs_sdk.core.validate import jsonschema as jsonschema_module
+
+FIXTURE = (
+    Path(__file__).resolve().parents[1]
+    / "standard"
+    / "examples"
+    / "v0.1"
+    / "cbc"
+    / "cbc-example-1.json"
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Per-call cost of validate_jsonschema")
+    parser.add_argument("--iterations", type=int, default=500)
+    return parser.parse_args()
+
+
+def run_uncached(payload: dict, iterations: int) -> float:
+    start = perf_counter()
+    for _ in range(iterations):
+        clear_validator_cache()
+        validate_jsonschema(payload, panel_code="CBC", mode="reference")
+    return (perf_counter() - start) / iterations
+
+
+def run_cached(payload: dict, iterations: int) -> float:
+    warm_validators()
+    start = perf_counter()
+    for _ in range(iterations):
+        validate_jsonschema(payload, panel_code="CBC", mode="reference")
+    return (perf_counter() - start) / iterations
+
+
+def run_fused(payload: dict, iterations: int) -> float:
+    start = perf_counter()
+    for _ in range(iterations):
+        validate_jsonschema(payload, panel_code="CBC")
+    return (perf_counter() - start) / iterations
+
+
+def run_invalid(payload: dict, iterations: int, *, fail_fast: bool) -> float:
+    start = perf_counter()
+    for _ in range(iterations):
+        validate_jsonschema(payload, panel_code="CBC", fail_fast=fail_fast, mode="reference")
+    return (perf_counter() - start) / iterations
+
+
+def broken(payload: dict) -> dict:
+    """The fixture, 20x longer, with one schema violation per observation."""
+
+    observations = [dict(item, status="unknown-status") for item in payload["observations"]]
+    return {**payload, "observations": observations * 20}
+
+
+def main() -> None:
+    args = parse_args()
+    payload = json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+    uncached = run_uncached(payload, args.iterations)
+    cached = run_cached(payload, args.iterations)
+
+    schema_path = jsonschema_module._schema_path_for_panel("CBC")
+    start = perf_counter()
+    for _ in range(args.iterations):
+        jsonschema_module._build_validator(schema_path)
+    build = (perf_counter() - start) / args.iterations
+
+    panel_30 = {**payload, "observations": (payload["observations"] * 30)[:30]}
+    reference_30 = run_cached(panel_30, max(1, args.iterations // 10))
+    fused_30 = run_fused(panel_30, args.iterations * 10)
+
+    invalid = broken(payload)
+    full = run_invalid(invalid, args.iterations, fail_fast=False)
+    fail_fast = run_invalid(invalid, args.iterations, fail_fast=True)
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "validate_jsonschema",
+                "iterations": args.iterations,
+                "uncached_us_per_call": round(uncached * 1e6, 1),
+                "cached_us_per_call": round(cached * 1e6, 1),
+                "validator_build_us": round(build * 1e6, 1),
+                "speedup": round(uncached / cached, 2) if cached else None,
+                "cbc_30": {
+                    "reference_us_per_call": round(reference_30 * 1e6, 1),
+                    "fused_us_per_call": round(fused_30 * 1e6, 1),
+                },
+                "invalid_us_per_call": round(full * 1e6, 1),
+                "invalid_fail_fast_us_per_call": round(fail_fast * 1e6, 1),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import re
+from pathlib import Path
+from time import perf_counter
+
+from common import emit, environment, fixture_documents
+from medlabs_sdk.core.extract import RegexExtractor
+from medlabs_sdk.core.models import RawDocument
+from medlabs_sdk.core.normalize import parse_range, parse_value
+
+# The two-regex implementation parse_float/parse_range had before parse_value.
+_LEGACY_RANGE_RE = re.compile(r"(-?\d+(?:[\.,]\d+)?)\s*[-–]\s*(-?\d+(?:[\.,]\d+)?)")
+_LEGACY_NUMBER_RE = re.compile(r"-?\d+(?:[\.,]\d+)?")
+
+
+def legacy_parse_float(value_raw: str) -> float | None:
+    value = value_raw.strip()
+    if not value or _LEGACY_RANGE_RE.search(value):
+        return None
+    match = _LEGACY_NUMBER_RE.search(value)
+    return float(match.group(0).replace(",", ".")) if match else None
+
+
+def legacy_parse_range(ref_raw: str) -> tuple[float | None, float | None]:
+    ref = ref_raw.strip()
+    if not ref:
+        return None, None
+    match = _LEGACY_RANGE_RE.search(ref)
+    if not match:
+        return None, None
+    return float(match.group(1).replace(",", ".")), float(match.group(2).replace(",", "."))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Legacy value/range parsing vs parse_value")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    extractor = RegexExtractor()
+    pairs = [
+        (field.value_raw, field.ref_raw)
+        for _, text in fixture_documents()
+        for field in extractor.extract(RawDocument(text=text)).fields
+    ]
+    pairs += [("<0.01", "<0.04"), ("1:160", ""), ("Negative", ""), ("10-20 /hpf", "")]
+
+    start = perf_counter()
+    for _ in range(args.iterations):
+        for value_raw, ref_raw in pairs:
+            legacy_parse_float(value_raw)
+            legacy_parse_range(ref_raw)
+    legacy_s = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(args.iterations):
+        for value_raw, ref_raw in pairs:
+            parse_value(value_raw)
+            parse_range(ref_raw)
+    current_s = perf_counter() - start
+
+    fields = args.iterations * len(pairs)
+    emit(
+        {
+            "benchmark": "value_parser",
+            "fields": fields,
+            "environment": environment(),
+            "legacy_ns_per_field": round(legacy_s / fields * 1e9, 1),
+            "parse_value_ns_per_field": round(current_s / fields * 1e9, 1),
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from typing import Any
 
 from medlabs_sdk.pipeline import MedLabsPipeline
@@ -64,7 +65,7 @@ def main() -> None:
         json.dumps(
             {
                 "is_valid": result.validation.is_valid,
-                "issues": [issue.__dict__ for issue in result.validation.issues],
+                "issues": [asdict(issue) for issue in result.validation.issues],
             },
             indent=2,
             ensure_ascii=False,
@@ -1,7 +1,28 @@
-from medlabs_sdk.contracts import LLMClient, PromptProvider, StructuredGenerator, Tracer
-from medlabs_sdk.core.extract import AIExtractor, Extractor, RegexExtractor
+from medlabs_sdk.bulk import BulkExtraction
+from medlabs_sdk.contracts import (
+    AsyncLLMClient,
+    AsyncPromptProvider,
+    AsyncStructuredGenerator,
+    ExtractionCache,
+    IdStrategy,
+    LLMClient,
+    PromptProvider,
+    StructuredGenerator,
+    Tracer,
+)
+from medlabs_sdk.core.extract import (
+    AIExtractor,
+    AsyncAIExtractor,
+    Extractor,
+    ExtractPolicy,
+    InMemoryExtractionCache,
+    LabTemplate,
+    RegexExtractor,
+    SqliteExtractionCache,
+    TemplateRegistry,
+)
 from medlabs_sdk.core.ingest import Ingestor, PdfIngestError, PdfIngestor, TextIngestor
-from medlabs_sdk.core.map import to_standard_panel
+from medlabs_sdk.core.map import CounterIds, DeterministicIds, RandomIds, to_standard_panel
 from medlabs_sdk.core.models import (
     ExtractedField,
     ExtractedReport,
@@ -14,32 +35,62 @@ from medlabs_sdk.core.models import (
     ValidationResult,
 )
 from medlabs_sdk.core.normalize import (
+    UnitConverter,
     canonicalize_name,
     normalize,
+    normalize_many,
     normalize_unit,
     parse_float,
     parse_range,
+    parse_value,
+    register_name_alias,
+    register_unit_alias,
+)
+from medlabs_sdk.core.validate import (
+    clear_validator_cache,
+    validate_jsonschema,
+    validate_rules,
+    warm_validators,
 )
-from medlabs_sdk.core.validate import validate_jsonschema, validate_rules
 from medlabs_sdk.logger import configure_logger, get_logger
-from medlabs_sdk.pipeline import MedLabsPipeline
+from medlabs_sdk.pipeline import BatchItem, BatchItemResult, MedLabsPipeline
 from medlabs_sdk.providers import (
+    AsyncOpenAIClient,
+    AsyncPromptedLLMClient,
+    CachingPromptProvider,
+    ClientRegistry,
     LangfuseOpenAIClient,
     LangfusePromptProvider,
     LangfuseTracer,
     NoopTracer,
     OpenAIClient,
+    PoolLimits,
     PromptedLLMClient,
+    RouteBackend,
+    RoutingGenerator,
+    SingleFlightGenerator,
+    StaticPromptProvider,
+    TokenBucket,
+    run_batch_file,
 )
 
 __all__ = [
     "AIExtractor",
+    "AsyncAIExtractor",
+    "ExtractPolicy",
     "Extractor",
+    "InMemoryExtractionCache",
+    "LabTemplate",
     "RegexExtractor",
+    "SqliteExtractionCache",
+    "TemplateRegistry",
     "Ingestor",
     "PdfIngestError",
     "PdfIngestor",
     "TextIngestor",
+    "CounterIds",
+    "DeterministicIds",
+    "RandomIds",
     "to_standard_panel",
     "ExtractedField",
     "ExtractedReport",
@@ -50,24 +101,50 @@ __all__ = [
     "StandardPanel",
     "ValidationIssue",
     "ValidationResult",
+    "UnitConverter",
     "canonicalize_name",
     "normalize",
+    "normalize_many",
     "normalize_unit",
     "parse_float",
     "parse_range",
+    "parse_value",
+    "register_name_alias",
+    "register_unit_alias",
+    "clear_validator_cache",
     "validate_jsonschema",
     "validate_rules",
+    "warm_validators",
+    "AsyncLLMClient",
+    "AsyncPromptProvider",
+    "AsyncStructuredGenerator",
+    "ExtractionCache",
+    "IdStrategy",
     "LLMClient",
     "PromptProvider",
     "StructuredGenerator",
     "Tracer",
+    "BatchItem",
+    "BatchItemResult",
+    "BulkExtraction",
     "MedLabsPipeline",
     "configure_logger",
     "get_logger",
+    "AsyncOpenAIClient",
+    "AsyncPromptedLLMClient",
+    "CachingPromptProvider",
+    "ClientRegistry",
     "LangfuseOpenAIClient",
     "LangfusePromptProvider",
     "LangfuseTracer",
     "NoopTracer",
     "OpenAIClient",
+    "PoolLimits",
     "PromptedLLMClient",
+    "RouteBackend",
+    "RoutingGenerator",
+    "SingleFlightGenerator",
+    "StaticPromptProvider",
+    "TokenBucket",
+    "run_batch_file",
 ]
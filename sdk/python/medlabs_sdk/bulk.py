@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from medlabs_sdk.core.codec import dumps_json, loads_json
+from medlabs_sdk.core.extract.ai import EXTRACTION_OUTPUT_SCHEMA, client_cache_identity
+from medlabs_sdk.core.models import PipelineResult, RawDocument
+from medlabs_sdk.core.timing import elapsed_ms
+from medlabs_sdk.pipeline import BatchItem, BatchItemResult, MedLabsPipeline, PipelineStepState
+from medlabs_sdk.providers.openai_batch import batch_request, batch_result_payload
+
+
+class BulkExtraction:
+    """Offline extraction through Batch API job files.
+
+    1. `prepare(items)` ingests the documents and writes `requests.jsonl` (one
+       chat completions request per extraction chunk) and `documents.jsonl`
+    2. the requests file is run by the provider's batch endpoint, or locally with
+       `run_batch_file`
+    3. `run(results_path)` builds the extracted reports from the results file and
+       finishes normalize/map/validate; every finished document is appended to
+       `checkpoint.jsonl`, so a restarted run skips it
+
+    A document that fails to ingest in `prepare` (e.g. an unreadable PDF) is recorded
+    without requests and yields a result with `error` set, as in `parse_many`.
+
+    `system_prompt` and `model` default to what the pipeline's LLM client reports via
+    `cache_identity` (`PromptedLLMClient` does); `model` must be explicit when the
+    client routes across backends with different models.
+    """
+
+    def __init__(
+        self,
+        pipeline: MedLabsPipeline,
+        workdir: str | Path,
+        *,
+        system_prompt: str | None = None,
+        model: str | None = None,
+    ) -> None:
+        if pipeline.extractor is None:
+            raise RuntimeError("Bulk extraction needs a pipeline with a synchronous `llm_client`")
+        self.pipeline = pipeline
+        self.extractor = pipeline.extractor
+        self.workdir = Path(workdir)
+        self.system_prompt = system_prompt
+        self.model = model
+
+    @property
+    def requests_path(self) -> Path:
+        return self.workdir / "requests.jsonl"
+
+    @property
+    def documents_path(self) -> Path:
+        return self.workdir / "documents.jsonl"
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self.workdir / "checkpoint.jsonl"
+
+    def prepare(self, items: Iterable[BatchItem]) -> int:
+        """Write the job files for `items`; returns the number of requests written.
+
+        Starts a new job: an existing checkpoint in `workdir` is removed.
+        """
+
+        system_prompt, model = self._request_identity()
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        self.checkpoint_path.unlink(missing_ok=True)
+
+        request_count = 0
+        with (
+            self.requests_path.open("w", encoding="utf-8") as requests,
+            self.documents_path.open("w", encoding="utf-8") as documents,
+        ):
+            for index, item in enumerate(items):
+                try:
+                    document = self.pipeline.ingest_item(item)
+                except Exception as exc:
+                    self.pipeline.logger.info(
+                        "pipeline.batch_item",
+                        index=index,
+                        status="error",
+                        error=str(exc),
+                    )
+                    record = {
+                        "index": index,
+                        "item": asdict(item),
+                        "requests": 0,
+                        "error": f"{type(exc).__name__}: {exc}",
+                    }
+                    documents.write(dumps_json(record).decode("utf-8") + "\n")
+                    continue
+                texts = self.extractor.request_texts(document)
+                for chunk_index, text in enumerate(texts):
+                    request = batch_request(
+                        _custom_id(index, chunk_index),
+                        model=model,
+                        system_prompt=system_prompt,
+                        input_text=text,
+                        output_schema=EXTRACTION_OUTPUT_SCHEMA,
+                        temperature=self.extractor.temperature,
+                    )
+                    requests.write(dumps_json(request).decode("utf-8") + "\n")
+                request_count += len(texts)
+                record = {
+                    "index": index,
+                    "item": asdict(item),
+                    "document": asdict(document),
+                    "requests": len(texts),
+                }
+                documents.write(dumps_json(record).decode("utf-8") + "\n")
+        return request_count
+
+    def run(self, results_path: str | Path) -> Iterator[BatchItemResult]:
+        """Finish every prepared document from a Batch API output file, in input order.
+
+        Documents already in the checkpoint are loaded from it. A document whose
+        requests are missing from the results or failed yields a result with `error`
+        set and is retried by the next run.
+        """
+
+        finished = self._load_checkpoint()
+        with (
+            _BatchResults(Path(results_path)) as results,
+            self.documents_path.open(encoding="utf-8") as documents,
+            self.checkpoint_path.open("a", encoding="utf-8") as checkpoint,
+        ):
+            for line in documents:
+                record = loads_json(line)
+                index = record["index"]
+                item = BatchItem(**record["item"])
+                if index in finished:
+                    yield BatchItemResult(index=index, item=item, result=finished[index])
+                    continue
+                if "error" in record:
+                    error = RuntimeError(f"Ingest failed in prepare: {record['error']}")
+                    yield BatchItemResult(index=index, item=item, error=error)
+                    continue
+                try:
+                    result, steps = self._finish(record, item, results)
+                except Exception as exc:
+                    self.pipeline.logger.info(
+                        "pipeline.batch_item",
+                        index=index,
+                        status="error",
+                        error=str(exc),
+                    )
+                    yield BatchItemResult(index=index, item=item, error=exc)
+                    continue
+                entry = {"index": index, "result": result.to_wire()}
+                checkpoint.write(dumps_json(entry).decode("utf-8") + "\n")
+                checkpoint.flush()
+                yield BatchItemResult(index=index, item=item, result=result, steps=steps)
+
+    def _finish(
+        self,
+        record: dict[str, Any],
+        item: BatchItem,
+        results: _BatchResults,
+    ) -> tuple[PipelineResult, list[PipelineStepState]]:
+        payloads = []
+        for chunk_index in range(record["requests"]):
+            custom_id = _custom_id(record["index"], chunk_index)
+            result = results.get(custom_id)
+            if result is None:
+                raise RuntimeError(f"Batch results have no entry for '{custom_id}'")
+            payloads.append(batch_result_payload(result))
+
+        start = perf_counter()
+        document = RawDocument(**record["document"])
+        extracted = self.extractor.report_from_payloads(document, payloads)
+        return self.pipeline.finish_extracted(
+            document,
+            extracted,
+            panel=item.panel,
+            extract_duration_ms=elapsed_ms(start),
+            source="batch",
+            requests=len(payloads),
+        )
+
+    def _request_identity(self) -> tuple[str, str]:
+        identity = client_cache_identity(
+            self.extractor.client,
+            prompt_name=self.extractor.prompt_name,
+            prompt_version=self.extractor.prompt_version,
+        )
+        system_prompt = self.system_prompt or identity.get("prompt_text")
+        # `model` in the identity keys caches and may list several routed models;
+        # `model_name`, when reported, is what the batch endpoint accepts.
+        model = self.model or identity.get("model_name", identity.get("model"))
+        if not system_prompt or not model:
+            raise RuntimeError(
+                "Cannot resolve the system prompt and a single model for batch requests "
+                "(a RoutingGenerator over different models has none); "
+                "pass `system_prompt` and `model` explicitly"
+            )
+        return system_prompt, model
+
+    def _load_checkpoint(self) -> dict[int, PipelineResult]:
+        finished: dict[int, PipelineResult] = {}
+        if not self.checkpoint_path.exists():
+            return finished
+        with self.checkpoint_path.open("r+b") as checkpoint:
+            offset = 0
+            for line in checkpoint:
+                if not line.endswith(b"\n"):
+                    # A run interrupted mid-write leaves a partial last line; drop it so
+                    # the next append starts on a fresh line.
+                    checkpoint.truncate(offset)
+                    break
+                offset += len(line)
+                entry = loads_json(line)
+                finished[entry["index"]] = PipelineResult.from_wire(entry["result"])
+        return finished
+
+
+def _custom_id(index: int, chunk_index: int) -> str:
+    return f"doc-{index}-{chunk_index}"
+
+
+class _BatchResults:
+    """Batch API output file indexed by `custom_id`; records are read back on demand.
+
+    Only byte offsets stay in memory, so large result files are never loaded whole.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._file = path.open("rb")
+        self._offsets: dict[str, int] = {}
+        offset = 0
+        for line in self._file:
+            if line.strip():
+                self._offsets[loads_json(line)["custom_id"]] = offset
+            offset += len(line)
+
+    def get(self, custom_id: str) -> dict[str, Any] | None:
+        offset = self._offsets.get(custom_id)
+        if offset is None:
+            return None
+        self._file.seek(offset)
+        return loads_json(self._file.readline())
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> _BatchResults:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
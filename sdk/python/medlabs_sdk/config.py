@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 from pydantic import Field
 from pydantic_settings import (
@@ -61,6 +62,40 @@ class MedLabsSettings(BaseSettings):
         alias="MEDLABS_PROMPT_FALLBACK",
     )
     fail_on_prompt_error: bool = Field(default=False, alias="MEDLABS_FAIL_ON_PROMPT_ERROR")
+    prompt_cache_ttl_seconds: float = Field(default=300.0, alias="MEDLABS_PROMPT_CACHE_TTL_SECONDS")
+    prompt_cache_stale_ttl_seconds: float = Field(
+        default=3600.0,
+        alias="MEDLABS_PROMPT_CACHE_STALE_TTL_SECONDS",
+    )
+
+    llm_single_flight: bool = Field(default=False, alias="MEDLABS_LLM_SINGLE_FLIGHT")
+    llm_max_concurrency: int = Field(default=8, alias="MEDLABS_LLM_MAX_CONCURRENCY")
+    llm_rate_limit_rps: float | None = Field(default=None, alias="MEDLABS_LLM_RATE_LIMIT_RPS")
+
+    llm_backends: list[dict[str, Any]] = Field(default_factory=list, alias="MEDLABS_LLM_BACKENDS")
+    llm_circuit_failure_threshold: int = Field(
+        default=5,
+        alias="MEDLABS_LLM_CIRCUIT_FAILURE_THRESHOLD",
+    )
+    llm_circuit_cooldown_seconds: float = Field(
+        default=30.0,
+        alias="MEDLABS_LLM_CIRCUIT_COOLDOWN_SECONDS",
+    )
+
+    llm_timeout_seconds: float | None = Field(default=None, alias="MEDLABS_LLM_TIMEOUT_SECONDS")
+    llm_max_attempts: int = Field(default=1, alias="MEDLABS_LLM_MAX_ATTEMPTS")
+    llm_hedge: bool = Field(default=False, alias="MEDLABS_LLM_HEDGE")
+    llm_call_workers: int = Field(default=32, alias="MEDLABS_LLM_CALL_WORKERS")
+
+    http_max_connections: int = Field(default=100, alias="MEDLABS_HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(
+        default=20,
+        alias="MEDLABS_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+    )
+    http_keepalive_expiry_seconds: float = Field(
+        default=60.0,
+        alias="MEDLABS_HTTP_KEEPALIVE_EXPIRY_SECONDS",
+    )
 
     enable_tracing: bool = Field(default=True, alias="MEDLABS_ENABLE_TRACING")
     log_level: str = Field(default="INFO", alias="MEDLABS_LOG_LEVEL")
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from contextlib import AbstractContextManager
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from medlabs_sdk.core.models import RawDocument
 
 
 class LLMClient(Protocol):
+    # `system_prompt` is the already resolved text of the prompt; extractors only pass
+    # it to clients whose `cache_identity` reports that text as `prompt_text`.
     def extract_structured(
         self,
         *,
@@ -13,6 +18,7 @@ class LLMClient(Protocol):
         input_text: str,
         output_schema: dict[str, Any],
         temperature: float = 0.0,
+        system_prompt: str | None = None,
     ) -> dict[str, Any]:
         ...
 
@@ -34,6 +40,53 @@ class StructuredGenerator(Protocol):
         ...
 
 
+class AsyncLLMClient(Protocol):
+    async def extract_structured(
+        self,
+        *,
+        prompt_name: str,
+        prompt_version: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+        system_prompt: str | None = None,
+    ) -> dict[str, Any]:
+        ...
+
+
+class AsyncPromptProvider(Protocol):
+    async def get_prompt(self, *, prompt_name: str, prompt_version: str) -> str:
+        ...
+
+
+class AsyncStructuredGenerator(Protocol):
+    async def generate_structured(
+        self,
+        *,
+        system_prompt: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+    ) -> dict[str, Any]:
+        ...
+
+
+class ExtractionCache(Protocol):
+    def get(self, key: str) -> dict[str, Any] | None:
+        ...
+
+    def set(self, key: str, payload: dict[str, Any]) -> None:
+        ...
+
+
 class Tracer(Protocol):
     def span(self, name: str, **attrs: Any) -> AbstractContextManager[None]:
         ...
+
+
+class IdStrategy(Protocol):
+    def panel_id(self, *, panel_code: str, document: RawDocument) -> str:
+        ...
+
+    def observation_id(self, *, panel_code: str, document: RawDocument, index: int) -> str:
+        ...
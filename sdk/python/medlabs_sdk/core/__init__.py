@@ -6,6 +6,7 @@ from medlabs_sdk.core.models import (
     PipelineResult,
     RawDocument,
     StandardPanel,
+    TextPages,
     ValidationIssue,
     ValidationResult,
 )
@@ -18,6 +19,7 @@ __all__ = [
     "PipelineResult",
     "RawDocument",
     "StandardPanel",
+    "TextPages",
     "ValidationIssue",
     "ValidationResult",
 ]
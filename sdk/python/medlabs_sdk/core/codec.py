@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from dataclasses import fields, is_dataclass
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional speedup
+    _orjson = None
+
+
+def json_backend() -> str:
+    return "orjson" if _orjson is not None else "json"
+
+
+def dumps_json(payload: Any) -> bytes:
+    """Compact UTF-8 JSON; dataclasses are written as objects of their fields."""
+
+    if _orjson is not None:
+        return _orjson.dumps(payload, default=_encode_default)
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=_encode_default,
+    ).encode("utf-8")
+
+
+def loads_json(data: bytes | str) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_msgpack(payload: Any) -> bytes:
+    """MessagePack counterpart of `dumps_json` for internal queues."""
+
+    return _msgpack().packb(payload, use_bin_type=True, default=_encode_default)
+
+
+def loads_msgpack(data: bytes) -> Any:
+    return _msgpack().unpackb(data, raw=False)
+
+
+def _encode_default(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        # Shallow on purpose: the encoder recurses into nested dataclasses itself.
+        return {item.name: getattr(value, item.name) for item in fields(value)}
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        # Sequence views such as `TextPages` are written as plain lists.
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def _msgpack() -> Any:
+    try:
+        import msgpack
+    except ImportError as exc:  # pragma: no cover - dependency error path
+        raise RuntimeError("Install 'msgpack' to use MessagePack serialization") from exc
+    return msgpack
@@ -1,5 +1,31 @@
-from medlabs_sdk.core.extract.ai import AIExtractor
+from medlabs_sdk.core.extract.ai import AIExtractor, AsyncAIExtractor, client_cache_identity
 from medlabs_sdk.core.extract.base import Extractor
+from medlabs_sdk.core.extract.cache import (
+    InMemoryExtractionCache,
+    SqliteExtractionCache,
+    extraction_cache_key,
+)
 from medlabs_sdk.core.extract.regex import RegexExtractor
+from medlabs_sdk.core.extract.resilience import (
+    ExtractPolicy,
+    ResilientCaller,
+    is_retryable_error,
+)
+from medlabs_sdk.core.extract.templates import LabTemplate, TemplateMatch, TemplateRegistry
 
-__all__ = ["AIExtractor", "Extractor", "RegexExtractor"]
+__all__ = [
+    "AIExtractor",
+    "AsyncAIExtractor",
+    "ExtractPolicy",
+    "Extractor",
+    "InMemoryExtractionCache",
+    "LabTemplate",
+    "RegexExtractor",
+    "ResilientCaller",
+    "SqliteExtractionCache",
+    "TemplateMatch",
+    "TemplateRegistry",
+    "client_cache_identity",
+    "extraction_cache_key",
+    "is_retryable_error",
+]
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from medlabs_sdk.contracts import LLMClient
+from medlabs_sdk.contracts import AsyncLLMClient, ExtractionCache, LLMClient
 from medlabs_sdk.core.extract.base import Extractor
-from medlabs_sdk.core.models import ExtractedField, ExtractedReport, RawDocument
+from medlabs_sdk.core.extract.cache import extraction_cache_key
+from medlabs_sdk.core.extract.chunking import DocumentChunk, merge_chunk_reports, split_document
+from medlabs_sdk.core.extract.resilience import ExtractPolicy, ResilientCaller
+from medlabs_sdk.core.models import EMPTY_EVIDENCE, ExtractedField, ExtractedReport, RawDocument
 
 EXTRACTION_OUTPUT_SCHEMA: dict[str, Any] = {
     "type": "object",
@@ -46,7 +52,131 @@ def _float_0_1(value: Any) -> float:
     return max(0.0, min(number, 1.0))
 
 
-class AIExtractor(Extractor):
+class _RequestStats:
+    """Cache hits/misses and LLM attempt records of one extraction request."""
+
+    __slots__ = ("attempts", "hits", "misses")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.attempts: list[dict[str, Any]] = []
+
+    def as_dict(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    @classmethod
+    def combined(cls, parts: list[_RequestStats]) -> _RequestStats:
+        total = cls()
+        total.hits = sum(part.hits for part in parts)
+        total.misses = sum(part.misses for part in parts)
+        for index, part in enumerate(parts):
+            total.attempts.extend({"chunk": index, **attempt} for attempt in part.attempts)
+        return total
+
+
+class _ChunkedExtractionMixin:
+    prompt_name: str
+    prompt_version: str
+    cache: ExtractionCache | None
+    chunk_pages: int | None
+    max_chunk_chars: int | None
+
+    def planned_calls(self, document: RawDocument) -> int:
+        """Number of LLM requests `extract` would issue for this document."""
+
+        return max(1, len(self._chunks(document)))
+
+    def request_texts(self, document: RawDocument) -> list[str]:
+        """Input texts of the LLM requests `extract` would issue, in chunk order."""
+
+        chunks = self._chunks(document)
+        return [chunk.text for chunk in chunks] if len(chunks) > 1 else [document.text]
+
+    def report_from_payloads(
+        self,
+        document: RawDocument,
+        payloads: list[dict[str, Any]],
+    ) -> ExtractedReport:
+        """Build the report `extract` returns from payloads fetched elsewhere (batch jobs)."""
+
+        chunks = self._chunks(document)
+        if len(payloads) != max(1, len(chunks)):
+            raise ValueError(
+                f"Expected {max(1, len(chunks))} payloads for the document, got {len(payloads)}"
+            )
+        if len(chunks) <= 1:
+            return _report_from_payload(
+                document,
+                payloads[0],
+                prompt_name=self.prompt_name,
+                prompt_version=self.prompt_version,
+            )
+        report = self._merged_report(document, chunks, payloads, chunk_stats=[])
+        report.meta.pop("extraction_cache", None)
+        return report
+
+    def _chunks(self, document: RawDocument) -> list[DocumentChunk]:
+        return split_document(
+            document,
+            chunk_pages=self.chunk_pages,
+            max_chunk_chars=self.max_chunk_chars,
+        )
+
+    def _single_report(
+        self,
+        document: RawDocument,
+        payload: dict[str, Any],
+        *,
+        stats: _RequestStats,
+    ) -> ExtractedReport:
+        report = _report_from_payload(
+            document,
+            payload,
+            prompt_name=self.prompt_name,
+            prompt_version=self.prompt_version,
+        )
+        if self.cache is not None:
+            report.meta["extraction_cache"] = stats.as_dict()
+        if stats.attempts:
+            report.meta["llm_attempts"] = stats.attempts
+        return report
+
+    def _merged_report(
+        self,
+        document: RawDocument,
+        chunks: list[DocumentChunk],
+        payloads: list[dict[str, Any]],
+        *,
+        chunk_stats: list[_RequestStats],
+    ) -> ExtractedReport:
+        report = merge_chunk_reports(
+            document,
+            chunks,
+            [
+                _report_from_payload(
+                    document,
+                    payload,
+                    prompt_name=self.prompt_name,
+                    prompt_version=self.prompt_version,
+                )
+                for payload in payloads
+            ],
+        )
+        report.meta = {
+            "prompt_name": self.prompt_name,
+            "prompt_version": self.prompt_version,
+            "chunk_count": len(chunks),
+        }
+        combined = _RequestStats.combined(chunk_stats)
+        if self.cache is not None:
+            report.meta["extraction_cache"] = combined.as_dict()
+        if combined.attempts:
+            report.meta["llm_attempts"] = combined.attempts
+        return report
+
+
+class AIExtractor(_ChunkedExtractionMixin, Extractor):
     def __init__(
         self,
         client: LLMClient,
@@ -54,61 +184,289 @@ class AIExtractor(Extractor):
         prompt_name: str,
         prompt_version: str,
         temperature: float = 0.0,
+        cache: ExtractionCache | None = None,
+        chunk_pages: int | None = None,
+        max_chunk_chars: int | None = None,
+        max_concurrency: int = 4,
+        policy: ExtractPolicy | None = None,
     ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
         self.client = client
         self.prompt_name = prompt_name
         self.prompt_version = prompt_version
         self.temperature = temperature
+        self.cache = cache
+        self.chunk_pages = chunk_pages
+        self.max_chunk_chars = max_chunk_chars
+        self.max_concurrency = max_concurrency
+        self.caller = ResilientCaller(policy) if policy is not None else None
 
     def extract(self, document: RawDocument) -> ExtractedReport:
-        payload = self.client.extract_structured(
+        chunks = self._chunks(document)
+        identity = self._cache_identity()
+        if len(chunks) <= 1:
+            stats = _RequestStats()
+            payload = self._request_payload(document.text, identity, stats=stats)
+            return self._single_report(document, payload, stats=stats)
+
+        chunk_stats = [_RequestStats() for _ in chunks]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(chunks)),
+            thread_name_prefix="medlabs-extract",
+        ) as executor:
+            payloads = list(
+                executor.map(
+                    lambda chunk, stats: self._request_payload(chunk.text, identity, stats=stats),
+                    chunks,
+                    chunk_stats,
+                )
+            )
+        return self._merged_report(document, chunks, payloads, chunk_stats=chunk_stats)
+
+    def _cache_identity(self) -> dict[str, str] | None:
+        if self.cache is None:
+            return None
+        return client_cache_identity(
+            self.client,
             prompt_name=self.prompt_name,
             prompt_version=self.prompt_version,
-            input_text=document.text,
-            output_schema=EXTRACTION_OUTPUT_SCHEMA,
-            temperature=self.temperature,
         )
 
-        warnings: list[str] = []
-        raw_fields = payload.get("fields", [])
-        if not isinstance(raw_fields, list):
-            warnings.append("Extractor output has invalid fields format")
-            raw_fields = []
-
-        fields: list[ExtractedField] = []
-        for index, item in enumerate(raw_fields):
-            if not isinstance(item, dict):
-                warnings.append(f"fields[{index}] is not an object")
-                continue
-
-            name_raw = _string(item.get("name_raw"))
-            value_raw = _string(item.get("value_raw"))
-            if not name_raw or not value_raw:
-                warnings.append(f"fields[{index}] is missing name_raw or value_raw")
-                continue
-
-            evidence = item.get("evidence", {})
-            if not isinstance(evidence, dict):
-                evidence = {}
-
-            fields.append(
-                ExtractedField(
-                    name_raw=name_raw,
-                    value_raw=value_raw,
-                    unit_raw=_string(item.get("unit_raw")),
-                    ref_raw=_string(item.get("ref_raw")),
-                    flags_raw=_string(item.get("flags_raw")),
-                    evidence=evidence,
-                    confidence=_float_0_1(item.get("confidence")),
-                )
+    def _request_payload(
+        self,
+        input_text: str,
+        identity: dict[str, str] | None,
+        *,
+        stats: _RequestStats,
+    ) -> dict[str, Any]:
+        cache_key: str | None = None
+        if self.cache is not None and identity is not None:
+            cache_key = _request_cache_key(
+                input_text,
+                prompt_name=self.prompt_name,
+                prompt_version=self.prompt_version,
+                identity=identity,
             )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                stats.hits += 1
+                return cached
+            stats.misses += 1
 
-        return ExtractedReport(
-            document=document,
-            fields=fields,
-            warnings=warnings,
-            meta={
-                "prompt_name": self.prompt_name,
-                "prompt_version": self.prompt_version,
-            },
+        def request() -> dict[str, Any]:
+            return self.client.extract_structured(
+                prompt_name=self.prompt_name,
+                prompt_version=self.prompt_version,
+                input_text=input_text,
+                output_schema=EXTRACTION_OUTPUT_SCHEMA,
+                temperature=self.temperature,
+                **_resolved_prompt(identity),
+            )
+
+        if self.caller is None:
+            payload = request()
+        else:
+            payload, attempts = self.caller.call(request)
+            stats.attempts.extend(attempts)
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, payload)
+        return payload
+
+
+class AsyncAIExtractor(_ChunkedExtractionMixin):
+    """Asyncio counterpart of `AIExtractor` for `AsyncLLMClient` implementations."""
+
+    def __init__(
+        self,
+        client: AsyncLLMClient,
+        *,
+        prompt_name: str,
+        prompt_version: str,
+        temperature: float = 0.0,
+        cache: ExtractionCache | None = None,
+        chunk_pages: int | None = None,
+        max_chunk_chars: int | None = None,
+        max_concurrency: int = 4,
+        policy: ExtractPolicy | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self.client = client
+        self.prompt_name = prompt_name
+        self.prompt_version = prompt_version
+        self.temperature = temperature
+        self.cache = cache
+        self.chunk_pages = chunk_pages
+        self.max_chunk_chars = max_chunk_chars
+        self.max_concurrency = max_concurrency
+        self.caller = ResilientCaller(policy) if policy is not None else None
+
+    async def extract(self, document: RawDocument) -> ExtractedReport:
+        chunks = self._chunks(document)
+        identity = await self._cache_identity()
+        if len(chunks) <= 1:
+            stats = _RequestStats()
+            payload = await self._request_payload(document.text, identity, stats=stats)
+            return self._single_report(document, payload, stats=stats)
+
+        chunk_stats = [_RequestStats() for _ in chunks]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def request_chunk(chunk: DocumentChunk, stats: _RequestStats) -> Any:
+            async with semaphore:
+                return await self._request_payload(chunk.text, identity, stats=stats)
+
+        payloads = await asyncio.gather(
+            *(request_chunk(chunk, stats) for chunk, stats in zip(chunks, chunk_stats, strict=True))
+        )
+        return self._merged_report(document, chunks, list(payloads), chunk_stats=chunk_stats)
+
+    async def _cache_identity(self) -> dict[str, str] | None:
+        if self.cache is None:
+            return None
+        async_identity = getattr(self.client, "acache_identity", None)
+        if async_identity is not None:
+            return await async_identity(
+                prompt_name=self.prompt_name,
+                prompt_version=self.prompt_version,
+            )
+        return client_cache_identity(
+            self.client,
+            prompt_name=self.prompt_name,
+            prompt_version=self.prompt_version,
+        )
+
+    async def _request_payload(
+        self,
+        input_text: str,
+        identity: dict[str, str] | None,
+        *,
+        stats: _RequestStats,
+    ) -> dict[str, Any]:
+        cache_key: str | None = None
+        if self.cache is not None and identity is not None:
+            cache_key = _request_cache_key(
+                input_text,
+                prompt_name=self.prompt_name,
+                prompt_version=self.prompt_version,
+                identity=identity,
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                stats.hits += 1
+                return cached
+            stats.misses += 1
+
+        def request() -> Awaitable[dict[str, Any]]:
+            return self.client.extract_structured(
+                prompt_name=self.prompt_name,
+                prompt_version=self.prompt_version,
+                input_text=input_text,
+                output_schema=EXTRACTION_OUTPUT_SCHEMA,
+                temperature=self.temperature,
+                **_resolved_prompt(identity),
+            )
+
+        if self.caller is None:
+            payload = await request()
+        else:
+            payload, attempts = await self.caller.acall(request)
+            stats.attempts.extend(attempts)
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, payload)
+        return payload
+
+
+def client_cache_identity(
+    client: Any,
+    *,
+    prompt_name: str,
+    prompt_version: str,
+) -> dict[str, str]:
+    """Resolved prompt text and model of a client, if it can report them.
+
+    Clients without `cache_identity` are keyed on prompt name/version only. Clients
+    that report `prompt_text` get it back as the `system_prompt` argument of
+    `LLMClient.extract_structured`, so a request does not resolve the prompt twice.
+    """
+
+    cache_identity = getattr(client, "cache_identity", None)
+    if cache_identity is None:
+        return {}
+    return cache_identity(prompt_name=prompt_name, prompt_version=prompt_version)
+
+
+def _resolved_prompt(identity: dict[str, str] | None) -> dict[str, str]:
+    if identity is None or "prompt_text" not in identity:
+        return {}
+    return {"system_prompt": identity["prompt_text"]}
+
+
+def _request_cache_key(
+    input_text: str,
+    *,
+    prompt_name: str,
+    prompt_version: str,
+    identity: dict[str, str],
+) -> str:
+    return extraction_cache_key(
+        input_text=input_text,
+        prompt_name=prompt_name,
+        prompt_version=prompt_version,
+        prompt_text=identity.get("prompt_text", ""),
+        model=identity.get("model", ""),
+        output_schema=EXTRACTION_OUTPUT_SCHEMA,
+    )
+
+
+def _report_from_payload(
+    document: RawDocument,
+    payload: dict[str, Any],
+    *,
+    prompt_name: str,
+    prompt_version: str,
+) -> ExtractedReport:
+    warnings: list[str] = []
+    raw_fields = payload.get("fields", [])
+    if not isinstance(raw_fields, list):
+        warnings.append("Extractor output has invalid fields format")
+        raw_fields = []
+
+    fields: list[ExtractedField] = []
+    for index, item in enumerate(raw_fields):
+        if not isinstance(item, dict):
+            warnings.append(f"fields[{index}] is not an object")
+            continue
+
+        name_raw = _string(item.get("name_raw"))
+        value_raw = _string(item.get("value_raw"))
+        if not name_raw or not value_raw:
+            warnings.append(f"fields[{index}] is missing name_raw or value_raw")
+            continue
+
+        evidence = item.get("evidence")
+        if not isinstance(evidence, dict) or not evidence:
+            evidence = EMPTY_EVIDENCE
+
+        fields.append(
+            ExtractedField(
+                name_raw=name_raw,
+                value_raw=value_raw,
+                unit_raw=_string(item.get("unit_raw")),
+                ref_raw=_string(item.get("ref_raw")),
+                flags_raw=_string(item.get("flags_raw")),
+                evidence=evidence,
+                confidence=_float_0_1(item.get("confidence")),
+            )
         )
+
+    return ExtractedReport(
+        document=document,
+        fields=fields,
+        warnings=warnings,
+        meta={
+            "prompt_name": prompt_name,
+            "prompt_version": prompt_version,
+        },
+    )
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from time import time
+from typing import Any
+
+
+def extraction_cache_key(
+    *,
+    input_text: str,
+    prompt_name: str,
+    prompt_version: str,
+    prompt_text: str,
+    model: str,
+    output_schema: dict[str, Any],
+) -> str:
+    """Content address of one extraction request.
+
+    Any change to the document, the prompt (name, version or resolved text), the model
+    or the output schema produces a different key.
+    """
+
+    material = json.dumps(
+        [input_text, prompt_name, prompt_version, prompt_text, model, output_schema],
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class InMemoryExtractionCache:
+    """Process-local LRU cache of extraction payloads with optional TTL."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry[0]):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            serialized = entry[1]
+        # Payloads are stored serialized so callers never share mutable state.
+        return json.loads(serialized)
+
+    def set(self, key: str, payload: dict[str, Any]) -> None:
+        serialized = json.dumps(payload, ensure_ascii=False)
+        with self._lock:
+            self._entries[key] = (self._clock(), serialized)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and self._clock() - created_at > self.ttl_seconds
+
+
+class SqliteExtractionCache:
+    """Persistent extraction cache in a single SQLite file.
+
+    Entries older than `ttl_seconds` are ignored and purged at most once per TTL
+    period; when the table grows past `max_entries` the least recently used entries
+    are evicted. Both run on indexed columns, and a plain `set` never scans the table.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int = 100_000,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._purged_at = clock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS extraction_cache ("
+                "key TEXT PRIMARY KEY, "
+                "payload TEXT NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS extraction_cache_accessed_at "
+                "ON extraction_cache (accessed_at)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS extraction_cache_created_at "
+                "ON extraction_cache (created_at)"
+            )
+        self._rows = self._count()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        now = self._clock()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload, created_at FROM extraction_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and self._is_expired(row[1], now):
+                with self._connection:
+                    self._rows -= self._connection.execute(
+                        "DELETE FROM extraction_cache WHERE key = ?",
+                        (key,),
+                    ).rowcount
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE extraction_cache SET accessed_at = ? WHERE key = ?",
+                    (now, key),
+                )
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, payload: dict[str, Any]) -> None:
+        now = self._clock()
+        serialized = json.dumps(payload, ensure_ascii=False)
+        with self._lock, self._connection:
+            inserted = self._connection.execute(
+                "INSERT OR IGNORE INTO extraction_cache (key, payload, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, serialized, now, now),
+            ).rowcount
+            if not inserted:
+                self._connection.execute(
+                    "UPDATE extraction_cache SET payload = ?, created_at = ?, accessed_at = ? "
+                    "WHERE key = ?",
+                    (serialized, now, now, key),
+                )
+            self._rows += inserted
+            if self.ttl_seconds is not None and now - self._purged_at >= self.ttl_seconds:
+                # Expired rows are already skipped by `get`; purging only reclaims space.
+                self._purged_at = now
+                self._rows -= self._connection.execute(
+                    "DELETE FROM extraction_cache WHERE created_at < ?",
+                    (now - self.ttl_seconds,),
+                ).rowcount
+            if self._rows > self.max_entries:
+                # Other processes may share the file: recount before evicting.
+                self._rows = self._count_locked()
+                excess = self._rows - self.max_entries
+                if excess > 0:
+                    self._rows -= self._connection.execute(
+                        "DELETE FROM extraction_cache WHERE key IN ("
+                        "SELECT key FROM extraction_cache ORDER BY accessed_at LIMIT ?)",
+                        (excess,),
+                    ).rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM extraction_cache")
+            self._rows = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        return self._count()
+
+    def _count(self) -> int:
+        with self._lock:
+            return self._count_locked()
+
+    def _count_locked(self) -> int:
+        row = self._connection.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()
+        return int(row[0])
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from medlabs_sdk.core.models import Evidence, ExtractedField, ExtractedReport, RawDocument
+
+
+@dataclass(frozen=True)
+class DocumentChunk:
+    text: str
+    first_page: int | None = None
+    page_count: int = 0
+
+
+def split_document(
+    document: RawDocument,
+    *,
+    chunk_pages: int | None = None,
+    max_chunk_chars: int | None = None,
+) -> list[DocumentChunk]:
+    """Split a document into extraction chunks.
+
+    Documents with pages are split into groups of `chunk_pages` pages (1-based page
+    numbers are kept on each chunk). Documents without pages fall back to line-aligned
+    windows of at most `max_chunk_chars` characters, a cheap stand-in for a token
+    budget. Without either limit the whole document is a single chunk.
+    """
+
+    if chunk_pages is not None and chunk_pages < 1:
+        raise ValueError("chunk_pages must be >= 1")
+    if max_chunk_chars is not None and max_chunk_chars < 1:
+        raise ValueError("max_chunk_chars must be >= 1")
+
+    if chunk_pages and len(document.pages) > chunk_pages:
+        chunks: list[DocumentChunk] = []
+        for start in range(0, len(document.pages), chunk_pages):
+            group = document.pages[start : start + chunk_pages]
+            text = "\n\n".join(filter(None, group))
+            if text:
+                chunks.append(DocumentChunk(text=text, first_page=start + 1, page_count=len(group)))
+        return chunks
+
+    if max_chunk_chars and len(document.text) > max_chunk_chars:
+        windows = _text_windows(document.text, max_chunk_chars)
+        return [DocumentChunk(text=window) for window in windows]
+
+    return [DocumentChunk(text=document.text)]
+
+
+def merge_chunk_reports(
+    document: RawDocument,
+    chunks: list[DocumentChunk],
+    reports: list[ExtractedReport],
+) -> ExtractedReport:
+    """Merge per-chunk reports into one, in chunk order.
+
+    Evidence pages reported relative to a chunk are rewritten to document pages, and
+    warnings are prefixed with the chunk they came from. Chunks do not overlap, so only
+    fields repeated within one chunk on the same page (same name, value and unit) are
+    kept once; the same result on different pages or chunks is a separate row.
+    """
+
+    fields: list[ExtractedField] = []
+    warnings: list[str] = []
+    seen: set[tuple[int, object, str, str, str]] = set()
+    for chunk_index, (chunk, report) in enumerate(zip(chunks, reports, strict=True), start=1):
+        warnings.extend(f"chunk {chunk_index}: {warning}" for warning in report.warnings)
+        for extracted_field in report.fields:
+            evidence = _document_evidence(extracted_field.evidence, chunk)
+            key = (
+                chunk_index,
+                evidence.get("page"),
+                extracted_field.name_raw.casefold(),
+                extracted_field.value_raw,
+                extracted_field.unit_raw,
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+            extracted_field.evidence = evidence
+            fields.append(extracted_field)
+
+    return ExtractedReport(document=document, fields=fields, warnings=warnings)
+
+
+def _document_evidence(evidence: Evidence, chunk: DocumentChunk) -> Evidence:
+    if chunk.first_page is None:
+        return evidence
+
+    page = evidence.get("page")
+    if isinstance(page, int) and 1 <= page <= chunk.page_count:
+        page = chunk.first_page + page - 1
+    elif chunk.page_count == 1:
+        page = chunk.first_page
+    else:
+        return evidence
+    return {**evidence, "page": page}
+
+
+def _text_windows(text: str, max_chars: int) -> list[str]:
+    windows: list[str] = []
+    current: list[str] = []
+    current_size = 0
+    for line in text.splitlines(keepends=True):
+        while len(line) > max_chars:
+            if current:
+                windows.append("".join(current))
+                current, current_size = [], 0
+            windows.append(line[:max_chars])
+            line = line[max_chars:]
+        if current_size + len(line) > max_chars and current:
+            windows.append("".join(current))
+            current, current_size = [], 0
+        current.append(line)
+        current_size += len(line)
+    if current:
+        windows.append("".join(current))
+    return [window for window in windows if window.strip()]
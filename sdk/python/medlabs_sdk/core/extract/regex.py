@@ -1,34 +1,32 @@
 from __future__ import annotations
 
-import re
-
 from medlabs_sdk.core.extract.base import Extractor
+from medlabs_sdk.core.extract.templates import DEFAULT_REGISTRY, TemplateRegistry
 from medlabs_sdk.core.models import ExtractedField, ExtractedReport, RawDocument
 
-_LINE_RE = re.compile(
-    r"^\s*(?P<name>[A-Za-z][A-Za-z0-9_\-/ ]{1,60})[:\s]+"
-    r"(?P<value>-?[0-9]+(?:[\.,][0-9]+)?|[A-Za-z]+)"
-    r"(?:\s+(?P<unit>[%A-Za-z0-9\*\^/]+))?"
-    r"(?:\s*\((?P<ref>[^)]{1,40})\))?\s*$"
-)
-
 
 class RegexExtractor(Extractor):
+    def __init__(self, registry: TemplateRegistry | None = None) -> None:
+        self.registry = registry or DEFAULT_REGISTRY
+
     def extract(self, document: RawDocument) -> ExtractedReport:
+        lab = self.registry.detect(_first_page(document))
         fields: list[ExtractedField] = []
+        template_counts: dict[str, int] = {}
         for line in document.text.splitlines():
-            match = _LINE_RE.match(line)
-            if not match:
+            match = self.registry.match_line(line, lab=lab)
+            if match is None:
                 continue
-            groups = match.groupdict()
+            template = match.template
+            template_counts[template.name] = template_counts.get(template.name, 0) + 1
             fields.append(
                 ExtractedField(
-                    name_raw=(groups.get("name") or "").strip(),
-                    value_raw=(groups.get("value") or "").strip(),
-                    unit_raw=(groups.get("unit") or "").strip(),
-                    ref_raw=(groups.get("ref") or "").strip(),
+                    name_raw=match.name,
+                    value_raw=match.value,
+                    unit_raw=match.unit,
+                    ref_raw=match.ref,
                     evidence={"raw_text": line.strip()},
-                    confidence=0.3,
+                    confidence=template.confidence,
                 )
             )
 
@@ -36,4 +34,18 @@ class RegexExtractor(Extractor):
         if not fields:
             warnings.append("Regex extractor could not parse any fields")
 
-        return ExtractedReport(document=document, fields=fields, warnings=warnings)
+        return ExtractedReport(
+            document=document,
+            fields=fields,
+            warnings=warnings,
+            meta={
+                "lab_template": lab.name if lab is not None else None,
+                "template_matches": template_counts,
+            },
+        )
+
+
+def _first_page(document: RawDocument) -> str:
+    if document.pages:
+        return document.pages[0]
+    return document.text.split("\f", 1)[0]
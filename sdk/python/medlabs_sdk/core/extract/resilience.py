@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, TypeVar
+
+from medlabs_sdk.core.timing import elapsed_ms
+
+T = TypeVar("T")
+
+# How often a call still queued for a pool worker is checked for having started.
+_QUEUE_POLL_S = 0.005
+
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+_RETRYABLE_ERROR_NAMES = frozenset(
+    {"APIConnectionError", "APITimeoutError", "InternalServerError", "RateLimitError"}
+)
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Timeouts, connection errors and throttling/5xx responses of OpenAI-style SDKs."""
+
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    if type(exc).__name__ in _RETRYABLE_ERROR_NAMES:
+        return True
+    return getattr(exc, "status_code", None) in _RETRYABLE_STATUS_CODES
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractPolicy:
+    """Deadline, retry and hedging settings for LLM extraction calls.
+
+    - `timeout_s` bounds one attempt (both hedged calls included) from the moment the
+      call starts running; a late call is abandoned and counts as a retryable
+      `TimeoutError`
+    - sync calls with a deadline or hedging run on a pool of `max_workers` threads;
+      abandoned calls keep their worker until the SDK gives up, so size it above the
+      expected concurrency. A hedge is only sent while a worker is free
+    - failed attempts are retried up to `max_attempts` with exponential backoff
+      (`backoff_base_s` doubling up to `backoff_max_s`) and full jitter
+    - with `hedge=True` a second identical call is sent when the first has not
+      answered after the `hedge_quantile` of recent call latencies
+      (`hedge_initial_delay_s` until `hedge_min_samples` calls were observed);
+      the first answer wins
+    """
+
+    timeout_s: float | None = None
+    max_attempts: int = 3
+    backoff_base_s: float = 0.5
+    backoff_max_s: float = 8.0
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_initial_delay_s: float = 1.0
+    hedge_min_delay_s: float = 0.01
+    max_workers: int = 32
+    retry_on: Callable[[BaseException], bool] = is_retryable_error
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        if self.timeout_s is not None and self.timeout_s <= 0:
+            raise ValueError("timeout_s must be > 0")
+        if not 0 < self.hedge_quantile < 1:
+            raise ValueError("hedge_quantile must be between 0 and 1")
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+
+class ResilientCaller:
+    """Runs calls under an `ExtractPolicy` and reports every attempt.
+
+    Each call returns its result together with attempt records
+    (`attempt`, `hedge`, `status`, `duration_ms` and `error` for failures).
+    """
+
+    def __init__(
+        self,
+        policy: ExtractPolicy,
+        *,
+        max_workers: int | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        random_fraction: Callable[[], float] = random.random,
+        latency_window: int = 200,
+    ) -> None:
+        self.policy = policy
+        self.max_workers = max_workers or policy.max_workers
+        self._sleep = sleep
+        self._random = random_fraction
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        # Pool calls submitted and not finished, abandoned ones included.
+        self._busy = 0
+
+    def hedge_delay_s(self) -> float:
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < self.policy.hedge_min_samples:
+            return self.policy.hedge_initial_delay_s
+        rank = min(len(samples) - 1, int(self.policy.hedge_quantile * len(samples)))
+        return max(self.policy.hedge_min_delay_s, samples[rank])
+
+    def backoff_s(self, attempt: int) -> float:
+        ceiling = min(self.policy.backoff_max_s, self.policy.backoff_base_s * 2 ** (attempt - 1))
+        return ceiling * self._random()
+
+    def call(self, fn: Callable[[], T]) -> tuple[T, list[dict[str, Any]]]:
+        attempts: list[dict[str, Any]] = []
+        for attempt in range(1, self.policy.max_attempts + 1):
+            try:
+                if self.policy.timeout_s is None and not self.policy.hedge:
+                    return self._direct_attempt(fn, attempt, attempts), attempts
+                return self._pooled_attempt(fn, attempt, attempts), attempts
+            except Exception as exc:
+                if attempt == self.policy.max_attempts or not self.policy.retry_on(exc):
+                    raise
+            self._sleep(self.backoff_s(attempt))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def acall(self, fn: Callable[[], Awaitable[T]]) -> tuple[T, list[dict[str, Any]]]:
+        attempts: list[dict[str, Any]] = []
+        for attempt in range(1, self.policy.max_attempts + 1):
+            try:
+                return await self._async_attempt(fn, attempt, attempts), attempts
+            except Exception as exc:
+                if attempt == self.policy.max_attempts or not self.policy.retry_on(exc):
+                    raise
+            await asyncio.sleep(self.backoff_s(attempt))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def close(self) -> None:
+        if self._executor is not None:
+            # Abandoned (timed out) calls are not waited for.
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _direct_attempt(
+        self,
+        fn: Callable[[], T],
+        attempt: int,
+        attempts: list[dict[str, Any]],
+    ) -> T:
+        start = perf_counter()
+        try:
+            result = fn()
+        except Exception as exc:
+            attempts.append(_record(attempt, False, start, exc))
+            raise
+        attempts.append(_record(attempt, False, start))
+        self._observe(perf_counter() - start)
+        return result
+
+    def _pooled_attempt(
+        self,
+        fn: Callable[[], T],
+        attempt: int,
+        attempts: list[dict[str, Any]],
+    ) -> T:
+        executor = self._resolve_executor()
+        primary = self._submit(executor, fn, hedge=False)
+        pending: dict[Future[T], _PooledCall] = {primary.future: primary}
+        hedge_pending = self.policy.hedge
+        hedge_delay_s = self.hedge_delay_s() if hedge_pending else 0.0
+        last_error: BaseException | None = None
+
+        while pending:
+            # Queue time in a saturated pool does not count against the deadline or
+            # the hedge delay: both start when the first call starts running.
+            started = primary.started
+            deadline = hedge_at = None
+            if started is not None:
+                if self.policy.timeout_s:
+                    deadline = started + self.policy.timeout_s
+                if hedge_pending:
+                    hedge_at = started + hedge_delay_s
+            wake_at = min((at for at in (deadline, hedge_at) if at is not None), default=None)
+            if started is None:
+                timeout: float | None = _QUEUE_POLL_S
+            else:
+                timeout = None if wake_at is None else max(0.0, wake_at - perf_counter())
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                call = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    attempts.append(_record(attempt, call.hedge, call.since))
+                    self._observe(perf_counter() - primary.since)
+                    for loser in pending:
+                        self._cancel(loser)
+                    return future.result()
+                attempts.append(_record(attempt, call.hedge, call.since, error))
+                last_error = error
+
+            now = perf_counter()
+            if hedge_at is not None and now >= hedge_at and pending:
+                hedge_pending = False
+                with self._lock:
+                    has_free_worker = self._busy < self.max_workers
+                if has_free_worker:
+                    hedge = self._submit(executor, fn, hedge=True)
+                    pending[hedge.future] = hedge
+            if deadline is not None and now >= deadline and pending:
+                for future, call in pending.items():
+                    self._cancel(future)
+                    attempts.append(_record(attempt, call.hedge, call.since, status="timeout"))
+                raise TimeoutError(f"LLM call exceeded {self.policy.timeout_s}s deadline")
+
+        assert last_error is not None
+        raise last_error
+
+    def _submit(
+        self, executor: ThreadPoolExecutor, fn: Callable[[], T], *, hedge: bool
+    ) -> _PooledCall:
+        call = _PooledCall(hedge=hedge, submitted=perf_counter())
+
+        def run() -> T:
+            call.started = perf_counter()
+            try:
+                return fn()
+            finally:
+                self._release_worker()
+
+        with self._lock:
+            self._busy += 1
+        call.future = executor.submit(run)
+        return call
+
+    def _cancel(self, future: Future[Any]) -> None:
+        # A call that never started frees its slot here; a running one when it returns.
+        if future.cancel():
+            self._release_worker()
+
+    def _release_worker(self) -> None:
+        with self._lock:
+            self._busy -= 1
+
+    async def _async_attempt(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        attempt: int,
+        attempts: list[dict[str, Any]],
+    ) -> T:
+        start = perf_counter()
+        deadline = start + self.policy.timeout_s if self.policy.timeout_s else None
+        hedge_at = start + self.hedge_delay_s() if self.policy.hedge else None
+        pending: dict[asyncio.Future[T], tuple[bool, float]] = {
+            asyncio.ensure_future(fn()): (False, start)
+        }
+        last_error: BaseException | None = None
+
+        try:
+            while pending:
+                wake_at = min((at for at in (deadline, hedge_at) if at is not None), default=None)
+                timeout = None if wake_at is None else max(0.0, wake_at - perf_counter())
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    hedge, started = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        attempts.append(_record(attempt, hedge, started))
+                        self._observe(perf_counter() - start)
+                        return task.result()
+                    attempts.append(_record(attempt, hedge, started, error))
+                    last_error = error
+
+                now = perf_counter()
+                if hedge_at is not None and now >= hedge_at and pending:
+                    hedge_at = None
+                    pending[asyncio.ensure_future(fn())] = (True, now)
+                if deadline is not None and now >= deadline and pending:
+                    for hedge, started in pending.values():
+                        attempts.append(_record(attempt, hedge, started, status="timeout"))
+                    raise TimeoutError(f"LLM call exceeded {self.policy.timeout_s}s deadline")
+        finally:
+            for task in pending:
+                task.cancel()
+
+        assert last_error is not None
+        raise last_error
+
+    def _observe(self, latency_s: float) -> None:
+        with self._lock:
+            self._latencies.append(latency_s)
+
+    def _resolve_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="medlabs-llm-call",
+                )
+            return self._executor
+
+
+@dataclass(slots=True)
+class _PooledCall:
+    hedge: bool
+    submitted: float
+    started: float | None = None
+    future: Future[Any] = field(default_factory=Future)
+
+    @property
+    def since(self) -> float:
+        return self.started if self.started is not None else self.submitted
+
+
+def _record(
+    attempt: int,
+    hedge: bool,
+    started: float,
+    error: BaseException | None = None,
+    *,
+    status: str | None = None,
+) -> dict[str, Any]:
+    record: dict[str, Any] = {
+        "attempt": attempt,
+        "hedge": hedge,
+        "status": status or ("error" if error is not None else "ok"),
+        "duration_ms": elapsed_ms(started),
+    }
+    if error is not None:
+        record["error"] = type(error).__name__
+    return record
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from threading import Lock
+
+_FIRST_PAGE_CHARS = 4096
+_FIELDS = ("name", "value", "unit", "ref")
+
+
+@dataclass(frozen=True)
+class LabTemplate:
+    """Line layout of one laboratory's result table.
+
+    Field patterns must not define named groups: they are wrapped into
+    `name`/`value`/`unit`/`ref` groups when the registry is compiled.
+    `fingerprint` is a case-sensitive pattern searched in the first page to
+    recognise the lab; the template is then tried first on every line of that
+    document. Templates without a fingerprint are generic and take part in
+    matching any document.
+    """
+
+    name: str
+    name_pattern: str
+    value_pattern: str
+    unit_pattern: str = r"[%A-Za-z0-9\*\^/]+"
+    ref_pattern: str = r"[^)]{1,40}"
+    ref_open: str = "("
+    ref_close: str = ")"
+    fingerprint: str = ""
+    priority: int = 0
+    confidence: float = 0.3
+
+    def line_pattern(self, group_prefix: str = "") -> str:
+        groups = {field: f"{group_prefix}{field}" for field in _FIELDS}
+        if self.ref_open:
+            ref = (
+                rf"(?:\s*{re.escape(self.ref_open)}(?P<{groups['ref']}>{self.ref_pattern})"
+                rf"{re.escape(self.ref_close)})?"
+            )
+        else:
+            ref = rf"(?:\s+(?P<{groups['ref']}>{self.ref_pattern}))?"
+        return (
+            rf"^\s*(?P<{groups['name']}>{self.name_pattern})[:\s]+"
+            rf"(?P<{groups['value']}>{self.value_pattern})"
+            rf"(?:\s+(?P<{groups['unit']}>{self.unit_pattern}))?"
+            rf"{ref}\s*$"
+        )
+
+
+@dataclass(frozen=True)
+class TemplateMatch:
+    template: LabTemplate
+    name: str
+    value: str
+    unit: str
+    ref: str
+
+
+GENERIC_TEMPLATE = LabTemplate(
+    name="generic",
+    name_pattern=r"[A-Za-z][A-Za-z0-9_\-/ ]{1,60}",
+    value_pattern=r"-?[0-9]+(?:[\.,][0-9]+)?|[A-Za-z]+",
+)
+
+CYRILLIC_TEMPLATE = LabTemplate(
+    name="generic-cyrillic",
+    name_pattern=r"[А-ЯЁа-яё][А-ЯЁа-яёA-Za-z0-9_\-/,.# ]{1,80}?",
+    value_pattern=r"[<>]?-?[0-9]+(?:[\.,][0-9]+)?|[А-ЯЁа-яё]+",
+    unit_pattern=r"[%А-ЯЁа-яёA-Za-zµμ0-9\*\^/.]+",
+    ref_pattern=r"[<>]?\s*[0-9]+(?:[\.,][0-9]+)?(?:\s*[-–]\s*[0-9]+(?:[\.,][0-9]+)?)?",
+    ref_open="",
+    ref_close="",
+)
+
+DEFAULT_TEMPLATES: tuple[LabTemplate, ...] = (GENERIC_TEMPLATE, CYRILLIC_TEMPLATE)
+
+
+class _CompiledTemplates:
+    __slots__ = ("combined", "fingerprints", "group_owner", "singles", "templates")
+
+    def __init__(self, templates: tuple[LabTemplate, ...]) -> None:
+        self.templates = templates
+        # Fingerprinted templates only run once their lab is detected, so the
+        # per-line cost of unrelated documents does not grow with the registry.
+        self.combined = re.compile(
+            "|".join(
+                f"(?:{template.line_pattern(f't{index}_')})"
+                for index, template in enumerate(templates)
+                if not template.fingerprint
+            )
+            or r"(?!)"
+        )
+        # Group number -> template index, so a match is attributed via `lastindex`
+        # instead of scanning every group of the alternation.
+        owner = [0] * (self.combined.groups + 1)
+        for group_name, number in self.combined.groupindex.items():
+            owner[number] = int(group_name[1 : group_name.index("_")])
+        self.group_owner = tuple(owner)
+        # Keyed by template, so `match_line(lab=...)` finds the pattern without a scan.
+        self.singles = {template: re.compile(template.line_pattern()) for template in templates}
+        # Separate searches keep the literal-prefix scan of each fingerprint;
+        # one alternation of them is several times slower on a typical header.
+        self.fingerprints = tuple(
+            (index, re.compile(template.fingerprint))
+            for index, template in enumerate(templates)
+            if template.fingerprint
+        )
+
+
+class TemplateRegistry:
+    """Lab templates ordered by priority; generic layouts share one alternation.
+
+    Compilation happens lazily and is redone only after `register`.
+    """
+
+    def __init__(self, templates: tuple[LabTemplate, ...] | list[LabTemplate] = ()) -> None:
+        self._templates: list[LabTemplate] = []
+        self._compiled: _CompiledTemplates | None = None
+        self._lock = Lock()
+        for template in templates:
+            self.register(template)
+
+    @property
+    def templates(self) -> tuple[LabTemplate, ...]:
+        return self._compile().templates
+
+    def register(self, template: LabTemplate) -> None:
+        for field, pattern in zip(
+            _FIELDS,
+            (
+                template.name_pattern,
+                template.value_pattern,
+                template.unit_pattern,
+                template.ref_pattern,
+            ),
+            strict=True,
+        ):
+            if re.compile(pattern).groupindex:
+                raise ValueError(
+                    f"Template '{template.name}' {field} pattern must not define named groups"
+                )
+        with self._lock:
+            self._templates = [item for item in self._templates if item.name != template.name]
+            self._templates.append(template)
+            self._compiled = None
+
+    def detect(self, first_page: str) -> LabTemplate | None:
+        """Template whose fingerprint occurs in the first page, if any."""
+
+        compiled = self._compile()
+        header = first_page[:_FIRST_PAGE_CHARS]
+        for index, fingerprint in compiled.fingerprints:
+            if fingerprint.search(header) is not None:
+                return compiled.templates[index]
+        return None
+
+    def match_line(self, line: str, *, lab: LabTemplate | None = None) -> TemplateMatch | None:
+        """Match `line`, trying `lab` first; a lab not in the registry is skipped."""
+
+        compiled = self._compile()
+        if lab is not None:
+            single = compiled.singles.get(lab)
+            match = single.match(line) if single is not None else None
+            if match is not None:
+                return _template_match(lab, match, "")
+
+        match = compiled.combined.match(line)
+        if match is None:
+            return None
+        index = compiled.group_owner[match.lastindex or 0]
+        return _template_match(compiled.templates[index], match, f"t{index}_")
+
+    def _compile(self) -> _CompiledTemplates:
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled
+        with self._lock:
+            if self._compiled is None:
+                # Stable sort keeps registration order among equal priorities.
+                ordered = sorted(self._templates, key=lambda item: -item.priority)
+                self._compiled = _CompiledTemplates(tuple(ordered))
+            return self._compiled
+
+
+def _template_match(template: LabTemplate, match: re.Match[str], prefix: str) -> TemplateMatch:
+    return TemplateMatch(
+        template=template,
+        **{field: (match.group(f"{prefix}{field}") or "").strip() for field in _FIELDS},
+    )
+
+
+DEFAULT_REGISTRY = TemplateRegistry(DEFAULT_TEMPLATES)
@@ -1,5 +1,5 @@
 from medlabs_sdk.core.ingest.base import Ingestor
-from medlabs_sdk.core.ingest.pdf import PdfIngestError, PdfIngestor
+from medlabs_sdk.core.ingest.pdf import PdfIngestError, PdfIngestor, PdfSource
 from medlabs_sdk.core.ingest.text import TextIngestor
 
-__all__ = ["Ingestor", "PdfIngestError", "PdfIngestor", "TextIngestor"]
+__all__ = ["Ingestor", "PdfIngestError", "PdfIngestor", "PdfSource", "TextIngestor"]
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+import mmap
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from io import BytesIO
+from typing import IO, Any, Union
+
 from medlabs_sdk.core.ingest.base import Ingestor
-from medlabs_sdk.core.models import RawDocument
+from medlabs_sdk.core.models import RawDocument, TextPages
+
+PdfSource = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, mmap.mmap, IO[bytes]]
 
 
 class PdfIngestError(RuntimeError):
@@ -9,24 +20,150 @@ class PdfIngestError(RuntimeError):
 
 
 class PdfIngestor(Ingestor):
-    def ingest(self, source: str) -> RawDocument:
-        try:
-            from pypdf import PdfReader
-        except ImportError as exc:  # pragma: no cover - dependency error path
-            raise RuntimeError("Install 'pypdf' to use PdfIngestor") from exc
+    """Text extraction from PDF paths, bytes, memory maps or binary file objects.
+
+    Paths are memory-mapped instead of being read into memory. With `workers` > 1,
+    documents of at least `parallel_min_pages` pages are split into contiguous page
+    ranges that are extracted in a process pool. The pool is started on first use,
+    kept for later documents and shut down by `close()`.
+    """
 
-        reader = PdfReader(source)
-        pages: list[str] = []
-        for page in reader.pages:
-            pages.append((page.extract_text() or "").strip())
+    def __init__(self, *, workers: int | None = None, parallel_min_pages: int = 8) -> None:
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.parallel_min_pages = parallel_min_pages
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
 
-        text = "\n\n".join(chunk for chunk in pages if chunk)
+    def ingest(self, source: PdfSource) -> RawDocument:
+        pages = TextPages.join(self._pages(source))
+        text = pages.text
         if not text.strip():
             raise PdfIngestError("PDF is scanned, OCR required")
 
+        # `pages` slices `text`, so the document keeps a single copy of the text.
         return RawDocument(
             text=text,
             pages=pages,
-            source=source,
+            source=self.describe_source(source),
             meta={"page_count": len(pages), "text_size": len(text)},
         )
+
+    def iter_pages(self, source: PdfSource) -> Iterator[str]:
+        """Yield page texts one by one without materializing the whole document."""
+
+        with _open_pdf_stream(source) as stream:
+            for page in _pdf_reader(stream).pages:
+                yield _page_text(page)
+
+    def close(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> PdfIngestor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def describe_source(source: PdfSource) -> str:
+        if isinstance(source, (str, os.PathLike)):
+            return os.fspath(source)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return "inline-pdf"
+        if isinstance(source, mmap.mmap):
+            return "mmap-pdf"
+        name = getattr(source, "name", None)
+        if isinstance(name, str) and name:
+            return name
+        return "stream-pdf"
+
+    def _pages(self, source: PdfSource) -> Iterator[str]:
+        if self.workers and self.workers > 1:
+            with _open_pdf_stream(source) as stream:
+                page_count = len(_pdf_reader(stream).pages)
+            if page_count >= self.parallel_min_pages:
+                return self._extract_pages_parallel(source, page_count=page_count)
+        return self.iter_pages(source)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _extract_pages_parallel(self, source: PdfSource, *, page_count: int) -> Iterator[str]:
+        worker_count = min(self.workers or 1, page_count)
+        # Workers re-open the document themselves: paths are passed as-is, everything
+        # else is sent once per worker rather than once per page.
+        if isinstance(source, (str, os.PathLike)):
+            shared_source: str | bytes = os.fspath(source)
+        else:
+            shared_source = _source_bytes(source)
+
+        step = -(-page_count // worker_count)
+        ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        executor = self._pool()
+        futures = [
+            executor.submit(_extract_page_range, shared_source, start, stop)
+            for start, stop in ranges
+        ]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _pdf_reader(stream: Any) -> Any:
+    try:
+        from pypdf import PdfReader
+    except ImportError as exc:  # pragma: no cover - dependency error path
+        raise RuntimeError("Install 'pypdf' to use PdfIngestor") from exc
+
+    return PdfReader(stream)
+
+
+def _page_text(page: Any) -> str:
+    return (page.extract_text() or "").strip()
+
+
+@contextmanager
+def _open_pdf_stream(source: PdfSource) -> Iterator[Any]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                yield handle
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+        return
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield BytesIO(source)
+        return
+
+    source.seek(0)
+    yield source
+
+
+def _source_bytes(source: PdfSource) -> bytes:
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+    source.seek(0)
+    return source.read()
+
+
+def _extract_page_range(source: str | bytes, start: int, stop: int) -> list[str]:
+    """Process-pool entry point: extract pages `[start, stop)` of one document."""
+
+    with _open_pdf_stream(source) as stream:
+        reader = _pdf_reader(stream)
+        return [_page_text(reader.pages[index]) for index in range(start, stop)]
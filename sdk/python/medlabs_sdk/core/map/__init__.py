@@ -1,3 +1,17 @@
-from medlabs_sdk.core.map.to_standard import to_standard_panel
+from medlabs_sdk.core.map.ids import CounterIds, DeterministicIds, RandomIds
+from medlabs_sdk.core.map.to_standard import (
+    panel_coverage,
+    register_observation_code,
+    register_panel_code_alias,
+    to_standard_panel,
+)
 
-__all__ = ["to_standard_panel"]
+__all__ = [
+    "CounterIds",
+    "DeterministicIds",
+    "RandomIds",
+    "panel_coverage",
+    "register_observation_code",
+    "register_panel_code_alias",
+    "to_standard_panel",
+]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from hashlib import blake2b
+from itertools import count
+from typing import Any
+from uuid import uuid4
+
+from medlabs_sdk.core.models import RawDocument
+
+
+class RandomIds:
+    """Random suffixes; every call yields a new id (the historical behaviour)."""
+
+    unique_across_processes = True
+    reproducible = False
+
+    def panel_id(self, *, panel_code: str, document: RawDocument) -> str:
+        return f"panel-{panel_code.lower()}-{uuid4().hex[:8]}"
+
+    def observation_id(self, *, panel_code: str, document: RawDocument, index: int) -> str:
+        return f"obs-{panel_code.lower()}-{index:03d}-{uuid4().hex[:6]}"
+
+
+class DeterministicIds:
+    """Suffixes hashed from the document, panel and observation index.
+
+    The same document mapped to the same panel always gets the same ids, so
+    identical inputs produce byte-identical panels. Documents without a
+    `document_id` are keyed by their text, which is hashed once per document rather
+    than once per observation.
+    """
+
+    unique_across_processes = True
+    reproducible = True
+
+    def __init__(self) -> None:
+        self._last: tuple[str, object, dict[int, Any]] | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Hasher objects do not pickle; worker processes rebuild them.
+        return {}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._last = None
+
+    def panel_id(self, *, panel_code: str, document: RawDocument) -> str:
+        digest = self._digest(document, panel_code, size=4)
+        return f"panel-{panel_code.lower()}-{digest}"
+
+    def observation_id(self, *, panel_code: str, document: RawDocument, index: int) -> str:
+        digest = self._digest(document, panel_code, str(index), size=3)
+        return f"obs-{panel_code.lower()}-{index:03d}-{digest}"
+
+    def _digest(self, document: RawDocument, *parts: str, size: int) -> str:
+        hasher = self._document_hasher(document, size).copy()
+        hasher.update("\x1f".join(("", *parts)).encode("utf-8"))
+        return hasher.hexdigest()
+
+    def _document_hasher(self, document: RawDocument, size: int) -> Any:
+        # Hashers already fed the document key, reused while the same document (the
+        # same text object and id) is mapped; one tuple swap keeps this thread-safe.
+        document_id = document.meta.get("document_id")
+        last = self._last
+        if last is None or last[0] is not document.text or last[1] != document_id:
+            last = self._last = (document.text, document_id, {})
+        hashers = last[2]
+        hasher = hashers.get(size)
+        if hasher is None:
+            hasher = hashers[size] = blake2b(
+                _document_key(document).encode("utf-8"), digest_size=size
+            )
+        return hasher
+
+
+class CounterIds:
+    """Sequential suffixes, unique within one process.
+
+    Cheapest of the strategies; ids are not stable across runs and repeat in
+    separate worker processes, so `parse_many(cpu_workers=...)` rejects it.
+    """
+
+    unique_across_processes = False
+    reproducible = False
+
+    def __init__(self, start: int = 1) -> None:
+        self._counter = count(start)
+
+    def panel_id(self, *, panel_code: str, document: RawDocument) -> str:
+        return f"panel-{panel_code.lower()}-{next(self._counter):08x}"
+
+    def observation_id(self, *, panel_code: str, document: RawDocument, index: int) -> str:
+        return f"obs-{panel_code.lower()}-{index:03d}-{next(self._counter):06x}"
+
+
+DEFAULT_IDS = RandomIds()
+
+
+def _document_key(document: RawDocument) -> str:
+    document_id = document.meta.get("document_id")
+    if document_id is not None:
+        return f"id:{document_id}"
+    return f"text:{document.text}"
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+from threading import Lock
+from types import MappingProxyType
 from typing import Any
-from uuid import uuid4
 
+from medlabs_sdk.contracts import IdStrategy
+from medlabs_sdk.core.map.ids import DEFAULT_IDS
 from medlabs_sdk.core.models import NormalizedObservation, NormalizedReport, StandardPanel
-from medlabs_sdk.core.normalize.units import unit_display
+from medlabs_sdk.core.normalize.memo import MEMO_SIZE
+from medlabs_sdk.core.normalize.units import (
+    canonical_units,
+    unit_aliases_version,
+    unit_display,
+)
 
 _PANEL_DEFINITIONS: dict[str, dict[str, str]] = {
     "CBC": {"display": "Complete Blood Count"},
@@ -105,7 +117,12 @@ _OBSERVATION_CODE_MAP: dict[str, dict[str, str]] = {
     },
     "urea": {
         "system": "LOINC",
-        "code": "3094-0",
+        "code": "22664-7",
+        "display": "Urea [Moles/volume] in Serum or Plasma",
+    },
+    "bun": {
+        "system": "LOINC",
+        "code": "14937-7",
         "display": "Urea nitrogen [Moles/volume] in Serum or Plasma",
     },
     "alt": {
@@ -243,7 +260,7 @@ _PANEL_ALLOWED_CODES: dict[str, set[str]] = {
         "basophils_pct",
         "esr",
     },
-    "BIOCHEM": {"glucose", "creatinine", "urea", "alt", "ast"},
+    "BIOCHEM": {"glucose", "creatinine", "urea", "bun", "alt", "ast"},
     "URINALYSIS": {
         "color",
         "appearance",
@@ -306,25 +323,46 @@ def _normalize_panel_code(panel: str) -> str:
     return alias_map.get(normalized, normalized)
 
 
-def _report_date(meta: dict[str, Any]) -> str:
+# Stands in for a missing report date under reproducible ids (`DeterministicIds`),
+# whose output must not depend on the clock; other strategies use today's date.
+_UNKNOWN_REPORT_DATE = "1970-01-01"
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _report_date(meta: dict[str, Any]) -> str | None:
+    """`report_date`, else the date of `effective_time`/`collected_at`, if any."""
+
     report_date = meta.get("report_date")
     if isinstance(report_date, str) and len(report_date) == 10:
         return report_date
+    for key in ("effective_time", "collected_at"):
+        value = meta.get(key)
+        if isinstance(value, str) and _ISO_DATE.match(value):
+            return value[:10]
+    return None
+
+
+def _fallback_report_date(ids: IdStrategy) -> str:
+    if getattr(ids, "reproducible", False):
+        return _UNKNOWN_REPORT_DATE
     return datetime.now(timezone.utc).date().isoformat()
 
 
+def _document_trace(document_meta: dict[str, Any], report_date: str) -> dict[str, Any]:
+    return {
+        "document_id": str(document_meta.get("document_id", "unknown-document")),
+        "lab_name": str(document_meta.get("lab_name", "Unknown Lab")),
+        "report_date": report_date,
+    }
+
+
 def _source_trace(
-    document_meta: dict[str, Any],
+    document_trace: dict[str, Any],
     *,
     evidence: dict[str, Any] | None = None,
     fallback_raw_text: str,
 ) -> dict[str, Any]:
-    trace: dict[str, Any] = {
-        "document_id": str(document_meta.get("document_id", "unknown-document")),
-        "lab_name": str(document_meta.get("lab_name", "Unknown Lab")),
-        "report_date": _report_date(document_meta),
-        "raw_text": fallback_raw_text,
-    }
+    trace: dict[str, Any] = {**document_trace, "raw_text": fallback_raw_text}
 
     if evidence:
         page = evidence.get("page")
@@ -340,32 +378,33 @@ def _source_trace(
     return trace
 
 
-def _quantity(value: float, unit: str) -> dict[str, Any]:
-    unit_code = unit or "1"
+def _quantity(value: float, resolved: _ResolvedCode) -> dict[str, Any]:
     return {
         "value": value,
-        "unit_code": unit_code,
+        "unit_code": resolved.unit_code,
         "unit_system": "UCUM",
-        "unit_display": unit_display(unit_code),
+        "unit_display": resolved.unit_display,
     }
 
 
-def _reference_range(observation: NormalizedObservation) -> dict[str, Any] | None:
+def _reference_range(
+    observation: NormalizedObservation,
+    resolved: _ResolvedCode,
+) -> dict[str, Any] | None:
     if observation.ref_low is None and observation.ref_high is None:
         return None
 
-    unit_code = observation.unit or "1"
     result: dict[str, Any] = {}
     if observation.ref_low is not None:
-        result["low"] = _quantity(observation.ref_low, unit_code)
+        result["low"] = _quantity(observation.ref_low, resolved)
     if observation.ref_high is not None:
-        result["high"] = _quantity(observation.ref_high, unit_code)
+        result["high"] = _quantity(observation.ref_high, resolved)
     return result
 
 
 def _interpretation(observation: NormalizedObservation) -> str:
     value = observation.value
-    if not isinstance(value, float):
+    if not isinstance(value, float) or observation.comparator:
         return "unknown"
     if observation.ref_low is not None and value < observation.ref_low:
         return "low"
@@ -376,25 +415,35 @@ def _interpretation(observation: NormalizedObservation) -> str:
     return "unknown"
 
 
-def _observation_code(*, observation_code: str, source_name: str) -> dict[str, str]:
-    coding = _OBSERVATION_CODE_MAP.get(observation_code)
-    if coding:
-        return coding
+def _observation_code(resolved: _ResolvedCode, *, source_name: str) -> dict[str, str]:
+    if resolved.coding:
+        return resolved.coding
 
-    display = source_name or observation_code.replace("_", " ").title()
+    display = source_name or resolved.code.replace("_", " ").title()
     return {
         "system": "LOCAL",
-        "code": observation_code.upper(),
+        "code": resolved.code.upper(),
         "display": display,
     }
 
 
+def _number_text(value: float) -> str:
+    # `repr` round-trips every digit (`:g` keeps six); whole numbers drop the `.0`.
+    text = repr(value)
+    return text[:-2] if text.endswith(".0") else text
+
+
 def _observation_value(
     observation: NormalizedObservation,
+    resolved: _ResolvedCode,
 ) -> float | str | bool | None | dict[str, Any]:
     value = observation.value
+    if isinstance(value, float) and observation.comparator:
+        # Censored results (`<0.01`) are reported as text, as in the standard examples.
+        unit = resolved.unit_display if observation.unit else ""
+        return f"{observation.comparator}{_number_text(value)} {unit}".strip()
     if isinstance(value, float):
-        return _quantity(value, observation.unit)
+        return _quantity(value, resolved)
     if isinstance(value, bool) or value is None:
         return value
     return str(value)
@@ -421,79 +470,228 @@ def _resolve_code_for_panel(observation: NormalizedObservation, *, panel_code: s
     return observation.code
 
 
+@dataclass(frozen=True, slots=True)
+class _ResolvedCode:
+    code: str
+    coding: dict[str, str] | None
+    allowed: bool
+    unit_code: str
+    unit_display: str
+
+
+@dataclass(frozen=True, slots=True)
+class _PanelPlan:
+    """Per-panel resolution of every known (code, unit) pair.
+
+    Pairs outside the precompiled table (unknown codes or units) are resolved on
+    first use through `overflow`, an LRU memo bounded by `MEMO_SIZE`.
+    """
+
+    version: tuple[int, int]
+    panel_code: str
+    filtered: bool
+    known: MappingProxyType[tuple[str, str], _ResolvedCode]
+    overflow: Callable[[str, str], _ResolvedCode]
+
+    def resolve(self, observation: NormalizedObservation) -> _ResolvedCode:
+        resolved = self.known.get((observation.code, observation.unit))
+        if resolved is None:
+            resolved = self.overflow(observation.code, observation.unit)
+        return resolved
+
+
+_plan_lock = Lock()
+_map_version = 0
+_PANEL_PLANS: dict[str, _PanelPlan] = {}
+
+
+def register_observation_code(
+    code: str,
+    coding: dict[str, str],
+    *,
+    panels: Iterable[str] = (),
+) -> None:
+    """Add or replace the standard coding of a canonical code and allow it on panels."""
+
+    global _map_version
+    with _plan_lock:
+        _OBSERVATION_CODE_MAP[code] = dict(coding)
+        for panel in panels:
+            _PANEL_ALLOWED_CODES.setdefault(_normalize_panel_code(panel), set()).add(code)
+        _map_version += 1
+
+
+def register_panel_code_alias(panel: str, code: str, resolved_code: str) -> None:
+    """Resolve `code` to `resolved_code` when mapping observations of `panel`."""
+
+    global _map_version
+    with _plan_lock:
+        _PANEL_CODE_ALIASES.setdefault(_normalize_panel_code(panel), {})[code] = resolved_code
+        _map_version += 1
+
+
+def _panel_plan(panel_code: str) -> _PanelPlan:
+    # Plans also depend on the unit alias table, which `register_unit_alias` versions.
+    version = (_map_version, unit_aliases_version())
+    plan = _PANEL_PLANS.get(panel_code)
+    if plan is not None and plan.version == version:
+        return plan
+    with _plan_lock:
+        plan = _compile_panel_plan(panel_code, version=version)
+        _PANEL_PLANS[panel_code] = plan
+    return plan
+
+
+def _compile_panel_plan(panel_code: str, *, version: tuple[int, int]) -> _PanelPlan:
+    codes = set(_OBSERVATION_CODE_MAP)
+    codes.update(_PANEL_ALLOWED_CODES.get(panel_code, ()))
+    codes.update(_PANEL_CODE_ALIASES.get(panel_code, {}))
+    codes.update(("leukocytes", "erythrocytes"))
+    units = canonical_units()
+    known = {
+        (code, unit): _resolve(code, unit, panel_code=panel_code)
+        for code in codes
+        for unit in units
+    }
+    return _PanelPlan(
+        version=version,
+        panel_code=panel_code,
+        filtered=bool(_PANEL_ALLOWED_CODES.get(panel_code)),
+        known=MappingProxyType(known),
+        overflow=lru_cache(maxsize=MEMO_SIZE)(partial(_resolve, panel_code=panel_code)),
+    )
+
+
+def _resolve(code: str, unit: str, *, panel_code: str) -> _ResolvedCode:
+    resolved_code = _resolve_code_for_panel(
+        NormalizedObservation(code=code, value=None, unit=unit),
+        panel_code=panel_code,
+    )
+    allowed_codes = _PANEL_ALLOWED_CODES.get(panel_code)
+    unit_code = unit or "1"
+    return _ResolvedCode(
+        code=resolved_code,
+        coding=_OBSERVATION_CODE_MAP.get(resolved_code),
+        allowed=not allowed_codes or resolved_code in allowed_codes,
+        unit_code=unit_code,
+        unit_display=unit_display(unit_code),
+    )
+
+
+_RESULT_LINE = re.compile(r"[^\W\d_].*?\d")
+_NOT_RESULT_LINE = re.compile(
+    r"\b(?:date|page|дата|стр)|\b\d{4}-\d{2}-\d{2}\b|\b\d{1,2}[./]\d{1,2}[./]\d{2,4}\b",
+    re.IGNORECASE,
+)
+
+
+def panel_coverage(report: NormalizedReport, panel: str) -> float:
+    """Share of the document's result lines that became observations allowed for `panel`.
+
+    Result lines are lines of the source text with a name followed by a number
+    (dates and page markers excluded). Lines an observation was parsed from are
+    taken from its `evidence["raw_text"]`; without that evidence the denominator
+    is the larger of the observation and result line counts. A parse that matched
+    one line of a 20-analyte report therefore scores about 0.05, not 1.0.
+
+    Panels without a code allow-list count every observation as allowed.
+    """
+
+    observations = report.observations
+    if not observations:
+        return 0.0
+
+    plan = _panel_plan(_normalize_panel_code(panel))
+    if plan.filtered:
+        covered = sum(1 for observation in observations if plan.resolve(observation).allowed)
+    else:
+        covered = len(observations)
+
+    candidates = _result_lines(report.document.text)
+    parsed_lines = {
+        raw_text
+        for observation in observations
+        if isinstance(raw_text := observation.evidence.get("raw_text"), str)
+    }
+    if parsed_lines:
+        total = len(observations) + sum(1 for line in candidates if line not in parsed_lines)
+    else:
+        total = max(len(observations), len(candidates))
+    return covered / total
+
+
+def _result_lines(text: str) -> list[str]:
+    return [
+        stripped
+        for line in text.splitlines()
+        if (stripped := line.strip())
+        and _RESULT_LINE.search(stripped)
+        and not _NOT_RESULT_LINE.search(stripped)
+    ]
+
+
 def _filter_observations_for_panel(
     observations: list[NormalizedObservation],
     *,
-    panel_code: str,
-) -> tuple[list[tuple[NormalizedObservation, str]], list[str]]:
-    allowed_codes = _PANEL_ALLOWED_CODES.get(panel_code)
+    plan: _PanelPlan,
+) -> tuple[list[tuple[NormalizedObservation, _ResolvedCode]], list[str]]:
     resolved_observations = [
-        (observation, _resolve_code_for_panel(observation, panel_code=panel_code))
-        for observation in observations
+        (observation, plan.resolve(observation)) for observation in observations
     ]
-    if not allowed_codes:
+    if not plan.filtered:
         return resolved_observations, []
 
-    included: list[tuple[NormalizedObservation, str]] = []
+    included: list[tuple[NormalizedObservation, _ResolvedCode]] = []
     dropped: list[str] = []
-    for observation, resolved_code in resolved_observations:
-        if resolved_code in allowed_codes:
-            included.append((observation, resolved_code))
+    for observation, resolved in resolved_observations:
+        if resolved.allowed:
+            included.append((observation, resolved))
             continue
         dropped.append(observation.source_name or observation.code)
 
     if not dropped:
         return included, []
 
+    panel_code = plan.panel_code
     if not included:
         return resolved_observations, [
-            (
-                f"Panel filter for '{panel_code}' matched nothing, "
-                "kept all observations as fallback"
-            )
+            (f"Panel filter for '{panel_code}' matched nothing, kept all observations as fallback")
         ]
 
     sample = ", ".join(dropped[:3])
     suffix = "..." if len(dropped) > 3 else ""
     return included, [
-        (
-            f"Filtered {len(dropped)} observations outside panel '{panel_code}': "
-            f"{sample}{suffix}"
-        )
+        (f"Filtered {len(dropped)} observations outside panel '{panel_code}': {sample}{suffix}")
     ]
 
 
 def _observation_payload(
     observation: NormalizedObservation,
     *,
-    observation_code: str,
-    panel_code: str,
-    index: int,
-    document_meta: dict[str, Any],
+    observation_id: str,
+    resolved: _ResolvedCode,
+    document_trace: dict[str, Any],
+    effective_time: str | None,
 ) -> dict[str, Any]:
     payload: dict[str, Any] = {
-        "id": f"obs-{panel_code.lower()}-{index:03d}-{uuid4().hex[:6]}",
+        "id": observation_id,
         "resource_type": "observation",
-        "code": _observation_code(
-            observation_code=observation_code,
-            source_name=observation.source_name,
-        ),
-        "value": _observation_value(observation),
+        "code": _observation_code(resolved, source_name=observation.source_name),
+        "value": _observation_value(observation, resolved),
         "interpretation": _interpretation(observation),
         "status": "final",
         "source": _source_trace(
-            document_meta,
+            document_trace,
             evidence=observation.evidence,
             fallback_raw_text=observation.source_name,
         ),
     }
 
-    reference_range = _reference_range(observation)
+    reference_range = _reference_range(observation, resolved)
     if reference_range:
         payload["reference_range"] = reference_range
 
-    effective_time = document_meta.get("effective_time") or document_meta.get("collected_at")
-    if isinstance(effective_time, str) and effective_time:
+    if effective_time:
         payload["effective_time"] = effective_time
 
     return payload
@@ -503,7 +701,16 @@ def to_standard_panel(
     report: NormalizedReport,
     panel: str,
     standard_version: str = "0.1",
+    *,
+    ids: IdStrategy | None = None,
 ) -> StandardPanel:
+    """Map a normalized report onto a panel.
+
+    `ids` chooses how resource ids are generated (`RandomIds` by default,
+    `DeterministicIds` for reproducible output, `CounterIds`).
+    """
+
+    ids = DEFAULT_IDS if ids is None else ids
     panel_code = _normalize_panel_code(panel)
     panel_meta = _PANEL_DEFINITIONS.get(panel_code, {"display": panel_code.title()})
 
@@ -513,23 +720,36 @@ def to_standard_panel(
 
     filtered_observations, filter_warnings = _filter_observations_for_panel(
         report.observations,
-        panel_code=panel_code,
+        plan=_panel_plan(panel_code),
     )
     warnings.extend(filter_warnings)
 
+    document_meta = report.document.meta
+    report_date = _report_date(document_meta)
+    if report_date is None:
+        report_date = _fallback_report_date(ids)
+        warnings.append(f"Document has no report date, using {report_date}")
+    document_trace = _document_trace(document_meta, report_date)
+    effective_time = document_meta.get("effective_time") or document_meta.get("collected_at")
+    if not isinstance(effective_time, str):
+        effective_time = None
     observations = [
         _observation_payload(
             observation=observation,
-            observation_code=observation_code,
-            panel_code=panel_code,
-            index=index + 1,
-            document_meta=report.document.meta,
+            observation_id=ids.observation_id(
+                panel_code=panel_code,
+                document=report.document,
+                index=index + 1,
+            ),
+            resolved=resolved,
+            document_trace=document_trace,
+            effective_time=effective_time,
         )
-        for index, (observation, observation_code) in enumerate(filtered_observations)
+        for index, (observation, resolved) in enumerate(filtered_observations)
     ]
 
     payload: dict[str, Any] = {
-        "id": f"panel-{panel_code.lower()}-{uuid4().hex[:8]}",
+        "id": ids.panel_id(panel_code=panel_code, document=report.document),
         "resource_type": "panel",
         "standard_version": standard_version,
         "panel_code": {
@@ -541,7 +761,7 @@ def to_standard_panel(
         "status": "final",
         "observations": observations,
         "source": _source_trace(
-            report.document.meta,
+            document_trace,
             fallback_raw_text=report.document.meta.get("panel_raw_text", panel_meta["display"]),
         ),
     }
@@ -1,34 +1,126 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import Any, Literal, overload
+
+from medlabs_sdk.core.codec import dumps_json, dumps_msgpack, loads_json, loads_msgpack
 
 Evidence = dict[str, Any]
 Value = float | str | bool | None
 Severity = Literal["error", "warning"]
 
 
-@dataclass
+class _EmptyEvidence(dict):
+    """Read-only empty evidence shared by every field without provenance."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("EMPTY_EVIDENCE is shared and read-only; assign a new dict instead")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __hash__(self) -> int:
+        # Hashable because it never changes; also lets dataclasses accept it as
+        # a plain field default instead of a per-instance default_factory.
+        return hash(frozenset())
+
+    def __reduce__(self) -> str:
+        return "EMPTY_EVIDENCE"
+
+
+EMPTY_EVIDENCE: Evidence = _EmptyEvidence()
+
+
+class TextPages(Sequence[str]):
+    """Pages of a document as views into its joined text.
+
+    Page strings are sliced from `text` on access, so a document holds one copy of
+    its text instead of the page list plus the joined string. Compares equal to any
+    sequence of the same page strings.
+    """
+
+    __slots__ = ("_spans", "_text")
+
+    def __init__(self, text: str, spans: Sequence[tuple[int, int]]) -> None:
+        self._text = text
+        self._spans = tuple(spans)
+
+    @classmethod
+    def join(cls, pages: Iterable[str], separator: str = "\n\n") -> TextPages:
+        """Join non-empty pages with `separator`, keeping each page's span."""
+
+        parts: list[str] = []
+        spans: list[tuple[int, int]] = []
+        offset = 0
+        for page in pages:
+            if page:
+                if parts:
+                    parts.append(separator)
+                    offset += len(separator)
+                parts.append(page)
+            spans.append((offset, offset + len(page)))
+            offset += len(page)
+        return cls("".join(parts), spans)
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self._text[start:stop] for start, stop in self._spans[index]]
+        start, stop = self._spans[index]
+        return self._text[start:stop]
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TextPages):
+            return self._spans == other._spans and self._text == other._text
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(self) == len(other) and all(
+                page == item for page, item in zip(self, other, strict=True)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TextPages({list(self)!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return TextPages, (self._text, self._spans)
+
+
+@dataclass(slots=True)
 class RawDocument:
     text: str
-    pages: list[str] = field(default_factory=list)
+    pages: Sequence[str] = field(default_factory=list)
     source: str = ""
     meta: dict[str, Any] = field(default_factory=dict)
     artifacts: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedField:
     name_raw: str
     value_raw: str
     unit_raw: str = ""
     ref_raw: str = ""
     flags_raw: str = ""
-    evidence: Evidence = field(default_factory=dict)
+    evidence: Evidence = EMPTY_EVIDENCE
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedReport:
     document: RawDocument
     fields: list[ExtractedField] = field(default_factory=list)
@@ -36,7 +128,7 @@ class ExtractedReport:
     meta: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedObservation:
     code: str
     value: Value
@@ -45,11 +137,13 @@ class NormalizedObservation:
     ref_high: float | None = None
     source_name: str = ""
     confidence: float = 0.0
-    evidence: Evidence = field(default_factory=dict)
+    evidence: Evidence = EMPTY_EVIDENCE
     flags_raw: str = ""
+    comparator: str = ""
+    original_unit: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedReport:
     document: RawDocument
     observations: list[NormalizedObservation] = field(default_factory=list)
@@ -57,7 +151,7 @@ class NormalizedReport:
     meta: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class StandardPanel:
     data: dict[str, Any]
     warnings: list[str] = field(default_factory=list)
@@ -65,32 +159,156 @@ class StandardPanel:
     def to_dict(self) -> dict[str, Any]:
         return dict(self.data)
 
+    def to_json_bytes(self) -> bytes:
+        """The panel document as compact JSON; pipeline warnings are not part of it."""
 
-@dataclass
+        return dumps_json(self.data)
+
+    @classmethod
+    def from_json_bytes(cls, data: bytes | str) -> StandardPanel:
+        return cls(data=loads_json(data))
+
+    def to_msgpack(self) -> bytes:
+        return dumps_msgpack(self.data)
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> StandardPanel:
+        return cls(data=loads_msgpack(data))
+
+
+@dataclass(slots=True)
 class ValidationIssue:
     path: str
     description: str
     severity: Severity
 
 
-@dataclass
-class ValidationResult:
+class _SeverityIndex:
+    # Slots outside the dataclass fields: not part of __init__, eq, repr or asdict.
+    __slots__ = ("_errors", "_warnings")
+
+
+@dataclass(slots=True)
+class ValidationResult(_SeverityIndex):
+    """Validation outcome with issues bucketed by severity.
+
+    Validators fill it through `add`/`extend`; `errors`, `warnings` and their
+    counts are then served from the buckets. Issues appended to `issues`
+    directly are picked up on the next access.
+    """
+
     is_valid: bool
     issues: list[ValidationIssue] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self._reindex()
+
+    def add(self, issue: ValidationIssue) -> None:
+        self.issues.append(issue)
+        if issue.severity == "error":
+            self._errors.append(issue)
+            self.is_valid = False
+        else:
+            self._warnings.append(issue)
+
+    def extend(self, issues: Iterable[ValidationIssue]) -> None:
+        for issue in issues:
+            self.add(issue)
+
     @property
     def errors(self) -> list[ValidationIssue]:
-        return [issue for issue in self.issues if issue.severity == "error"]
+        self._sync()
+        return self._errors
 
     @property
     def warnings(self) -> list[ValidationIssue]:
-        return [issue for issue in self.issues if issue.severity == "warning"]
+        self._sync()
+        return self._warnings
 
+    @property
+    def error_count(self) -> int:
+        return len(self.errors)
 
-@dataclass
+    @property
+    def warning_count(self) -> int:
+        return len(self.warnings)
+
+    def _sync(self) -> None:
+        if len(self._errors) + len(self._warnings) != len(self.issues):
+            self._reindex()
+
+    def _reindex(self) -> None:
+        self._errors = [issue for issue in self.issues if issue.severity == "error"]
+        self._warnings = [issue for issue in self.issues if issue.severity != "error"]
+
+
+@dataclass(slots=True)
 class PipelineResult:
     document: RawDocument
     extracted: ExtractedReport
     normalized: NormalizedReport
     mapped: StandardPanel
     validation: ValidationResult
+
+    def to_wire(self) -> dict[str, Any]:
+        """Serializable layout of the result; the source document is stored once."""
+
+        return {
+            "document": self.document,
+            "extracted": {
+                "fields": self.extracted.fields,
+                "warnings": self.extracted.warnings,
+                "meta": self.extracted.meta,
+            },
+            "normalized": {
+                "observations": self.normalized.observations,
+                "warnings": self.normalized.warnings,
+                "meta": self.normalized.meta,
+            },
+            "mapped": self.mapped,
+            "validation": {
+                "is_valid": self.validation.is_valid,
+                "issues": self.validation.issues,
+            },
+        }
+
+    @classmethod
+    def from_wire(cls, payload: dict[str, Any]) -> PipelineResult:
+        document = RawDocument(**payload["document"])
+        extracted = payload["extracted"]
+        normalized = payload["normalized"]
+        validation = payload["validation"]
+        return cls(
+            document=document,
+            extracted=ExtractedReport(
+                document=document,
+                fields=[ExtractedField(**item) for item in extracted["fields"]],
+                warnings=extracted["warnings"],
+                meta=extracted["meta"],
+            ),
+            normalized=NormalizedReport(
+                document=document,
+                observations=[NormalizedObservation(**item) for item in normalized["observations"]],
+                warnings=normalized["warnings"],
+                meta=normalized["meta"],
+            ),
+            mapped=StandardPanel(**payload["mapped"]),
+            validation=ValidationResult(
+                is_valid=validation["is_valid"],
+                issues=[ValidationIssue(**item) for item in validation["issues"]],
+            ),
+        )
+
+    def to_json_bytes(self) -> bytes:
+        return dumps_json(self.to_wire())
+
+    @classmethod
+    def from_json_bytes(cls, data: bytes | str) -> PipelineResult:
+        return cls.from_wire(loads_json(data))
+
+    def to_msgpack(self) -> bytes:
+        return dumps_msgpack(self.to_wire())
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> PipelineResult:
+        return cls.from_wire(loads_msgpack(data))
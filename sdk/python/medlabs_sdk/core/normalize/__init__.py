@@ -1,13 +1,41 @@
-from medlabs_sdk.core.normalize.names import canonicalize_name
-from medlabs_sdk.core.normalize.numbers import parse_float, parse_range
-from medlabs_sdk.core.normalize.pipeline import normalize
-from medlabs_sdk.core.normalize.units import normalize_unit, unit_display
+from medlabs_sdk.core.normalize.conversion import DEFAULT_TARGET_UNITS, UnitConverter
+from medlabs_sdk.core.normalize.names import (
+    canonicalize_name,
+    name_cache_stats,
+    register_name_alias,
+)
+from medlabs_sdk.core.normalize.numbers import (
+    ParsedValue,
+    parse_float,
+    parse_range,
+    parse_value,
+)
+from medlabs_sdk.core.normalize.pipeline import normalize, normalize_many
+from medlabs_sdk.core.normalize.units import (
+    canonical_units,
+    normalize_unit,
+    register_unit_alias,
+    unit_aliases_version,
+    unit_cache_stats,
+    unit_display,
+)
 
 __all__ = [
+    "DEFAULT_TARGET_UNITS",
+    "ParsedValue",
+    "UnitConverter",
+    "canonical_units",
     "canonicalize_name",
+    "name_cache_stats",
     "normalize",
+    "normalize_many",
     "normalize_unit",
     "parse_float",
     "parse_range",
+    "parse_value",
+    "register_name_alias",
+    "register_unit_alias",
+    "unit_aliases_version",
+    "unit_cache_stats",
     "unit_display",
 ]
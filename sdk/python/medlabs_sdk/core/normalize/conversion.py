@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import replace
+
+from medlabs_sdk.core.models import NormalizedObservation
+
+# Mass and substance concentrations relative to g/L and mol/L (UCUM codes as
+# produced by `normalize_unit`).
+_MASS_UNITS: dict[str, float] = {"g/L": 1.0, "g/dL": 10.0, "mg/dL": 0.01, "mg/L": 0.001}
+_MOLAR_UNITS: dict[str, float] = {"mol/L": 1.0, "mmol/L": 1e-3, "umol/L": 1e-6}
+
+# g/mol. Urea nitrogen (BUN, common in US labs as mg/dL) has its own code: its
+# mass counts only the two nitrogen atoms of a urea molecule.
+_MOLAR_MASS: dict[str, float] = {
+    "glucose": 180.156,
+    "creatinine": 113.12,
+    "urea": 60.06,
+    "bun": 28.014,
+}
+
+# Targets must be units the bundled panel schemas accept (CBC allows only g/dL
+# for hemoglobin).
+DEFAULT_TARGET_UNITS: dict[str, str] = {
+    "glucose": "mmol/L",
+    "creatinine": "umol/L",
+    "urea": "mmol/L",
+    "bun": "mmol/L",
+    "hemoglobin": "g/dL",
+}
+
+
+class UnitConverter:
+    """Analyte-specific unit conversion compiled into one lookup table.
+
+    The table maps `(code, unit)` to `(target_unit, factor)` for every mass and
+    substance unit the analyte can be converted from; unknown pairs are left as
+    they are.
+    """
+
+    def __init__(self, target_units: Mapping[str, str] | None = None) -> None:
+        self.target_units = dict(DEFAULT_TARGET_UNITS if target_units is None else target_units)
+        self._table = _compile_table(self.target_units)
+
+    def factor(self, code: str, unit: str) -> tuple[str, float] | None:
+        return self._table.get((code, unit))
+
+    def convert(self, observation: NormalizedObservation) -> NormalizedObservation:
+        conversion = self._table.get((observation.code, observation.unit))
+        if conversion is None:
+            return observation
+        return _converted(observation, *conversion)
+
+    def convert_many(
+        self,
+        observations: list[NormalizedObservation],
+    ) -> list[NormalizedObservation]:
+        table = self._table
+        return [
+            observation
+            if (conversion := table.get((observation.code, observation.unit))) is None
+            else _converted(observation, *conversion)
+            for observation in observations
+        ]
+
+
+def _compile_table(target_units: Mapping[str, str]) -> dict[tuple[str, str], tuple[str, float]]:
+    table: dict[tuple[str, str], tuple[str, float]] = {}
+    for code, target in target_units.items():
+        molar_mass = _MOLAR_MASS.get(code)
+        # Everything is expressed in g/L first; substance units need a molar mass.
+        to_grams = dict(_MASS_UNITS)
+        if molar_mass is not None:
+            to_grams.update({unit: scale * molar_mass for unit, scale in _MOLAR_UNITS.items()})
+        if target not in to_grams:
+            raise ValueError(f"Cannot convert '{code}' to '{target}'")
+
+        for unit, scale in to_grams.items():
+            if unit != target:
+                table[(code, unit)] = (target, scale / to_grams[target])
+    return table
+
+
+def _converted(
+    observation: NormalizedObservation,
+    target_unit: str,
+    factor: float,
+) -> NormalizedObservation:
+    if not isinstance(observation.value, float):
+        # Text results ("Negative", "10-20") keep the unit they were reported in.
+        return observation
+    return replace(
+        observation,
+        value=_scaled(observation.value, factor),
+        unit=target_unit,
+        ref_low=_scaled(observation.ref_low, factor),
+        ref_high=_scaled(observation.ref_high, factor),
+        original_unit=observation.unit,
+    )
+
+
+def _scaled(value: float | None, factor: float) -> float | None:
+    if value is None:
+        return None
+    return round(value * factor, 4)
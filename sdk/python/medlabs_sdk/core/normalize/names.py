@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 import re
+import sys
+from functools import lru_cache
+from threading import Lock
+
+from medlabs_sdk.core.normalize.memo import MEMO_SIZE, memo_stats
 
 _ALIAS_MAP: dict[str, str] = {
     "wbc": "wbc",
@@ -14,6 +19,9 @@ _ALIAS_MAP: dict[str, str] = {
     "glucose": "glucose",
     "creatinine": "creatinine",
     "urea": "urea",
+    "bun": "bun",
+    "urea nitrogen": "bun",
+    "urea_nitrogen": "bun",
     "alt": "alt",
     "ast": "ast",
     "color": "color",
@@ -86,15 +94,51 @@ _ALIAS_MAP: dict[str, str] = {
 }
 
 
+_alias_lock = Lock()
+_alias_generation = 0
+
+
 def canonicalize_name(name: str) -> str:
+    return _canonicalize_name(name, _alias_generation)
+
+
+def register_name_alias(name: str, canonical: str) -> None:
+    """Map a raw analyte name to a canonical name at runtime.
+
+    Memoized results computed with the previous alias table are never served
+    again. Registration is per process: already running worker processes keep
+    their own tables.
+    """
+
+    global _alias_generation
+    key = _name_key(name)
+    if not key:
+        raise ValueError("Alias name must not be empty")
+    with _alias_lock:
+        _ALIAS_MAP[key] = sys.intern(canonical)
+        _alias_generation += 1
+    _canonicalize_name.cache_clear()
+
+
+def name_cache_stats() -> dict[str, float]:
+    return memo_stats(_canonicalize_name)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _canonicalize_name(name: str, generation: int) -> str:
+    # `generation` only takes part in the cache key.
+    del generation
+    key = _name_key(name)
+    if not key:
+        return ""
+    return sys.intern(_ALIAS_MAP.get(key, key))
+
+
+def _name_key(name: str) -> str:
     normalized = re.sub(r"\s+", " ", name.strip().lower().replace("ё", "е"))
     if not normalized:
         return ""
-
-    key = _tokenize_name(normalized)
-    if key in _ALIAS_MAP:
-        return _ALIAS_MAP[key]
-    return key
+    return _tokenize_name(normalized)
 
 
 def _tokenize_name(value: str) -> str:
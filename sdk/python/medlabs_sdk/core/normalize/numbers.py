@@ -1,32 +1,102 @@
 from __future__ import annotations
 
 import re
+from typing import Literal, NamedTuple
 
-_RANGE_RE = re.compile(r"(-?\d+(?:[\.,]\d+)?)\s*[-\u2013]\s*(-?\d+(?:[\.,]\d+)?)")
-_NUMBER_RE = re.compile(r"-?\d+(?:[\.,]\d+)?")
+ValueKind = Literal["empty", "number", "range", "comparator", "titer", "qualitative"]
 
+_NUMBER = r"-?\d+(?:[\.,]\d+)?"
+_RANGE = rf"(?P<low>{_NUMBER})\s*[-–]\s*(?P<high>{_NUMBER})"
+_RANGE_RE = re.compile(_RANGE)
+# One alternation for every numeric token a lab value can contain. At a given
+# position a range wins over a titer, a titer over a comparator and all of them
+# over a bare number; `lastgroup` names the token kind without further lookups.
+# The leading lookahead lets the scan skip letters without trying each branch.
+_TOKEN_RE = re.compile(
+    r"(?=[-\d<>≤≥])(?:"
+    rf"{_RANGE}"
+    r"|(?P<titer>\d+\s*:\s*\d+)"
+    rf"|(?P<comparator>[<>]=?|≤|≥)\s*(?P<bound>{_NUMBER})"
+    rf"|(?P<number>{_NUMBER}))"
+)
+_COMPARATORS = {"≤": "<=", "≥": ">="}
 
-def parse_float(value_raw: str) -> float | None:
-    value = value_raw.strip()
-    if not value or _RANGE_RE.search(value):
-        return None
 
-    match = _NUMBER_RE.search(value)
-    if not match:
-        return None
+class ParsedValue(NamedTuple):
+    kind: ValueKind
+    number: float | None = None
+    low: float | None = None
+    high: float | None = None
+    comparator: str = ""
+    text: str = ""
+
+
+_EMPTY = ParsedValue(kind="empty")
+
+
+def _parsed(
+    kind: ValueKind,
+    number: float | None,
+    low: float | None,
+    high: float | None,
+    comparator: str,
+    text: str,
+) -> ParsedValue:
+    # Positional tuple construction; NamedTuple keyword defaults cost several
+    # times more than the regex scan itself.
+    return tuple.__new__(ParsedValue, (kind, number, low, high, comparator, text))
+
+
+def parse_value(value_raw: str) -> ParsedValue:
+    """Classify a lab value string.
+
+    A range anywhere in the string makes it a range (first range wins); otherwise
+    the first numeric token decides between titer (`1:160`), comparator
+    (`<0.5`, `>=100`) and plain number. Strings without digits are qualitative.
+    """
 
-    return float(match.group(0).replace(",", "."))
+    text = value_raw.strip()
+    if not text:
+        return _EMPTY
+
+    match = _TOKEN_RE.search(text)
+    if match is None:
+        return _parsed("qualitative", None, None, None, "", text)
+
+    token = match.lastgroup
+    if token != "high" and match.end() < len(text):
+        # A later range still makes the whole value a range, as parse_float
+        # always treated it. The rescan starts inside the first token so that a
+        # range sharing its number ('<5-10', '1:5-10') is not read as a bound.
+        later = _RANGE_RE.search(text, match.start() + 1)
+        if later is not None:
+            match, token = later, "high"
+
+    if token == "high":
+        low, high = match.group("low", "high")
+        return _parsed("range", None, _to_float(low), _to_float(high), "", text)
+    if token == "number":
+        return _parsed("number", _to_float(match.group("number")), None, None, "", text)
+    if token == "bound":
+        comparator, bound = match.group("comparator", "bound")
+        comparator = _COMPARATORS.get(comparator, comparator)
+        return _parsed("comparator", _to_float(bound), None, None, comparator, text)
+    return _parsed("titer", None, None, None, "", text)
+
+
+def parse_float(value_raw: str) -> float | None:
+    """Numeric part of a single value; None for ranges, titers and text."""
+
+    return parse_value(value_raw).number
 
 
 def parse_range(ref_raw: str) -> tuple[float | None, float | None]:
-    ref = ref_raw.strip()
-    if not ref:
+    match = _RANGE_RE.search(ref_raw)
+    if match is None:
         return None, None
+    low, high = match.group("low", "high")
+    return _to_float(low), _to_float(high)
 
-    match = _RANGE_RE.search(ref)
-    if not match:
-        return None, None
 
-    low = float(match.group(1).replace(",", "."))
-    high = float(match.group(2).replace(",", "."))
-    return low, high
+def _to_float(number: str) -> float:
+    return float(number.replace(",", ".", 1))
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
 from medlabs_sdk.core.models import ExtractedReport, NormalizedObservation, NormalizedReport
+from medlabs_sdk.core.normalize.conversion import UnitConverter
 from medlabs_sdk.core.normalize.names import canonicalize_name
-from medlabs_sdk.core.normalize.numbers import parse_float, parse_range
+from medlabs_sdk.core.normalize.numbers import parse_range, parse_value
 from medlabs_sdk.core.normalize.units import normalize_unit
 
+_T = TypeVar("_T")
+
 
-def normalize(report: ExtractedReport) -> NormalizedReport:
+def normalize(
+    report: ExtractedReport,
+    *,
+    converter: UnitConverter | None = None,
+) -> NormalizedReport:
     warnings = list(report.warnings)
     observations: list[NormalizedObservation] = []
 
@@ -16,8 +26,8 @@ def normalize(report: ExtractedReport) -> NormalizedReport:
             warnings.append(f"Field {index} has empty name")
             continue
 
-        numeric_value = parse_float(field.value_raw)
-        normalized_value = numeric_value if numeric_value is not None else field.value_raw.strip()
+        parsed = parse_value(field.value_raw)
+        normalized_value = parsed.number if parsed.number is not None else field.value_raw.strip()
 
         ref_low, ref_high = parse_range(field.ref_raw)
         if field.ref_raw.strip() and ref_low is None and ref_high is None:
@@ -28,6 +38,7 @@ def normalize(report: ExtractedReport) -> NormalizedReport:
                 code=code,
                 value=normalized_value,
                 unit=normalize_unit(field.unit_raw),
+                comparator=parsed.comparator,
                 ref_low=ref_low,
                 ref_high=ref_high,
                 source_name=field.name_raw,
@@ -37,9 +48,82 @@ def normalize(report: ExtractedReport) -> NormalizedReport:
             )
         )
 
+    if converter is not None:
+        observations = converter.convert_many(observations)
+
     return NormalizedReport(
         document=report.document,
         observations=observations,
         warnings=warnings,
         meta=dict(report.meta),
     )
+
+
+def normalize_many(
+    reports: Iterable[ExtractedReport],
+    *,
+    converter: UnitConverter | None = None,
+) -> list[NormalizedReport]:
+    """Normalize a batch of reports column by column.
+
+    Names, values, units and reference ranges of all fields are gathered into
+    columns and each distinct raw string is parsed once, which pays off on lab
+    data where the same names, units and ranges repeat across documents.
+    Every report comes out identical to `normalize(report, converter=converter)`.
+    """
+
+    reports = list(reports)
+    fields = [field for report in reports for field in report.fields]
+    codes = _map_distinct(canonicalize_name, [field.name_raw for field in fields])
+    values = _map_distinct(parse_value, [field.value_raw for field in fields])
+    units = _map_distinct(normalize_unit, [field.unit_raw for field in fields])
+    ranges = _map_distinct(parse_range, [field.ref_raw for field in fields])
+
+    normalized_reports: list[NormalizedReport] = []
+    offset = 0
+    for report in reports:
+        warnings = list(report.warnings)
+        observations: list[NormalizedObservation] = []
+        for index, field in enumerate(report.fields):
+            row = offset + index
+            code = codes[row]
+            if not code:
+                warnings.append(f"Field {index} has empty name")
+                continue
+
+            parsed = values[row]
+            ref_low, ref_high = ranges[row]
+            if ref_low is None and ref_high is None and field.ref_raw.strip():
+                warnings.append(f"Field '{field.name_raw}' has unparsed reference range")
+
+            observations.append(
+                NormalizedObservation(
+                    code=code,
+                    value=parsed.number if parsed.number is not None else field.value_raw.strip(),
+                    unit=units[row],
+                    comparator=parsed.comparator,
+                    ref_low=ref_low,
+                    ref_high=ref_high,
+                    source_name=field.name_raw,
+                    confidence=field.confidence,
+                    evidence=field.evidence,
+                    flags_raw=field.flags_raw,
+                )
+            )
+        if converter is not None:
+            observations = converter.convert_many(observations)
+        offset += len(report.fields)
+        normalized_reports.append(
+            NormalizedReport(
+                document=report.document,
+                observations=observations,
+                warnings=warnings,
+                meta=dict(report.meta),
+            )
+        )
+    return normalized_reports
+
+
+def _map_distinct(func: Callable[[str], _T], column: list[str]) -> list[_T]:
+    lookup = {raw: func(raw) for raw in dict.fromkeys(column)}
+    return [lookup[raw] for raw in column]
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import sys
+from functools import lru_cache
+from threading import Lock
+
+from medlabs_sdk.core.normalize.memo import MEMO_SIZE, memo_stats
+
 _UNIT_ALIASES: dict[str, str] = {
     "g/l": "g/L",
     "г/л": "g/L",
@@ -7,6 +13,10 @@ _UNIT_ALIASES: dict[str, str] = {
     "г/дл": "g/dL",
     "mg/dl": "mg/dL",
     "мг/дл": "mg/dL",
+    "mg/l": "mg/L",
+    "мг/л": "mg/L",
+    "mol/l": "mol/L",
+    "моль/л": "mol/L",
     "mmol/l": "mmol/L",
     "ммоль/л": "mmol/L",
     "umol/l": "umol/L",
@@ -56,11 +66,47 @@ _UNIT_DISPLAY: dict[str, str] = {
 }
 
 
+_alias_lock = Lock()
+_alias_generation = 0
+
+
 def normalize_unit(unit_raw: str) -> str:
+    return _normalize_unit(unit_raw, _alias_generation)
+
+
+def register_unit_alias(unit_raw: str, unit: str) -> None:
+    """Map a raw unit spelling to a UCUM unit at runtime (see `register_name_alias`)."""
+
+    global _alias_generation
+    with _alias_lock:
+        _UNIT_ALIASES[_normalize_unit_key(unit_raw)] = sys.intern(unit)
+        _alias_generation += 1
+    _normalize_unit.cache_clear()
+
+
+def unit_aliases_version() -> int:
+    """Bumped by every `register_unit_alias`; caches built from the aliases compare it."""
+
+    return _alias_generation
+
+
+def canonical_units() -> frozenset[str]:
+    """Every UCUM unit the alias table maps to."""
+
+    with _alias_lock:
+        return frozenset(_UNIT_ALIASES.values())
+
+
+def unit_cache_stats() -> dict[str, float]:
+    return memo_stats(_normalize_unit)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _normalize_unit(unit_raw: str, generation: int) -> str:
+    # `generation` only takes part in the cache key.
+    del generation
     key = _normalize_unit_key(unit_raw)
-    if key in _UNIT_ALIASES:
-        return _UNIT_ALIASES[key]
-    return unit_raw.strip()
+    return sys.intern(_UNIT_ALIASES.get(key, unit_raw.strip()))
 
 
 def unit_display(unit: str) -> str:
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from time import perf_counter
+
+
+def elapsed_ms(start: float) -> float:
+    """Milliseconds since `start`, a `perf_counter()` reading.
+
+    Rounded to the microsecond: most deterministic steps finish well under 1 ms.
+    """
+
+    return round((perf_counter() - start) * 1000, 3)
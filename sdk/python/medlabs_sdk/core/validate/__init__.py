@@ -1,4 +1,17 @@
-from medlabs_sdk.core.validate.jsonschema import validate_jsonschema
+from medlabs_sdk.core.validate.jsonschema import (
+    ValidationMode,
+    clear_validator_cache,
+    schema_content_fingerprint,
+    validate_jsonschema,
+    warm_validators,
+)
 from medlabs_sdk.core.validate.rules import validate_rules
 
-__all__ = ["validate_jsonschema", "validate_rules"]
+__all__ = [
+    "ValidationMode",
+    "clear_validator_cache",
+    "schema_content_fingerprint",
+    "validate_jsonschema",
+    "validate_rules",
+    "warm_validators",
+]
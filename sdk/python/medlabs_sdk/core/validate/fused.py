@@ -0,0 +1,602 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from medlabs_sdk.core.models import ValidationIssue, ValidationResult
+
+# Hand-compiled form of the bundled v0.1 schemas (core.json plus the per-panel
+# wrappers) fused with the cross-field rules of `validate_rules`, so a panel is
+# checked in one walk. Issues mirror what jsonschema reports for the same
+# payload, including messages and the duplicates that come from the panel
+# schemas re-applying core definitions (`panel_code` is checked against Coding
+# twice; CBC re-checks every observation). `tests/test_validate.py` compares
+# both engines; any change to the bundled schemas must be mirrored here.
+
+# `schema_content_fingerprint` of the bundled schemas this module mirrors. When
+# the files on disk no longer match, `validate_jsonschema` falls back to the
+# reference engine; update this value only together with the code below.
+SCHEMA_FINGERPRINT = "1a12bffc878dc5bf9f63528af22dbf5225b272fd494ab23e332ba2243c84a00a"
+
+JsonPath = tuple[str | int, ...]
+Error = tuple[JsonPath, str]
+
+_STATUSES = ["final", "preliminary", "amended", "corrected", "unknown"]
+_INTERPRETATIONS = ["low", "high", "normal", "abnormal", "critical", "unknown"]
+
+_CODING_KEYS = frozenset({"system", "code", "display"})
+_QUANTITY_KEYS = frozenset({"value", "unit_code", "unit_system", "unit_display"})
+_SPECIMEN_KEYS = frozenset({"type", "body_site", "collected_at", "specimen_id"})
+_OBSERVATION_REQUIRED = ("id", "resource_type", "code", "value", "status", "source")
+_MISSING = object()
+_STATUS_SET = frozenset(_STATUSES)
+_INTERPRETATION_SET = frozenset(_INTERPRETATIONS)
+_PANEL_REQUIRED = (
+    "id",
+    "resource_type",
+    "standard_version",
+    "panel_code",
+    "status",
+    "observations",
+    "source",
+)
+_SOURCE_REQUIRED = ("document_id", "lab_name", "report_date")
+
+
+@dataclass(frozen=True, slots=True)
+class _PanelSpec:
+    code: str
+    display: str
+    # Allowed quantity units; only the CBC schema restricts them, and it does so
+    # by re-declaring `observations`, which validates every item a second time.
+    unit_codes: tuple[str, ...] | None = None
+
+
+_PANEL_SPECS: dict[str, _PanelSpec] = {
+    "CBC": _PanelSpec(
+        code="CBC",
+        display="Complete Blood Count",
+        unit_codes=("10*9/L", "10*12/L", "g/dL", "%", "fL", "mm/h"),
+    ),
+    "BIOCHEM": _PanelSpec(code="BIOCHEM", display="Biochemistry Panel"),
+    "URINALYSIS": _PanelSpec(code="URINALYSIS", display="Urinalysis Panel"),
+}
+
+
+def fused_panel_spec(panel_code: str) -> _PanelSpec | None:
+    return _PANEL_SPECS.get(panel_code.strip().upper())
+
+
+def validate_fused(
+    payload: dict[str, Any],
+    spec: _PanelSpec,
+    *,
+    fail_fast: bool = False,
+) -> ValidationResult:
+    errors: list[Error] = []
+    rule_issues: list[ValidationIssue] = []
+    _panel(payload, spec, errors, rule_issues)
+
+    result = ValidationResult(is_valid=True)
+    # Same order as the reference engine: schema errors sorted by path, then rules.
+    errors.sort(key=lambda item: item[0])
+    for path, message in errors:
+        result.add(ValidationIssue(path=_pointer(path), description=message, severity="error"))
+        if fail_fast:
+            return result
+    for issue in rule_issues:
+        result.add(issue)
+        if fail_fast and issue.severity == "error":
+            break
+    return result
+
+
+def _pointer(path: JsonPath) -> str:
+    return "/" + "/".join(str(part) for part in path) if path else "/"
+
+
+def _panel(
+    payload: dict[str, Any],
+    spec: _PanelSpec,
+    errors: list[Error],
+    rule_issues: list[ValidationIssue],
+) -> None:
+    for key in _PANEL_REQUIRED:
+        if key not in payload:
+            errors.append(((), f"{key!r} is a required property"))
+
+    extras = []
+    observations_seen = False
+    for key, value in payload.items():
+        path = (key,)
+        if key in ("id", "collected_at", "reported_at", "notes"):
+            _string(value, path, errors)
+        elif key == "resource_type":
+            _string(value, path, errors)
+            _const(value, "panel", path, errors)
+        elif key == "standard_version":
+            _string(value, path, errors)
+            _const(value, "0.1", path, errors)
+        elif key == "panel_code":
+            _panel_code(value, spec, path, errors)
+        elif key == "panel_name":
+            _string(value, path, errors)
+            _const(value, spec.display, path, errors)
+        elif key == "status":
+            _enum(value, _STATUSES, path, errors)
+        elif key == "specimen":
+            _specimen(value, path, errors)
+        elif key == "source":
+            _source(value, path, errors)
+        elif key == "observations":
+            observations_seen = True
+            _observations(value, spec, path, errors, rule_issues)
+        else:
+            extras.append(key)
+    _additional(extras, (), errors)
+
+    if not observations_seen:
+        rule_issues.append(
+            ValidationIssue(
+                path="/observations",
+                description="observations must be an array",
+                severity="error",
+            )
+        )
+
+
+def _observations(
+    value: Any,
+    spec: _PanelSpec,
+    path: JsonPath,
+    errors: list[Error],
+    rule_issues: list[ValidationIssue],
+) -> None:
+    passes = 1 if spec.unit_codes is None else 2
+    if not isinstance(value, list):
+        errors.extend([(path, f"{value!r} is not of type 'array'")] * passes)
+        rule_issues.append(
+            ValidationIssue(
+                path="/observations",
+                description="observations must be an array",
+                severity="error",
+            )
+        )
+        return
+    if not value:
+        errors.append((path, "[] should be non-empty"))
+
+    # Errors of the core Observation definition are repeated once per pass.
+    observation_errors: list[Error] = []
+    unit_codes = spec.unit_codes
+    for index, observation in enumerate(value):
+        if type(observation) is dict and _valid_observation(observation, unit_codes):
+            # Schema-valid: only the rules can still report something.
+            _observation_rules(observation, index, rule_issues)
+            continue
+
+        item_path = (*path, index)
+        if not isinstance(observation, dict):
+            observation_errors.append((item_path, f"{observation!r} is not of type 'object'"))
+            rule_issues.append(
+                ValidationIssue(
+                    path=f"/observations/{index}",
+                    description="observation must be an object",
+                    severity="error",
+                )
+            )
+            continue
+        _observation(observation, item_path, observation_errors)
+        _observation_rules(observation, index, rule_issues)
+
+        if unit_codes is not None:
+            quantity = observation.get("value")
+            if isinstance(quantity, dict):
+                unit_code = quantity.get("unit_code")
+                if isinstance(unit_code, str) and unit_code not in unit_codes:
+                    errors.append(
+                        (
+                            (*item_path, "value", "unit_code"),
+                            f"{unit_code!r} is not one of {list(unit_codes)!r}",
+                        )
+                    )
+    errors.extend(observation_errors * passes)
+
+
+def _valid_observation(observation: dict[str, Any], unit_codes: tuple[str, ...] | None) -> bool:
+    """Fast yes/no check of one observation; a False answer is explained by `_observation`.
+
+    Stricter than the schema (exact builtin types), never more lenient.
+    """
+
+    get = observation.get
+    status = get("status")
+    if not (
+        type(get("id")) is str
+        and get("resource_type") == "observation"
+        and type(status) is str
+        and status in _STATUS_SET
+        and "value" in observation
+        and _valid_coding(get("code"))
+        and _valid_source(get("source"))
+    ):
+        return False
+
+    value = observation["value"]
+    if type(value) is dict:
+        if not _valid_quantity(value):
+            return False
+        if unit_codes is not None and value["unit_code"] not in unit_codes:
+            return False
+    elif not (value is None or type(value) is str or type(value) is bool):
+        return False
+
+    # Counting the optional keys that passed rules out unknown ones.
+    known = len(_OBSERVATION_REQUIRED)
+    item = get("reference_range", _MISSING)
+    if item is not _MISSING:
+        if not _valid_reference_range(item):
+            return False
+        known += 1
+    item = get("interpretation", _MISSING)
+    if item is not _MISSING:
+        if type(item) is not str or item not in _INTERPRETATION_SET:
+            return False
+        known += 1
+    item = get("effective_time", _MISSING)
+    if item is not _MISSING:
+        if type(item) is not str:
+            return False
+        known += 1
+    item = get("specimen", _MISSING)
+    if item is not _MISSING:
+        if not (
+            type(item) is dict
+            and item.keys() <= _SPECIMEN_KEYS
+            and all(type(part) is str for part in item.values())
+        ):
+            return False
+        known += 1
+    return len(observation) == known
+
+
+def _valid_coding(value: Any) -> bool:
+    return (
+        type(value) is dict
+        and len(value) == 3
+        and type(value.get("system")) is str
+        and type(value.get("code")) is str
+        and type(value.get("display")) is str
+    )
+
+
+def _valid_quantity(value: dict[str, Any]) -> bool:
+    number = value.get("value")
+    return (
+        (type(number) is float or type(number) is int)
+        and type(value.get("unit_code")) is str
+        and value.get("unit_system") == "UCUM"
+        and (len(value) == 3 or (len(value) == 4 and type(value.get("unit_display")) is str))
+    )
+
+
+def _valid_reference_range(value: Any) -> bool:
+    if type(value) is not dict or not value:
+        return False
+    known = 0
+    for key in ("low", "high"):
+        bound = value.get(key, _MISSING)
+        if bound is not _MISSING:
+            if type(bound) is not dict or not _valid_quantity(bound):
+                return False
+            known += 1
+    text = value.get("text", _MISSING)
+    if text is not _MISSING:
+        if type(text) is not str:
+            return False
+        known += 1
+    return len(value) == known
+
+
+def _valid_source(value: Any) -> bool:
+    if not (
+        type(value) is dict
+        and type(value.get("document_id")) is str
+        and type(value.get("lab_name")) is str
+        and type(value.get("report_date")) is str
+    ):
+        return False
+    known = len(_SOURCE_REQUIRED)
+    for key in ("page", "line"):
+        number = value.get(key, _MISSING)
+        if number is not _MISSING:
+            if type(number) is not int or number < 1:
+                return False
+            known += 1
+    raw_text = value.get("raw_text", _MISSING)
+    if raw_text is not _MISSING:
+        if type(raw_text) is not str:
+            return False
+        known += 1
+    bbox = value.get("bbox", _MISSING)
+    if bbox is not _MISSING:
+        if not (type(bbox) is list and len(bbox) == 4 and all(map(_is_number, bbox))):
+            return False
+        known += 1
+    return len(value) == known
+
+
+def _observation(observation: dict[str, Any], path: JsonPath, errors: list[Error]) -> None:
+    for key in _OBSERVATION_REQUIRED:
+        if key not in observation:
+            errors.append((path, f"{key!r} is a required property"))
+
+    extras = []
+    for key, value in observation.items():
+        if key == "value":
+            if not (value is None or isinstance(value, str | bool) or _is_quantity(value)):
+                errors.append(
+                    ((*path, key), f"{value!r} is not valid under any of the given schemas")
+                )
+        elif key in ("id", "effective_time"):
+            _string(value, (*path, key), errors)
+        elif key == "resource_type":
+            _string(value, (*path, key), errors)
+            _const(value, "observation", (*path, key), errors)
+        elif key == "code":
+            _coding(value, (*path, key), errors)
+        elif key == "status":
+            _enum(value, _STATUSES, (*path, key), errors)
+        elif key == "source":
+            _source(value, (*path, key), errors)
+        elif key == "reference_range":
+            _reference_range(value, (*path, key), errors)
+        elif key == "interpretation":
+            _enum(value, _INTERPRETATIONS, (*path, key), errors)
+        elif key == "specimen":
+            _specimen(value, (*path, key), errors)
+        else:
+            extras.append(key)
+    _additional(extras, path, errors)
+
+
+def _observation_rules(
+    observation: dict[str, Any],
+    index: int,
+    rule_issues: list[ValidationIssue],
+) -> None:
+    # The checks of `validate_rules`, issued in the same order.
+    value = observation.get("value")
+    reference_range = observation.get("reference_range")
+    prefix = f"/observations/{index}"
+
+    if isinstance(value, dict):
+        value_unit_code = value.get("unit_code")
+        value_unit_system = value.get("unit_system")
+        if not value_unit_code:
+            rule_issues.append(
+                ValidationIssue(
+                    path=f"{prefix}/value/unit_code",
+                    description="unit_code is required for quantity values",
+                    severity="error",
+                )
+            )
+        if value_unit_system and value_unit_system != "UCUM":
+            rule_issues.append(
+                ValidationIssue(
+                    path=f"{prefix}/value/unit_system",
+                    description="unit_system should be UCUM",
+                    severity="warning",
+                )
+            )
+        if isinstance(reference_range, dict):
+            for bound_key in ("low", "high"):
+                bound = reference_range.get(bound_key)
+                if not isinstance(bound, dict):
+                    continue
+                bound_unit_code = bound.get("unit_code")
+                bound_unit_system = bound.get("unit_system")
+                if value_unit_code and bound_unit_code and value_unit_code != bound_unit_code:
+                    rule_issues.append(
+                        ValidationIssue(
+                            path=f"{prefix}/reference_range/{bound_key}/unit_code",
+                            description="must match value.unit_code",
+                            severity="error",
+                        )
+                    )
+                if (
+                    value_unit_system
+                    and bound_unit_system
+                    and value_unit_system != bound_unit_system
+                ):
+                    rule_issues.append(
+                        ValidationIssue(
+                            path=f"{prefix}/reference_range/{bound_key}/unit_system",
+                            description="must match value.unit_system",
+                            severity="error",
+                        )
+                    )
+    elif isinstance(reference_range, dict) and (
+        isinstance(reference_range.get("low"), dict)
+        or isinstance(reference_range.get("high"), dict)
+    ):
+        rule_issues.append(
+            ValidationIssue(
+                path=f"{prefix}/reference_range",
+                description=(
+                    "reference_range with numeric bounds is ignored for non-quantity values"
+                ),
+                severity="warning",
+            )
+        )
+
+
+def _panel_code(value: Any, spec: _PanelSpec, path: JsonPath, errors: list[Error]) -> None:
+    # Panel's Coding, the panel schema's own Coding, then its constant object.
+    coding_errors: list[Error] = []
+    _coding(value, path, coding_errors)
+    errors.extend(coding_errors * 2)
+    if not isinstance(value, dict):
+        errors.append((path, f"{value!r} is not of type 'object'"))
+        return
+    expected_values = (("system", "MEDLABS-PANEL"), ("code", spec.code), ("display", spec.display))
+    for key, expected in expected_values:
+        if key in value:
+            _const(value[key], expected, (*path, key), errors)
+    for key in ("system", "code", "display"):
+        if key not in value:
+            errors.append((path, f"{key!r} is a required property"))
+
+
+def _coding(value: Any, path: JsonPath, errors: list[Error]) -> None:
+    if not isinstance(value, dict):
+        errors.append((path, f"{value!r} is not of type 'object'"))
+        return
+    for key in ("system", "code", "display"):
+        if key not in value:
+            errors.append((path, f"{key!r} is a required property"))
+    extras = []
+    for key, item in value.items():
+        if key in _CODING_KEYS:
+            _string(item, (*path, key), errors)
+        else:
+            extras.append(key)
+    _additional(extras, path, errors)
+
+
+def _is_quantity(value: Any) -> bool:
+    return (
+        isinstance(value, dict)
+        and value.keys() <= _QUANTITY_KEYS
+        and "value" in value
+        and "unit_code" in value
+        and value.get("unit_system") == "UCUM"
+        and _is_number(value["value"])
+        and isinstance(value["unit_code"], str)
+        and isinstance(value.get("unit_display", ""), str)
+    )
+
+
+def _quantity(value: Any, path: JsonPath, errors: list[Error]) -> None:
+    if not isinstance(value, dict):
+        errors.append((path, f"{value!r} is not of type 'object'"))
+        return
+    for key in ("value", "unit_code", "unit_system"):
+        if key not in value:
+            errors.append((path, f"{key!r} is a required property"))
+    extras = []
+    for key, item in value.items():
+        if key == "value":
+            if not _is_number(item):
+                errors.append(((*path, key), f"{item!r} is not of type 'number'"))
+        elif key in ("unit_code", "unit_display"):
+            _string(item, (*path, key), errors)
+        elif key == "unit_system":
+            _string(item, (*path, key), errors)
+            _const(item, "UCUM", (*path, key), errors)
+        else:
+            extras.append(key)
+    _additional(extras, path, errors)
+
+
+def _reference_range(value: Any, path: JsonPath, errors: list[Error]) -> None:
+    if not isinstance(value, dict):
+        errors.append((path, f"{value!r} is not of type 'object'"))
+        return
+    extras = []
+    for key, item in value.items():
+        if key in ("low", "high"):
+            _quantity(item, (*path, key), errors)
+        elif key == "text":
+            _string(item, (*path, key), errors)
+        else:
+            extras.append(key)
+    if "low" not in value and "high" not in value and "text" not in value:
+        errors.append((path, f"{value!r} is not valid under any of the given schemas"))
+    _additional(extras, path, errors)
+
+
+def _specimen(value: Any, path: JsonPath, errors: list[Error]) -> None:
+    if not isinstance(value, dict):
+        errors.append((path, f"{value!r} is not of type 'object'"))
+        return
+    extras = []
+    for key, item in value.items():
+        if key in _SPECIMEN_KEYS:
+            _string(item, (*path, key), errors)
+        else:
+            extras.append(key)
+    _additional(extras, path, errors)
+
+
+def _source(value: Any, path: JsonPath, errors: list[Error]) -> None:
+    if not isinstance(value, dict):
+        errors.append((path, f"{value!r} is not of type 'object'"))
+        return
+    for key in _SOURCE_REQUIRED:
+        if key not in value:
+            errors.append((path, f"{key!r} is a required property"))
+    extras = []
+    for key, item in value.items():
+        if key in ("document_id", "lab_name", "report_date", "raw_text"):
+            _string(item, (*path, key), errors)
+        elif key in ("page", "line"):
+            if not _is_integer(item):
+                errors.append(((*path, key), f"{item!r} is not of type 'integer'"))
+            if _is_number(item) and item < 1:
+                errors.append(((*path, key), f"{item!r} is less than the minimum of 1"))
+        elif key == "bbox":
+            _bbox(item, (*path, key), errors)
+        else:
+            extras.append(key)
+    _additional(extras, path, errors)
+
+
+def _bbox(value: Any, path: JsonPath, errors: list[Error]) -> None:
+    if not isinstance(value, list):
+        errors.append((path, f"{value!r} is not of type 'array'"))
+        return
+    for index, item in enumerate(value):
+        if not _is_number(item):
+            errors.append(((*path, index), f"{item!r} is not of type 'number'"))
+    if len(value) < 4:
+        errors.append((path, f"{value!r} is too short"))
+    elif len(value) > 4:
+        errors.append((path, f"{value!r} is too long"))
+
+
+def _string(value: Any, path: JsonPath, errors: list[Error]) -> None:
+    if not isinstance(value, str):
+        errors.append((path, f"{value!r} is not of type 'string'"))
+
+
+def _const(value: Any, expected: str, path: JsonPath, errors: list[Error]) -> None:
+    if not (isinstance(value, str) and value == expected):
+        errors.append((path, f"{expected!r} was expected"))
+
+
+def _enum(value: Any, allowed: list[str], path: JsonPath, errors: list[Error]) -> None:
+    # Every enum in the schema also declares `type: string`.
+    if not isinstance(value, str):
+        errors.append((path, f"{value!r} is not of type 'string'"))
+        errors.append((path, f"{value!r} is not one of {allowed!r}"))
+    elif value not in allowed:
+        errors.append((path, f"{value!r} is not one of {allowed!r}"))
+
+
+def _additional(extras: list[str], path: JsonPath, errors: list[Error]) -> None:
+    if extras:
+        extras.sort(key=str)
+        verb = "was" if len(extras) == 1 else "were"
+        joined = ", ".join(repr(extra) for extra in extras)
+        errors.append((path, f"Additional properties are not allowed ({joined} {verb} unexpected)"))
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
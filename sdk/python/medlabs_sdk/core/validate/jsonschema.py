@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from medlabs_sdk.core.models import ValidationIssue, ValidationResult
+from medlabs_sdk.core.validate.fused import (
+    SCHEMA_FINGERPRINT,
+    fused_panel_spec,
+    validate_fused,
+)
 from medlabs_sdk.core.validate.rules import validate_rules
 
+ValidationMode = Literal["fused", "reference"]
+
 _SCHEMA_BY_PANEL: dict[str, str] = {
     "CBC": "cbc.json",
     "BIOCHEM": "biochem.json",
@@ -18,6 +29,10 @@ def _default_schema_dir() -> Path:
     return Path(__file__).resolve().parents[5] / "standard" / "schema" / "v0.1"
 
 
+def _is_default_schema_dir(schema_dir: str | Path | None) -> bool:
+    return schema_dir is None or Path(schema_dir).resolve() == _default_schema_dir()
+
+
 def _schema_path_for_panel(panel_code: str, schema_dir: Path | None = None) -> Path:
     normalized = panel_code.strip().upper()
     filename = _SCHEMA_BY_PANEL.get(normalized)
@@ -27,7 +42,25 @@ def _schema_path_for_panel(panel_code: str, schema_dir: Path | None = None) -> P
     return root / filename
 
 
-def _jsonschema_issues(payload: dict[str, Any], schema_path: Path) -> list[ValidationIssue]:
+@dataclass(frozen=True)
+class _CachedValidator:
+    fingerprint: tuple[tuple[str, int, int], ...]
+    validator: Any
+
+
+_VALIDATOR_CACHE: dict[tuple[str, str], _CachedValidator] = {}
+_VALIDATOR_CACHE_LOCK = threading.Lock()
+
+
+def _schema_dir_fingerprint(schema_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    entries: list[tuple[str, int, int]] = []
+    for candidate in sorted(schema_dir.glob("*.json")):
+        stat = candidate.stat()
+        entries.append((candidate.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+def _build_validator(schema_path: Path) -> Any:
     try:
         from jsonschema import Draft202012Validator
         from referencing import Registry, Resource
@@ -45,20 +78,113 @@ def _jsonschema_issues(payload: dict[str, Any], schema_path: Path) -> list[Valid
         if isinstance(schema_id, str) and schema_id:
             registry = registry.with_resource(schema_id, resource)
 
-    validator = Draft202012Validator(schema, registry=registry)
+    # Resolve every known resource up front so the first validation does not pay for it.
+    return Draft202012Validator(schema, registry=registry.crawl())
 
-    issues: list[ValidationIssue] = []
-    for error in sorted(validator.iter_errors(payload), key=lambda item: list(item.absolute_path)):
-        path_parts = [str(part) for part in error.absolute_path]
-        path = "/" + "/".join(path_parts) if path_parts else "/"
-        issues.append(
-            ValidationIssue(
-                path=path,
-                description=error.message,
-                severity="error",
-            )
+
+def _compiled_validator(schema_path: Path) -> Any:
+    """Return a cached validator, rebuilding it when any schema in the dir has changed."""
+
+    resolved_path = schema_path.resolve()
+    cache_key = (str(resolved_path.parent), resolved_path.name)
+    fingerprint = _schema_dir_fingerprint(resolved_path.parent)
+
+    cached = _VALIDATOR_CACHE.get(cache_key)
+    if cached is not None and cached.fingerprint == fingerprint:
+        return cached.validator
+
+    with _VALIDATOR_CACHE_LOCK:
+        cached = _VALIDATOR_CACHE.get(cache_key)
+        if cached is not None and cached.fingerprint == fingerprint:
+            return cached.validator
+        validator = _build_validator(resolved_path)
+        _VALIDATOR_CACHE[cache_key] = _CachedValidator(
+            fingerprint=fingerprint,
+            validator=validator,
         )
-    return issues
+        return validator
+
+
+def schema_content_fingerprint(schema_dir: str | Path) -> str:
+    """SHA-256 of the JSON schemas in `schema_dir`, insensitive to formatting."""
+
+    digest = hashlib.sha256()
+    for candidate in sorted(Path(schema_dir).glob("*.json")):
+        schema = json.loads(candidate.read_text(encoding="utf-8"))
+        canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        digest.update(candidate.name.encode("utf-8") + b"\0")
+        digest.update(canonical.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+_FUSED_SCHEMA_CHECK: dict[str, tuple[tuple[tuple[str, int, int], ...], bool]] = {}
+
+
+def _fused_matches_bundled_schemas() -> bool:
+    """Whether the bundled schemas on disk are the ones `fused.py` was written against.
+
+    Hashed again only when a file's mtime or size changes, like the validator cache.
+    """
+
+    schema_dir = _default_schema_dir()
+    stat_fingerprint = _schema_dir_fingerprint(schema_dir)
+    cached = _FUSED_SCHEMA_CHECK.get(str(schema_dir))
+    if cached is not None and cached[0] == stat_fingerprint:
+        return cached[1]
+
+    matches = schema_content_fingerprint(schema_dir) == SCHEMA_FINGERPRINT
+    with _VALIDATOR_CACHE_LOCK:
+        _FUSED_SCHEMA_CHECK[str(schema_dir)] = (stat_fingerprint, matches)
+    return matches
+
+
+def warm_validators(
+    schema_dir: str | Path | None = None,
+    *,
+    panel_codes: Iterable[str] | None = None,
+) -> tuple[str, ...]:
+    """Build validators for the given panels (all known panels by default).
+
+    Intended to be called once at service startup so the first request does not
+    pay for schema loading. Returns the panel codes that were warmed.
+    """
+
+    root = Path(schema_dir) if schema_dir else None
+    codes = tuple(panel_codes) if panel_codes is not None else tuple(_SCHEMA_BY_PANEL)
+    warmed: list[str] = []
+    for panel_code in codes:
+        _compiled_validator(_schema_path_for_panel(panel_code, schema_dir=root))
+        warmed.append(panel_code.strip().upper())
+    return tuple(warmed)
+
+
+def clear_validator_cache() -> None:
+    with _VALIDATOR_CACHE_LOCK:
+        _VALIDATOR_CACHE.clear()
+        _FUSED_SCHEMA_CHECK.clear()
+
+
+def _jsonschema_issues(
+    payload: dict[str, Any],
+    schema_path: Path,
+    *,
+    fail_fast: bool = False,
+) -> list[ValidationIssue]:
+    validator = _compiled_validator(schema_path)
+
+    if fail_fast:
+        # iter_errors is lazy: stop the schema walk at the first violation.
+        first = next(iter(validator.iter_errors(payload)), None)
+        return [] if first is None else [_schema_issue(first)]
+
+    errors = sorted(validator.iter_errors(payload), key=lambda item: list(item.absolute_path))
+    return [_schema_issue(error) for error in errors]
+
+
+def _schema_issue(error: Any) -> ValidationIssue:
+    path_parts = [str(part) for part in error.absolute_path]
+    path = "/" + "/".join(path_parts) if path_parts else "/"
+    return ValidationIssue(path=path, description=error.message, severity="error")
 
 
 def validate_jsonschema(
@@ -67,8 +193,36 @@ def validate_jsonschema(
     *,
     panel_code: str | None = None,
     schema_dir: str | Path | None = None,
+    fail_fast: bool = False,
+    mode: ValidationMode = "fused",
 ) -> ValidationResult:
-    issues: list[ValidationIssue] = []
+    """Validate a panel payload against its JSON schema and the cross-field rules.
+
+    `fail_fast` stops at the first error (schema first, then rules) for callers
+    that only need `is_valid`.
+
+    In `"fused"` mode panels of the bundled schemas are checked by a single-pass
+    validator that reports the same issues. A custom `schema_path`/`schema_dir`,
+    bundled schema files edited since the fused validator was written, or
+    `mode="reference"` run jsonschema followed by `validate_rules`, which is the
+    reference for audits.
+    """
+
+    if mode not in ("fused", "reference"):
+        raise ValueError(f"Unknown validation mode: {mode}")
+    if (
+        mode == "fused"
+        and schema_path is None
+        and panel_code is not None
+        and isinstance(payload, dict)
+        and _is_default_schema_dir(schema_dir)
+        and _fused_matches_bundled_schemas()
+    ):
+        spec = fused_panel_spec(panel_code)
+        if spec is not None:
+            return validate_fused(payload, spec, fail_fast=fail_fast)
+
+    result = ValidationResult(is_valid=True)
 
     try:
         if schema_path is not None:
@@ -81,9 +235,9 @@ def validate_jsonschema(
         else:
             raise ValueError("Either schema_path or panel_code must be provided")
 
-        issues.extend(_jsonschema_issues(payload, resolved_schema_path))
+        result.extend(_jsonschema_issues(payload, resolved_schema_path, fail_fast=fail_fast))
     except Exception as exc:
-        issues.append(
+        result.add(
             ValidationIssue(
                 path="/",
                 description=f"Schema validation failed to run: {exc}",
@@ -91,8 +245,8 @@ def validate_jsonschema(
             )
         )
 
-    rule_result = validate_rules(payload)
-    issues.extend(rule_result.issues)
+    if fail_fast and not result.is_valid:
+        return result
 
-    has_errors = any(issue.severity == "error" for issue in issues)
-    return ValidationResult(is_valid=not has_errors, issues=issues)
+    result.extend(validate_rules(payload, fail_fast=fail_fast).issues)
+    return result
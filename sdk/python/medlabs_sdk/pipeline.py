@@ -1,15 +1,32 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
 from pathlib import Path
 from time import perf_counter
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
-from medlabs_sdk.contracts import LLMClient, Tracer
-from medlabs_sdk.core.extract import AIExtractor
-from medlabs_sdk.core.ingest import PdfIngestError, PdfIngestor, TextIngestor
-from medlabs_sdk.core.map import to_standard_panel
+from medlabs_sdk.contracts import (
+    AsyncLLMClient,
+    ExtractionCache,
+    IdStrategy,
+    LLMClient,
+    PromptProvider,
+    StructuredGenerator,
+    Tracer,
+)
+from medlabs_sdk.core.extract import AIExtractor, AsyncAIExtractor, Extractor, ExtractPolicy
+from medlabs_sdk.core.ingest import PdfIngestError, PdfIngestor, PdfSource, TextIngestor
+from medlabs_sdk.core.map import panel_coverage, to_standard_panel
 from medlabs_sdk.core.models import (
     ExtractedReport,
     NormalizedReport,
@@ -18,9 +35,11 @@ from medlabs_sdk.core.models import (
     StandardPanel,
     ValidationResult,
 )
-from medlabs_sdk.core.normalize import normalize
-from medlabs_sdk.core.validate import validate_jsonschema
+from medlabs_sdk.core.normalize import UnitConverter, normalize
+from medlabs_sdk.core.timing import elapsed_ms
+from medlabs_sdk.core.validate import ValidationMode, validate_jsonschema
 from medlabs_sdk.logger import configure_logger, get_logger
+from medlabs_sdk.providers.client_registry import close_resource
 from medlabs_sdk.providers.noop_tracer import NoopTracer
 
 if TYPE_CHECKING:
@@ -28,20 +47,21 @@ if TYPE_CHECKING:
 
 
 PipelineNodeHandler = Callable[["PipelineState"], None]
+PipelineAsyncNodeHandler = Callable[["PipelineState"], Awaitable[None]]
 PipelineEdgePredicate = Callable[["PipelineState"], bool]
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStepState:
     pipeline_step: str
-    duration_ms: int
+    duration_ms: float
     status: str
     warning_count: int
     error_count: int
     attrs: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineState:
     panel: str
     document: RawDocument
@@ -52,6 +72,32 @@ class PipelineState:
     steps: list[PipelineStepState] = field(default_factory=list)
 
 
+@dataclass(frozen=True, slots=True)
+class BatchItem:
+    """One document for `MedLabsPipeline.parse_many`.
+
+    `source` is the report text for `kind="text"` and a file path for `kind="pdf"`.
+    """
+
+    source: str
+    panel: str
+    kind: Literal["text", "pdf"] = "text"
+    document_meta: dict[str, Any] | None = None
+
+
+@dataclass(slots=True)
+class BatchItemResult:
+    index: int
+    item: BatchItem
+    result: PipelineResult | None = None
+    error: Exception | None = None
+    steps: list[PipelineStepState] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 @dataclass(frozen=True)
 class PipelineEdge:
     target: str
@@ -64,16 +110,55 @@ class PipelineNode:
     name: str
     handler: PipelineNodeHandler
     edges: tuple[PipelineEdge, ...] = ()
+    async_handler: PipelineAsyncNodeHandler | None = None
 
 
 @dataclass(frozen=True)
 class PipelineRuntimeConfig:
     llm_client: LLMClient
+    async_llm_client: AsyncLLMClient | None
     prompt_name: str
     prompt_version: str
     tracer: Tracer
     schema_dir: Path | None
     log_level: str
+    extract_policy: ExtractPolicy | None = None
+
+
+_CPU_BOUND_NODES = frozenset({"normalize", "map", "validate"})
+
+
+def _run_cpu_stages(
+    extracted: ExtractedReport,
+    panel: str,
+    schema_dir: Path | None,
+    unit_converter: UnitConverter | None = None,
+    id_strategy: IdStrategy | None = None,
+    validation_fail_fast: bool = False,
+    validation_mode: ValidationMode = "fused",
+) -> tuple[NormalizedReport, StandardPanel, ValidationResult, dict[str, float]]:
+    """Process-pool entry point for the deterministic normalize/map/validate steps."""
+
+    durations: dict[str, float] = {}
+
+    start = perf_counter()
+    normalized = normalize(extracted, converter=unit_converter)
+    durations["normalize"] = elapsed_ms(start)
+
+    start = perf_counter()
+    mapped = to_standard_panel(normalized, panel=panel, ids=id_strategy)
+    durations["map"] = elapsed_ms(start)
+
+    start = perf_counter()
+    validation = validate_jsonschema(
+        mapped.data,
+        panel_code=mapped.data.get("panel_code", {}).get("code"),
+        schema_dir=schema_dir,
+        fail_fast=validation_fail_fast,
+        mode=validation_mode,
+    )
+    durations["validate"] = elapsed_ms(start)
+    return normalized, mapped, validation, durations
 
 
 class MedLabsPipeline:
@@ -81,19 +166,43 @@ class MedLabsPipeline:
         self,
         *,
         llm_client: LLMClient | None = None,
+        async_llm_client: AsyncLLMClient | None = None,
         prompt_name: str | None = None,
         prompt_version: str | None = None,
         tracer: Tracer | None = None,
         settings: MedLabsSettings | None = None,
         schema_dir: str | Path | None = None,
         log_level: str | None = None,
+        extraction_cache: ExtractionCache | None = None,
+        pdf_workers: int | None = None,
+        chunk_pages: int | None = None,
+        max_chunk_chars: int | None = None,
+        extract_concurrency: int = 4,
+        fast_extractor: Extractor | None = None,
+        fast_path_min_coverage: float = 0.8,
+        fast_path_min_confidence: float = 0.0,
+        fast_path_min_fields: int = 1,
+        unit_converter: UnitConverter | None = None,
+        id_strategy: IdStrategy | None = None,
+        extract_policy: ExtractPolicy | None = None,
+        validation_fail_fast: bool = False,
+        validation_mode: ValidationMode = "fused",
     ) -> None:
-        if llm_client is None:
+        # Clients built from settings belong to the pipeline and are closed by `close()`;
+        # clients passed in stay the caller's.
+        self._owned_resources: list[Any] = []
+        if llm_client is None and async_llm_client is None:
             runtime = self._runtime_from_settings(settings=settings)
             llm_client = runtime.llm_client
+            async_llm_client = runtime.async_llm_client
             prompt_name = runtime.prompt_name
             prompt_version = runtime.prompt_version
-            tracer = tracer or runtime.tracer
+            self._owned_resources.extend([llm_client, async_llm_client])
+            if extract_policy is None:
+                extract_policy = runtime.extract_policy
+            if tracer is None:
+                tracer = runtime.tracer
+                self._owned_resources.append(tracer)
             if schema_dir is None:
                 schema_dir = runtime.schema_dir
             if log_level is None:
@@ -101,8 +210,8 @@ class MedLabsPipeline:
         else:
             if not prompt_name or not prompt_version:
                 raise RuntimeError(
-                    "When `llm_client` is passed explicitly, set both "
-                    "`prompt_name` and `prompt_version`."
+                    "When `llm_client` or `async_llm_client` is passed explicitly, "
+                    "set both `prompt_name` and `prompt_version`."
                 )
             if log_level is None:
                 log_level = "INFO"
@@ -115,20 +224,75 @@ class MedLabsPipeline:
         configure_logger(log_level)
         self.logger = get_logger()
         self.tracer = tracer or NoopTracer()
+        # State of the most recent `parse_*`/`aparse_*` call, for inspection. Under
+        # concurrent calls it is whichever finished last: not a per-call result.
         self.last_state: PipelineState | None = None
-        self.extractor = AIExtractor(
-            llm_client,
-            prompt_name=prompt_name,
-            prompt_version=prompt_version,
-            temperature=0.0,
-        )
-        self.pdf_ingestor = PdfIngestor()
+        self.prompt_name = prompt_name
+        self.prompt_version = prompt_version
+        self.extractor: AIExtractor | None = None
+        if llm_client is not None:
+            self.extractor = AIExtractor(
+                llm_client,
+                prompt_name=prompt_name,
+                prompt_version=prompt_version,
+                temperature=0.0,
+                cache=extraction_cache,
+                chunk_pages=chunk_pages,
+                max_chunk_chars=max_chunk_chars,
+                max_concurrency=extract_concurrency,
+                policy=extract_policy,
+            )
+        self.async_extractor: AsyncAIExtractor | None = None
+        if async_llm_client is not None:
+            self.async_extractor = AsyncAIExtractor(
+                async_llm_client,
+                prompt_name=prompt_name,
+                prompt_version=prompt_version,
+                temperature=0.0,
+                cache=extraction_cache,
+                chunk_pages=chunk_pages,
+                max_chunk_chars=max_chunk_chars,
+                max_concurrency=extract_concurrency,
+                policy=extract_policy,
+            )
+        self.pdf_ingestor = PdfIngestor(workers=pdf_workers)
         self.text_ingestor = TextIngestor()
         self.schema_dir = Path(schema_dir) if schema_dir else None
-        self._workflow_entry_node = "extract"
+        self.fast_extractor = fast_extractor
+        self.fast_path_min_coverage = fast_path_min_coverage
+        self.fast_path_min_confidence = fast_path_min_confidence
+        self.fast_path_min_fields = fast_path_min_fields
+        self.unit_converter = unit_converter
+        self.id_strategy = id_strategy
+        if validation_mode not in ("fused", "reference"):
+            raise ValueError(f"Unknown validation mode: {validation_mode}")
+        self.validation_fail_fast = validation_fail_fast
+        self.validation_mode: ValidationMode = validation_mode
+        self._workflow_entry_node = "fast_extract" if fast_extractor is not None else "extract"
         self._workflow_nodes = self._build_workflow_nodes()
         self._assert_workflow_is_valid()
 
+    def close(self) -> None:
+        """Release the LLM, prompt and tracing clients this pipeline created.
+
+        HTTP connection pools are shared per endpoint across pipelines and are closed
+        when their last user releases them.
+        """
+
+        resources, self._owned_resources = self._owned_resources, []
+        for resource in resources:
+            close_resource(resource)
+        for extractor in (self.extractor, self.async_extractor):
+            if extractor is not None and extractor.caller is not None:
+                extractor.caller.close()
+        self.pdf_ingestor.close()
+
+    def __enter__(self) -> MedLabsPipeline:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     @classmethod
     def with_settings(cls, settings: MedLabsSettings) -> MedLabsPipeline:
         return cls(settings=settings)
@@ -161,11 +325,19 @@ class MedLabsPipeline:
         resolved_settings = cls._load_settings(settings=settings)
         try:
             from medlabs_sdk.providers import (
+                AsyncOpenAIClient,
+                AsyncPromptedLLMClient,
+                CachingPromptProvider,
                 LangfusePromptProvider,
                 LangfuseTracer,
                 NoopTracer,
                 OpenAIClient,
+                PoolLimits,
                 PromptedLLMClient,
+                RouteBackend,
+                RoutingGenerator,
+                SingleFlightGenerator,
+                shared_client_registry,
             )
         except ImportError as exc:
             raise RuntimeError(
@@ -173,7 +345,14 @@ class MedLabsPipeline:
                 "`uv sync --extra providers`"
             ) from exc
 
-        prompt_provider = None
+        client_registry = shared_client_registry(
+            PoolLimits(
+                max_connections=resolved_settings.http_max_connections,
+                max_keepalive_connections=resolved_settings.http_max_keepalive_connections,
+                keepalive_expiry=resolved_settings.http_keepalive_expiry_seconds,
+            )
+        )
+        prompt_provider: PromptProvider | None = None
         has_langfuse_credentials = all(
             [
                 resolved_settings.langfuse_public_key,
@@ -186,19 +365,69 @@ class MedLabsPipeline:
                 public_key=resolved_settings.langfuse_public_key,
                 secret_key=resolved_settings.langfuse_secret_key,
                 host=resolved_settings.langfuse_host,
+                client_registry=client_registry,
             )
+            if resolved_settings.prompt_cache_ttl_seconds > 0:
+                prompt_provider = CachingPromptProvider(
+                    prompt_provider,
+                    ttl_seconds=resolved_settings.prompt_cache_ttl_seconds,
+                    stale_ttl_seconds=resolved_settings.prompt_cache_stale_ttl_seconds,
+                )
 
-        generator = OpenAIClient(
+        generator: StructuredGenerator = OpenAIClient(
             model=resolved_settings.openai_model,
             api_key=resolved_settings.openai_api_key,
             base_url=resolved_settings.openai_base_url,
+            client_registry=client_registry,
         )
+        if resolved_settings.llm_backends:
+            backends = [RouteBackend(name="primary", generator=generator)]
+            for index, backend in enumerate(resolved_settings.llm_backends, start=1):
+                backends.append(
+                    RouteBackend(
+                        name=str(backend.get("name") or f"backend-{index}"),
+                        generator=OpenAIClient(
+                            model=backend.get("model") or resolved_settings.openai_model,
+                            api_key=backend.get("api_key") or resolved_settings.openai_api_key,
+                            base_url=backend["base_url"],
+                            client_registry=client_registry,
+                        ),
+                        weight=float(backend.get("weight", 1.0)),
+                    )
+                )
+            generator = RoutingGenerator(
+                backends,
+                failure_threshold=resolved_settings.llm_circuit_failure_threshold,
+                cooldown_s=resolved_settings.llm_circuit_cooldown_seconds,
+            )
+        if resolved_settings.llm_single_flight:
+            generator = SingleFlightGenerator(
+                generator,
+                max_concurrency=resolved_settings.llm_max_concurrency,
+                rate_per_second=resolved_settings.llm_rate_limit_rps,
+            )
         llm_client = PromptedLLMClient(
             prompt_provider=prompt_provider,
             generator=generator,
             fallback_prompt=resolved_settings.prompt_fallback,
             strict_prompt_provider=resolved_settings.fail_on_prompt_error,
         )
+        # Routing and single-flight are synchronous: without an async client `aparse_*`
+        # runs the wrapped generator in worker threads, so both paths share
+        # the same backends, breakers and limits.
+        async_llm_client: AsyncLLMClient | None = None
+        if not resolved_settings.llm_backends and not resolved_settings.llm_single_flight:
+            async_llm_client = AsyncPromptedLLMClient(
+                prompt_provider=prompt_provider,
+                generator=AsyncOpenAIClient(
+                    model=resolved_settings.openai_model,
+                    api_key=resolved_settings.openai_api_key,
+                    base_url=resolved_settings.openai_base_url,
+                    client_registry=client_registry,
+                ),
+                fallback_prompt=resolved_settings.prompt_fallback,
+                strict_prompt_provider=resolved_settings.fail_on_prompt_error,
+            )
 
         tracer: Tracer
         if resolved_settings.enable_tracing and has_langfuse_credentials:
@@ -206,17 +435,33 @@ class MedLabsPipeline:
                 public_key=resolved_settings.langfuse_public_key,
                 secret_key=resolved_settings.langfuse_secret_key,
                 host=resolved_settings.langfuse_host,
+                client_registry=client_registry,
             )
         else:
             tracer = NoopTracer()
 
+        extract_policy: ExtractPolicy | None = None
+        if (
+            resolved_settings.llm_timeout_seconds
+            or resolved_settings.llm_max_attempts > 1
+            or resolved_settings.llm_hedge
+        ):
+            extract_policy = ExtractPolicy(
+                timeout_s=resolved_settings.llm_timeout_seconds,
+                max_attempts=resolved_settings.llm_max_attempts,
+                hedge=resolved_settings.llm_hedge,
+                max_workers=resolved_settings.llm_call_workers,
+            )
+
         return PipelineRuntimeConfig(
             llm_client=llm_client,
+            async_llm_client=async_llm_client,
             prompt_name=resolved_settings.prompt_name,
             prompt_version=resolved_settings.prompt_version,
             tracer=tracer,
             schema_dir=resolved_settings.schema_dir_path(),
             log_level=resolved_settings.log_level,
+            extract_policy=extract_policy,
         )
 
     def parse_text(
@@ -226,6 +471,167 @@ class MedLabsPipeline:
         panel: str,
         document_meta: dict[str, Any] | None = None,
     ) -> PipelineResult:
+        state = self._ingest_text(text, panel=panel, document_meta=document_meta)
+        self._run_processing_workflow(state=state)
+        self.last_state = state
+        return self._result_from_state(state)
+
+    def parse_pdf(
+        self,
+        source: PdfSource,
+        *,
+        panel: str,
+        document_meta: dict[str, Any] | None = None,
+    ) -> PipelineResult:
+        state = self._ingest_pdf(source, panel=panel, document_meta=document_meta)
+        self._run_processing_workflow(state=state)
+        self.last_state = state
+        return self._result_from_state(state)
+
+    async def aparse_text(
+        self,
+        text: str,
+        *,
+        panel: str,
+        document_meta: dict[str, Any] | None = None,
+    ) -> PipelineResult:
+        """Async `parse_text`: LLM calls await, the other steps run in worker threads.
+
+        Concurrent calls may overwrite `last_state` in any order; use `parse_many` to get
+        the steps of each document.
+        """
+
+        state = self._ingest_text(text, panel=panel, document_meta=document_meta)
+        await self._arun_processing_workflow(state=state)
+        self.last_state = state
+        return self._result_from_state(state)
+
+    async def aparse_pdf(
+        self,
+        source: PdfSource,
+        *,
+        panel: str,
+        document_meta: dict[str, Any] | None = None,
+    ) -> PipelineResult:
+        """Async `parse_pdf`; see `aparse_text` about `last_state` under concurrency."""
+
+        # PDF text extraction is blocking file/CPU work, so it runs in a worker thread.
+        state = await asyncio.to_thread(
+            self._ingest_pdf,
+            source,
+            panel=panel,
+            document_meta=document_meta,
+        )
+        await self._arun_processing_workflow(state=state)
+        self.last_state = state
+        return self._result_from_state(state)
+
+    def parse_many(
+        self,
+        items: Iterable[BatchItem],
+        *,
+        concurrency: int = 4,
+        ordered: bool = True,
+        cpu_workers: int | None = None,
+    ) -> Iterator[BatchItemResult]:
+        """Run the pipeline over many documents, overlapping the extract step.
+
+        Documents are processed on a bounded thread pool of `concurrency` workers, so
+        LLM round-trips of different documents overlap. With `cpu_workers`, the
+        normalize/map/validate steps run in a process pool of that size; id strategies
+        that are only unique within a process (`CounterIds`) are rejected then.
+
+        Results are yielded in input order (`ordered=True`) or as soon as each document
+        finishes. A failing document yields a result with `error` set and does not stop
+        the batch. `last_state` is not updated by batch runs.
+        """
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if cpu_workers is not None and cpu_workers < 1:
+            raise ValueError("cpu_workers must be >= 1")
+        if cpu_workers and not getattr(self.id_strategy, "unique_across_processes", True):
+            raise ValueError(
+                f"{type(self.id_strategy).__name__} repeats ids across worker processes; "
+                "use DeterministicIds or RandomIds with cpu_workers"
+            )
+
+        cpu_executor = ProcessPoolExecutor(max_workers=cpu_workers) if cpu_workers else None
+        executor = ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix="medlabs-batch",
+        )
+        # Keep a bounded window of submitted documents so huge inputs stream through.
+        max_in_flight = concurrency * 2
+        pending: deque[Future[BatchItemResult]] = deque()
+        item_iter = iter(enumerate(items))
+
+        def submit_next() -> bool:
+            next_item = next(item_iter, None)
+            if next_item is None:
+                return False
+            index, item = next_item
+            pending.append(executor.submit(self._parse_batch_item, index, item, cpu_executor))
+            return True
+
+        try:
+            while len(pending) < max_in_flight and submit_next():
+                pass
+
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = next(item for item in pending if item in done)
+                    pending.remove(future)
+                yield future.result()
+                submit_next()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if cpu_executor is not None:
+                cpu_executor.shutdown(wait=True, cancel_futures=True)
+
+    def ingest_item(self, item: BatchItem) -> RawDocument:
+        """Ingest one batch item without extracting it; records the ingest step only."""
+
+        return self._ingest_batch_item(item).document
+
+    def finish_extracted(
+        self,
+        document: RawDocument,
+        extracted: ExtractedReport,
+        *,
+        panel: str,
+        extract_duration_ms: float,
+        **extract_attrs: Any,
+    ) -> tuple[PipelineResult, list[PipelineStepState]]:
+        """Run normalize/map/validate on a report extracted outside the pipeline.
+
+        The extract step is recorded with `extract_duration_ms` and `extract_attrs`,
+        e.g. when `BulkExtraction` builds the report from Batch API results.
+        """
+
+        state = PipelineState(panel=panel, document=document, extracted=extracted)
+        self._record_step(
+            state=state,
+            pipeline_step="extract",
+            duration_ms=extract_duration_ms,
+            status="ok",
+            warning_count=len(extracted.warnings),
+            error_count=0,
+            **extract_attrs,
+        )
+        self._run_processing_workflow(state=state, entry_node="normalize")
+        return self._result_from_state(state), state.steps
+
+    def _ingest_text(
+        self,
+        text: str,
+        *,
+        panel: str,
+        document_meta: dict[str, Any] | None = None,
+    ) -> PipelineState:
         start = perf_counter()
         document = self.text_ingestor.ingest(text)
         if document_meta:
@@ -234,7 +640,7 @@ class MedLabsPipeline:
         self._record_step(
             state=state,
             pipeline_step="ingest",
-            duration_ms=self._elapsed_ms(start),
+            duration_ms=elapsed_ms(start),
             status="ok",
             warning_count=0,
             error_count=0,
@@ -242,30 +648,29 @@ class MedLabsPipeline:
             pages=max(1, len(document.pages)),
             text_size=len(document.text),
         )
-        self._run_processing_workflow(state=state)
-        self.last_state = state
-        return self._result_from_state(state)
+        return state
 
-    def parse_pdf(
+    def _ingest_pdf(
         self,
-        source: str,
+        source: PdfSource,
         *,
         panel: str,
         document_meta: dict[str, Any] | None = None,
-    ) -> PipelineResult:
+    ) -> PipelineState:
         start = perf_counter()
+        source_name = self.pdf_ingestor.describe_source(source)
         try:
-            with self.tracer.span("ingest", source=source):
+            with self.tracer.span("ingest", source=source_name):
                 document = self.pdf_ingestor.ingest(source)
         except PdfIngestError:
             self.logger.info(
                 "pipeline.step",
                 pipeline_step="ingest",
-                duration_ms=self._elapsed_ms(start),
+                duration_ms=elapsed_ms(start),
                 status="error",
                 warning_count=0,
                 error_count=1,
-                source=source,
+                source=source_name,
                 pages=0,
                 text_size=0,
             )
@@ -278,17 +683,110 @@ class MedLabsPipeline:
         self._record_step(
             state=state,
             pipeline_step="ingest",
-            duration_ms=self._elapsed_ms(start),
+            duration_ms=elapsed_ms(start),
             status="ok",
             warning_count=0,
             error_count=0,
-            source=source,
+            source=source_name,
             pages=len(document.pages),
             text_size=len(document.text),
         )
-        self._run_processing_workflow(state=state)
-        self.last_state = state
-        return self._result_from_state(state)
+        return state
+
+    def _parse_batch_item(
+        self,
+        index: int,
+        item: BatchItem,
+        cpu_executor: ProcessPoolExecutor | None,
+    ) -> BatchItemResult:
+        state: PipelineState | None = None
+        try:
+            state = self._ingest_batch_item(item)
+            if cpu_executor is None:
+                self._run_processing_workflow(state=state)
+            else:
+                next_node = self._run_processing_workflow(
+                    state=state,
+                    stop_before=_CPU_BOUND_NODES,
+                )
+                if next_node is not None:
+                    self._run_cpu_stages_in_pool(state=state, cpu_executor=cpu_executor)
+
+            return BatchItemResult(
+                index=index,
+                item=item,
+                result=self._result_from_state(state),
+                steps=state.steps,
+            )
+        except Exception as exc:
+            self.logger.info(
+                "pipeline.batch_item",
+                index=index,
+                status="error",
+                error=str(exc),
+            )
+            return BatchItemResult(
+                index=index,
+                item=item,
+                error=exc,
+                steps=state.steps if state is not None else [],
+            )
+
+    def _ingest_batch_item(self, item: BatchItem) -> PipelineState:
+        if item.kind == "pdf":
+            return self._ingest_pdf(item.source, panel=item.panel, document_meta=item.document_meta)
+        if item.kind == "text":
+            return self._ingest_text(
+                item.source, panel=item.panel, document_meta=item.document_meta
+            )
+        raise ValueError(f"Unsupported batch item kind: {item.kind}")
+
+    def _run_cpu_stages_in_pool(
+        self,
+        *,
+        state: PipelineState,
+        cpu_executor: ProcessPoolExecutor,
+    ) -> None:
+        if state.extracted is None:
+            raise RuntimeError("Pipeline state is missing extracted report")
+
+        normalized, mapped, validation, durations = cpu_executor.submit(
+            _run_cpu_stages,
+            state.extracted,
+            state.panel,
+            self.schema_dir,
+            self.unit_converter,
+            self.id_strategy,
+            self.validation_fail_fast,
+            self.validation_mode,
+        ).result()
+        state.normalized = normalized
+        state.mapped = mapped
+        state.validation = validation
+        self._record_step(
+            state=state,
+            pipeline_step="normalize",
+            duration_ms=durations["normalize"],
+            status="ok",
+            warning_count=len(normalized.warnings),
+            error_count=0,
+        )
+        self._record_step(
+            state=state,
+            pipeline_step="map",
+            duration_ms=durations["map"],
+            status="ok",
+            warning_count=len(mapped.warnings),
+            error_count=0,
+        )
+        self._record_step(
+            state=state,
+            pipeline_step="validate",
+            duration_ms=durations["validate"],
+            status="ok" if validation.is_valid else "error",
+            warning_count=validation.warning_count,
+            error_count=validation.error_count,
+        )
 
     @property
     def workflow_node_names(self) -> tuple[str, ...]:
@@ -303,24 +801,46 @@ class MedLabsPipeline:
         return tuple(result)
 
     def _build_workflow_nodes(self) -> dict[str, PipelineNode]:
-        return {
-            "extract": PipelineNode(
-                name="extract",
-                handler=self._node_extract,
-                edges=(PipelineEdge(target="normalize"),),
-            ),
-            "normalize": PipelineNode(
-                name="normalize",
-                handler=self._node_normalize,
-                edges=(PipelineEdge(target="map"),),
-            ),
-            "map": PipelineNode(
-                name="map",
-                handler=self._node_map,
-                edges=(PipelineEdge(target="validate"),),
-            ),
-            "validate": PipelineNode(name="validate", handler=self._node_validate),
-        }
+        nodes: dict[str, PipelineNode] = {}
+        if self.fast_extractor is not None:
+            nodes["fast_extract"] = PipelineNode(
+                name="fast_extract",
+                handler=self._node_fast_extract,
+                edges=(
+                    PipelineEdge(
+                        target="normalize",
+                        label="fast_path",
+                        predicate=lambda state: state.extracted is not None,
+                    ),
+                    PipelineEdge(
+                        target="extract",
+                        label="llm_fallback",
+                        predicate=lambda state: state.extracted is None,
+                    ),
+                ),
+            )
+        nodes.update(
+            {
+                "extract": PipelineNode(
+                    name="extract",
+                    handler=self._node_extract,
+                    edges=(PipelineEdge(target="normalize"),),
+                    async_handler=self._anode_extract,
+                ),
+                "normalize": PipelineNode(
+                    name="normalize",
+                    handler=self._node_normalize,
+                    edges=(PipelineEdge(target="map"),),
+                ),
+                "map": PipelineNode(
+                    name="map",
+                    handler=self._node_map,
+                    edges=(PipelineEdge(target="validate"),),
+                ),
+                "validate": PipelineNode(name="validate", handler=self._node_validate),
+            }
+        )
+        return nodes
 
     def _assert_workflow_is_valid(self) -> None:
         if self._workflow_entry_node not in self._workflow_nodes:
@@ -338,12 +858,23 @@ class MedLabsPipeline:
                         f"Workflow edge target '{edge.target}' does not exist"
                     )
 
-    def _run_processing_workflow(self, *, state: PipelineState) -> None:
-        node_name: str | None = self._workflow_entry_node
+    def _run_processing_workflow(
+        self,
+        *,
+        state: PipelineState,
+        stop_before: frozenset[str] = frozenset(),
+        entry_node: str | None = None,
+    ) -> str | None:
+        """Walk the workflow graph; return the node it stopped before, if any."""
+
+        node_name: str | None = entry_node or self._workflow_entry_node
         max_steps = len(self._workflow_nodes) * 4
         executed_steps = 0
 
         while node_name is not None:
+            if node_name in stop_before:
+                return node_name
+
             executed_steps += 1
             if executed_steps > max_steps:
                 raise RuntimeError("Workflow execution exceeded safe step limit")
@@ -351,6 +882,34 @@ class MedLabsPipeline:
             node = self._workflow_nodes[node_name]
             node.handler(state)
             node_name = self._resolve_next_node(node=node, state=state)
+        return None
+
+    async def _arun_processing_workflow(self, *, state: PipelineState) -> None:
+        node_name: str | None = self._workflow_entry_node
+        max_steps = len(self._workflow_nodes) * 4
+        executed_steps = 0
+        async_nodes = frozenset(
+            name for name, node in self._workflow_nodes.items() if node.async_handler is not None
+        )
+
+        while node_name is not None:
+            executed_steps += 1
+            if executed_steps > max_steps:
+                raise RuntimeError("Workflow execution exceeded safe step limit")
+
+            node = self._workflow_nodes[node_name]
+            if node.async_handler is None:
+                # Runs of sync nodes (fast extract, normalize/map/validate) are CPU work:
+                # one worker thread hop per run keeps them off the event loop.
+                node_name = await asyncio.to_thread(
+                    self._run_processing_workflow,
+                    state=state,
+                    stop_before=async_nodes,
+                    entry_node=node_name,
+                )
+                continue
+            await node.async_handler(state)
+            node_name = self._resolve_next_node(node=node, state=state)
 
     def _resolve_next_node(self, *, node: PipelineNode, state: PipelineState) -> str | None:
         if not node.edges:
@@ -371,33 +930,127 @@ class MedLabsPipeline:
             )
         return matching_edges[0].target
 
+    def _node_fast_extract(self, state: PipelineState) -> None:
+        """Deterministic extraction; leaves `state.extracted` unset to request the LLM."""
+
+        if self.fast_extractor is None:
+            raise RuntimeError("Pipeline has no fast extractor configured")
+
+        fast_start = perf_counter()
+        with self.tracer.span("fast_extract", panel=state.panel):
+            report = self.fast_extractor.extract(state.document)
+        normalized = normalize(report, converter=self.unit_converter)
+        coverage = panel_coverage(normalized, state.panel)
+        confidence = (
+            sum(field.confidence for field in report.fields) / len(report.fields)
+            if report.fields
+            else 0.0
+        )
+        accepted = (
+            len(report.fields) >= self.fast_path_min_fields
+            and coverage >= self.fast_path_min_coverage
+            and confidence >= self.fast_path_min_confidence
+        )
+
+        llm_calls_saved = 0
+        if accepted:
+            report.meta.setdefault("extractor", type(self.fast_extractor).__name__)
+            state.extracted = report
+            # The normalize step reuses this result instead of normalizing again.
+            state.normalized = normalized
+            llm_calls_saved = (
+                self.extractor.planned_calls(state.document) if self.extractor is not None else 1
+            )
+        self._record_step(
+            state=state,
+            pipeline_step="fast_extract",
+            duration_ms=elapsed_ms(fast_start),
+            status="ok",
+            warning_count=len(report.warnings),
+            error_count=0,
+            decision="fast_path" if accepted else "llm_fallback",
+            fields=len(report.fields),
+            coverage=round(coverage, 4),
+            confidence=round(confidence, 4),
+            llm_calls_saved=llm_calls_saved,
+        )
+
     def _node_extract(self, state: PipelineState) -> None:
+        if self.extractor is None:
+            raise RuntimeError(
+                "Pipeline has no synchronous `llm_client`; use `aparse_text`/`aparse_pdf`"
+            )
+
         extract_start = perf_counter()
         with self.tracer.span(
             "extract",
-            prompt_name=self.extractor.prompt_name,
-            prompt_version=self.extractor.prompt_version,
+            prompt_name=self.prompt_name,
+            prompt_version=self.prompt_version,
         ):
             state.extracted = self.extractor.extract(state.document)
         self._record_step(
             state=state,
             pipeline_step="extract",
-            duration_ms=self._elapsed_ms(extract_start),
+            duration_ms=elapsed_ms(extract_start),
+            status="ok",
+            warning_count=len(state.extracted.warnings),
+            error_count=0,
+            **self._extract_attrs(state.extracted),
+        )
+
+    async def _anode_extract(self, state: PipelineState) -> None:
+        if self.async_extractor is None:
+            # Sync-only clients still work, they just occupy a worker thread per call.
+            await asyncio.to_thread(self._node_extract, state)
+            return
+
+        extract_start = perf_counter()
+        with self.tracer.span(
+            "extract",
+            prompt_name=self.prompt_name,
+            prompt_version=self.prompt_version,
+        ):
+            state.extracted = await self.async_extractor.extract(state.document)
+        self._record_step(
+            state=state,
+            pipeline_step="extract",
+            duration_ms=elapsed_ms(extract_start),
             status="ok",
             warning_count=len(state.extracted.warnings),
             error_count=0,
+            **self._extract_attrs(state.extracted),
         )
 
+    @staticmethod
+    def _extract_attrs(extracted: ExtractedReport) -> dict[str, Any]:
+        attrs: dict[str, Any] = {}
+        chunk_count = extracted.meta.get("chunk_count")
+        if isinstance(chunk_count, int):
+            attrs["chunks"] = chunk_count
+        cache_stats = extracted.meta.get("extraction_cache")
+        if isinstance(cache_stats, dict):
+            attrs["cache_hits"] = cache_stats.get("hits", 0)
+            attrs["cache_misses"] = cache_stats.get("misses", 0)
+        attempts = extracted.meta.get("llm_attempts")
+        if isinstance(attempts, list):
+            attrs["attempts"] = attempts
+            attrs["retries"] = sum(
+                1 for attempt in attempts if attempt["attempt"] > 1 and not attempt["hedge"]
+            )
+            attrs["hedged"] = sum(1 for attempt in attempts if attempt["hedge"])
+        return attrs
+
     def _node_normalize(self, state: PipelineState) -> None:
         if state.extracted is None:
             raise RuntimeError("Pipeline state is missing extracted report")
 
         normalize_start = perf_counter()
-        state.normalized = normalize(state.extracted)
+        if state.normalized is None:
+            state.normalized = normalize(state.extracted, converter=self.unit_converter)
         self._record_step(
             state=state,
             pipeline_step="normalize",
-            duration_ms=self._elapsed_ms(normalize_start),
+            duration_ms=elapsed_ms(normalize_start),
             status="ok",
             warning_count=len(state.normalized.warnings),
             error_count=0,
@@ -408,11 +1061,13 @@ class MedLabsPipeline:
             raise RuntimeError("Pipeline state is missing normalized report")
 
         map_start = perf_counter()
-        state.mapped = to_standard_panel(state.normalized, panel=state.panel)
+        state.mapped = to_standard_panel(
+            state.normalized, panel=state.panel, ids=self.id_strategy
+        )
         self._record_step(
             state=state,
             pipeline_step="map",
-            duration_ms=self._elapsed_ms(map_start),
+            duration_ms=elapsed_ms(map_start),
             status="ok",
             warning_count=len(state.mapped.warnings),
             error_count=0,
@@ -427,14 +1082,16 @@ class MedLabsPipeline:
             state.mapped.data,
             panel_code=state.mapped.data.get("panel_code", {}).get("code"),
             schema_dir=self.schema_dir,
+            fail_fast=self.validation_fail_fast,
+            mode=self.validation_mode,
         )
         self._record_step(
             state=state,
             pipeline_step="validate",
-            duration_ms=self._elapsed_ms(validate_start),
+            duration_ms=elapsed_ms(validate_start),
             status="ok" if state.validation.is_valid else "error",
-            warning_count=len(state.validation.warnings),
-            error_count=len(state.validation.errors),
+            warning_count=state.validation.warning_count,
+            error_count=state.validation.error_count,
         )
 
     def _result_from_state(self, state: PipelineState) -> PipelineResult:
@@ -454,16 +1111,12 @@ class MedLabsPipeline:
             validation=state.validation,
         )
 
-    @staticmethod
-    def _elapsed_ms(start: float) -> int:
-        return int((perf_counter() - start) * 1000)
-
     def _record_step(
         self,
         *,
         state: PipelineState,
         pipeline_step: str,
-        duration_ms: int,
+        duration_ms: float,
         status: str,
         warning_count: int,
         error_count: int,
@@ -1,15 +1,47 @@
+from medlabs_sdk.providers.caching_prompt_provider import (
+    CachingPromptProvider,
+    StaticPromptProvider,
+)
+from medlabs_sdk.providers.client_registry import (
+    ClientRegistry,
+    PoolLimits,
+    close_resource,
+    shared_client_registry,
+)
 from medlabs_sdk.providers.langfuse_openai_client import LangfuseOpenAIClient
 from medlabs_sdk.providers.langfuse_prompt_provider import LangfusePromptProvider
 from medlabs_sdk.providers.langfuse_tracer import LangfuseTracer
 from medlabs_sdk.providers.noop_tracer import NoopTracer
-from medlabs_sdk.providers.openai_client import OpenAIClient
-from medlabs_sdk.providers.prompted_llm_client import PromptedLLMClient
+from medlabs_sdk.providers.openai_batch import (
+    batch_request,
+    batch_result_payload,
+    run_batch_file,
+)
+from medlabs_sdk.providers.openai_client import AsyncOpenAIClient, OpenAIClient
+from medlabs_sdk.providers.prompted_llm_client import AsyncPromptedLLMClient, PromptedLLMClient
+from medlabs_sdk.providers.routing_generator import RouteBackend, RoutingGenerator
+from medlabs_sdk.providers.single_flight_generator import SingleFlightGenerator, TokenBucket
 
 __all__ = [
+    "AsyncOpenAIClient",
+    "AsyncPromptedLLMClient",
+    "CachingPromptProvider",
+    "ClientRegistry",
     "LangfuseOpenAIClient",
     "LangfusePromptProvider",
     "LangfuseTracer",
     "NoopTracer",
     "OpenAIClient",
+    "PoolLimits",
     "PromptedLLMClient",
+    "RouteBackend",
+    "RoutingGenerator",
+    "SingleFlightGenerator",
+    "StaticPromptProvider",
+    "TokenBucket",
+    "batch_request",
+    "batch_result_payload",
+    "close_resource",
+    "run_batch_file",
+    "shared_client_registry",
 ]
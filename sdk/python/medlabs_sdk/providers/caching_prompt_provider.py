@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from time import monotonic
+
+from medlabs_sdk.contracts import PromptProvider
+from medlabs_sdk.providers.client_registry import close_resource
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _CachedPrompt:
+    text: str
+    fetched_at: float
+
+
+class CachingPromptProvider:
+    """TTL cache in front of another `PromptProvider`.
+
+    - within `ttl_seconds` the cached prompt is returned without calling the provider
+    - within `stale_ttl_seconds` after that, the stale prompt is returned and a single
+      background refresh is started (stale-while-revalidate)
+    - if a refresh fails, the last known good prompt keeps being served
+    """
+
+    def __init__(
+        self,
+        provider: PromptProvider,
+        *,
+        ttl_seconds: float = 300.0,
+        stale_ttl_seconds: float = 3600.0,
+        refresh_in_background: bool = True,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if ttl_seconds < 0 or stale_ttl_seconds < 0:
+            raise ValueError("ttl_seconds and stale_ttl_seconds must be >= 0")
+        self.provider = provider
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.refresh_in_background = refresh_in_background
+        self.hits = 0
+        self.misses = 0
+        self.refresh_errors = 0
+        self._clock = clock
+        self._entries: dict[tuple[str, str], _CachedPrompt] = {}
+        self._refreshing: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def get_prompt(self, *, prompt_name: str, prompt_version: str) -> str:
+        key = (prompt_name, prompt_version)
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self._clock() - entry.fetched_at
+            if age <= self.ttl_seconds:
+                self.hits += 1
+                return entry.text
+            if self.refresh_in_background and age <= self.ttl_seconds + self.stale_ttl_seconds:
+                self.hits += 1
+                self._start_background_refresh(key)
+                return entry.text
+
+        self.misses += 1
+        try:
+            return self._fetch(key)
+        except Exception:
+            if entry is None:
+                raise
+            self.refresh_errors += 1
+            _LOGGER.warning(
+                "Prompt provider failed, serving last known good prompt",
+                extra={"prompt_name": prompt_name, "prompt_version": prompt_version},
+            )
+            return entry.text
+
+    def invalidate(
+        self,
+        *,
+        prompt_name: str | None = None,
+        prompt_version: str | None = None,
+    ) -> None:
+        with self._lock:
+            if prompt_name is None:
+                self._entries.clear()
+                return
+            for key in list(self._entries):
+                if key[0] == prompt_name and (prompt_version is None or key[1] == prompt_version):
+                    del self._entries[key]
+
+    def close(self) -> None:
+        close_resource(self.provider)
+
+    def _fetch(self, key: tuple[str, str]) -> str:
+        text = self.provider.get_prompt(prompt_name=key[0], prompt_version=key[1])
+        if not isinstance(text, str) or not text.strip():
+            raise RuntimeError(f"Prompt '{key[0]}' version '{key[1]}' is empty")
+        with self._lock:
+            self._entries[key] = _CachedPrompt(text=text, fetched_at=self._clock())
+        return text
+
+    def _start_background_refresh(self, key: tuple[str, str]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        thread = threading.Thread(
+            target=self._background_refresh,
+            args=(key,),
+            name="medlabs-prompt-refresh",
+            daemon=True,
+        )
+        thread.start()
+
+    def _background_refresh(self, key: tuple[str, str]) -> None:
+        try:
+            self._fetch(key)
+        except Exception:
+            self.refresh_errors += 1
+            _LOGGER.warning(
+                "Background prompt refresh failed, keeping last known good prompt",
+                extra={"prompt_name": key[0], "prompt_version": key[1]},
+            )
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+class StaticPromptProvider:
+    """In-process prompt store keyed by (name, version); useful for tests and offline runs."""
+
+    def __init__(self, prompts: dict[tuple[str, str], str] | None = None) -> None:
+        self.prompts: dict[tuple[str, str], str] = dict(prompts or {})
+        self.calls = 0
+
+    def get_prompt(self, *, prompt_name: str, prompt_version: str) -> str:
+        self.calls += 1
+        try:
+            return self.prompts[(prompt_name, prompt_version)]
+        except KeyError as exc:
+            raise RuntimeError(
+                f"Prompt '{prompt_name}' version '{prompt_version}' is not registered"
+            ) from exc
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class PoolLimits:
+    """HTTP connection pool settings for the clients a registry creates.
+
+    A longer `keepalive_expiry` than httpx's 5 s default keeps TLS connections to the
+    model endpoint warm between documents.
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 60.0
+
+    def httpx_limits(self) -> Any:
+        import httpx
+
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass(slots=True)
+class _Entry:
+    key: Hashable
+    client: Any
+    refs: int = 0
+    loop: asyncio.AbstractEventLoop | None = None
+
+
+class ClientRegistry:
+    """Thread-safe, reference-counted store of SDK clients shared by key.
+
+    Providers key their clients by endpoint and credentials, e.g.
+    `("openai", base_url, api_key)`, so every pipeline and thread talking to the same
+    endpoint reuses one client and one connection pool. Async clients are bound to
+    the event loop they were acquired on (`loop`) and are only shared within it.
+    `release` closes a client once its last user is gone; `close` closes everything,
+    except on the process-wide registries from `shared_client_registry`, whose
+    clients are only closed by their last `release`.
+    """
+
+    def __init__(self, *, pool_limits: PoolLimits | None = None, shared: bool = False) -> None:
+        self.pool_limits = pool_limits or PoolLimits()
+        self.shared = shared
+        self.created = 0
+        self._entries: dict[Hashable, _Entry] = {}
+        self._by_client: dict[int, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        *,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> Any:
+        if loop is not None:
+            key = (key, loop)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                # Creating under the lock: SDK constructors do no network I/O, and
+                # racing threads must not build duplicate pools.
+                entry = _Entry(key=key, client=factory(), loop=loop)
+                self._entries[key] = entry
+                self._by_client[id(entry.client)] = entry
+                self.created += 1
+            entry.refs += 1
+            return entry.client
+
+    def release(self, client: Any) -> None:
+        with self._lock:
+            entry = self._by_client.get(id(client))
+            if entry is None or entry.client is not client:
+                return
+            entry.refs -= 1
+            if entry.refs > 0:
+                return
+            del self._entries[entry.key]
+            del self._by_client[id(client)]
+        _close_client(client, entry.loop)
+
+    def close(self) -> None:
+        if self.shared:
+            # Other pipelines may still lease these clients; each lease closes its own.
+            return
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._by_client.clear()
+        for entry in entries:
+            _close_client(entry.client, entry.loop)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self) -> ClientRegistry:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+_SHARED_REGISTRIES: dict[PoolLimits, ClientRegistry] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_client_registry(pool_limits: PoolLimits | None = None) -> ClientRegistry:
+    """Process-wide registry for `pool_limits`; providers not given a registry use it."""
+
+    limits = pool_limits or PoolLimits()
+    with _SHARED_LOCK:
+        registry = _SHARED_REGISTRIES.get(limits)
+        if registry is None:
+            registry = _SHARED_REGISTRIES[limits] = ClientRegistry(pool_limits=limits, shared=True)
+        return registry
+
+
+class _LeasedClient:
+    """Per-provider handle: lazily acquires a registry client once, thread-safely.
+
+    With `per_loop`, a client is leased for each running event loop instead: async
+    HTTP pools cannot be used from a loop other than the one they were created on.
+    """
+
+    def __init__(
+        self, client: Any | None, registry: ClientRegistry | None, *, per_loop: bool = False
+    ) -> None:
+        self.client = client
+        self.registry = registry
+        self.per_loop = per_loop
+        self._leased_from: ClientRegistry | None = None
+        self._loop_clients: dict[asyncio.AbstractEventLoop, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, factory: Callable[[ClientRegistry], Any]) -> Any:
+        client = self.client
+        if client is not None:
+            return client
+        if self.per_loop:
+            return self._get_for_loop(key, factory, asyncio.get_running_loop())
+        with self._lock:
+            if self.client is None:
+                registry = self._registry()
+                self.client = registry.acquire(key, lambda: factory(registry))
+                self._leased_from = registry
+            return self.client
+
+    def release(self) -> None:
+        """Give leased clients back; clients passed in by the caller are left open."""
+
+        with self._lock:
+            registry, client = self._leased_from, self.client
+            loop_clients, self._loop_clients = list(self._loop_clients.values()), {}
+            if registry is None:
+                return
+            self._leased_from = None
+            if not self.per_loop:
+                self.client = None
+        if not self.per_loop:
+            registry.release(client)
+        for loop_client in loop_clients:
+            registry.release(loop_client)
+
+    def _get_for_loop(
+        self,
+        key: Hashable,
+        factory: Callable[[ClientRegistry], Any],
+        loop: asyncio.AbstractEventLoop,
+    ) -> Any:
+        stale: list[Any] = []
+        with self._lock:
+            client = self._loop_clients.get(loop)
+            if client is None:
+                registry = self._leased_from or self._registry()
+                client = registry.acquire(key, lambda: factory(registry), loop=loop)
+                self._leased_from = registry
+                # Loops finished by earlier `asyncio.run` calls will never use theirs again.
+                for old_loop in [item for item in self._loop_clients if item.is_closed()]:
+                    stale.append(self._loop_clients.pop(old_loop))
+                self._loop_clients[loop] = client
+            registry = self._leased_from
+        for old_client in stale:
+            registry.release(old_client)
+        return client
+
+    def _registry(self) -> ClientRegistry:
+        return self.registry if self.registry is not None else shared_client_registry()
+
+
+def close_resource(resource: Any) -> None:
+    """Call `close()` on providers that have one (generators, prompt providers, tracers)."""
+
+    close = getattr(resource, "close", None)
+    if close is not None:
+        close()
+
+
+_PENDING_CLOSES: set[asyncio.Future[Any]] = set()
+
+
+def _close_client(client: Any, loop: asyncio.AbstractEventLoop | None = None) -> None:
+    # Langfuse flushes pending events on `shutdown`; HTTP clients expose `close`.
+    close = getattr(client, "shutdown", None) or getattr(client, "close", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            _await_on_loop(result, loop)
+    except Exception:
+        _LOGGER.warning("Failed to close client", extra={"client": type(client).__name__})
+
+
+def _await_on_loop(result: Any, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Finish an async `close()` on the loop that owns the client, never on a new one."""
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    loop = loop or running
+    if loop is None or loop.is_closed():
+        # The loop's transports are already gone; there is nothing left to await on.
+        if inspect.iscoroutine(result):
+            result.close()
+        return
+    if loop is running:
+        task = loop.create_task(_await(result))
+        _PENDING_CLOSES.add(task)
+        task.add_done_callback(_PENDING_CLOSES.discard)
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(_await(result), loop)
+    else:
+        loop.run_until_complete(_await(result))
+
+
+async def _await(result: Any) -> None:
+    await result
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from medlabs_sdk.providers.client_registry import ClientRegistry, _LeasedClient
+
 
 class LangfusePromptProvider:
     def __init__(
@@ -11,11 +13,12 @@ class LangfusePromptProvider:
         secret_key: str | None = None,
         host: str | None = None,
         langfuse_client: Any | None = None,
+        client_registry: ClientRegistry | None = None,
     ) -> None:
         self.public_key = public_key
         self.secret_key = secret_key
         self.host = host
-        self._langfuse = langfuse_client
+        self._langfuse = _LeasedClient(langfuse_client, client_registry)
 
     def get_prompt(self, *, prompt_name: str, prompt_version: str) -> str:
         langfuse_client = self._resolve_langfuse_client()
@@ -43,10 +46,16 @@ class LangfusePromptProvider:
             f"Prompt '{prompt_name}' version '{prompt_version}' was loaded but has no text content"
         )
 
+    def close(self) -> None:
+        self._langfuse.release()
+
     def _resolve_langfuse_client(self) -> Any:
-        if self._langfuse is not None:
-            return self._langfuse
+        return self._langfuse.get(
+            ("langfuse", self.host, self.public_key, self.secret_key), self._create_client
+        )
 
+    def _create_client(self, registry: ClientRegistry) -> Any:
+        del registry
         try:
             from langfuse import Langfuse
         except ImportError as exc:  # pragma: no cover - dependency error path
@@ -62,5 +71,4 @@ class LangfusePromptProvider:
         if self.host:
             kwargs["host"] = self.host
 
-        self._langfuse = Langfuse(**kwargs)
-        return self._langfuse
+        return Langfuse(**kwargs)
@@ -3,6 +3,8 @@ from __future__ import annotations
 from contextlib import AbstractContextManager, nullcontext
 from typing import Any
 
+from medlabs_sdk.providers.client_registry import ClientRegistry, _LeasedClient
+
 
 class LangfuseTracer:
     def __init__(
@@ -12,11 +14,12 @@ class LangfuseTracer:
         secret_key: str | None = None,
         host: str | None = None,
         langfuse_client: Any | None = None,
+        client_registry: ClientRegistry | None = None,
     ) -> None:
         self.public_key = public_key
         self.secret_key = secret_key
         self.host = host
-        self._langfuse = langfuse_client
+        self._langfuse = _LeasedClient(langfuse_client, client_registry)
 
     def span(self, name: str, **attrs: Any) -> AbstractContextManager[None]:
         try:
@@ -33,10 +36,16 @@ class LangfuseTracer:
 
         return nullcontext()
 
+    def close(self) -> None:
+        self._langfuse.release()
+
     def _resolve_langfuse_client(self) -> Any:
-        if self._langfuse is not None:
-            return self._langfuse
+        return self._langfuse.get(
+            ("langfuse", self.host, self.public_key, self.secret_key), self._create_client
+        )
 
+    def _create_client(self, registry: ClientRegistry) -> Any:
+        del registry
         try:
             from langfuse import Langfuse
         except ImportError as exc:  # pragma: no cover - dependency error path
@@ -52,5 +61,4 @@ class LangfuseTracer:
         if self.host:
             kwargs["host"] = self.host
 
-        self._langfuse = Langfuse(**kwargs)
-        return self._langfuse
+        return Langfuse(**kwargs)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from medlabs_sdk.contracts import StructuredGenerator
+from medlabs_sdk.providers.openai_client import _completion_request, _payload_from_content
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+def batch_request(
+    custom_id: str,
+    *,
+    model: str,
+    system_prompt: str,
+    input_text: str,
+    output_schema: dict[str, Any],
+    temperature: float = 0.0,
+) -> dict[str, Any]:
+    """One line of an OpenAI Batch API input file; the body matches `OpenAIClient`."""
+
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": _completion_request(
+            model=model,
+            system_prompt=system_prompt,
+            input_text=input_text,
+            output_schema=output_schema,
+            temperature=temperature,
+        ),
+    }
+
+
+def batch_result_payload(record: dict[str, Any]) -> dict[str, Any]:
+    """Structured payload of one Batch API output line; raises if the request failed."""
+
+    custom_id = record.get("custom_id", "?")
+    error = record.get("error")
+    if error:
+        message = error.get("message", error) if isinstance(error, dict) else error
+        raise RuntimeError(f"Batch request '{custom_id}' failed: {message}")
+
+    response = record.get("response") or {}
+    status_code = response.get("status_code", 200)
+    if status_code != 200:
+        raise RuntimeError(f"Batch request '{custom_id}' failed with status {status_code}")
+    try:
+        content = response["body"]["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError) as exc:
+        raise RuntimeError(f"Batch request '{custom_id}' has no completion") from exc
+    return _payload_from_content(content)
+
+
+def run_batch_file(
+    requests_path: str | Path,
+    results_path: str | Path,
+    generator: StructuredGenerator,
+) -> int:
+    """Execute a Batch API input file with a `StructuredGenerator`, one request at a time.
+
+    Writes an output file in the Batch API format. Useful as a local stand-in for the
+    batch endpoint (tests, self-hosted models without a batch API). Returns the number
+    of failed requests.
+    """
+
+    failed = 0
+    with (
+        Path(requests_path).open(encoding="utf-8") as requests,
+        Path(results_path).open("w", encoding="utf-8") as results,
+    ):
+        for line in requests:
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            body = request["body"]
+            messages = {message["role"]: message["content"] for message in body["messages"]}
+            record: dict[str, Any] = {"custom_id": request["custom_id"], "error": None}
+            try:
+                payload = generator.generate_structured(
+                    system_prompt=messages.get("system", ""),
+                    input_text=messages.get("user", ""),
+                    output_schema=body["response_format"]["json_schema"]["schema"],
+                    temperature=body.get("temperature", 0.0),
+                )
+            except Exception as exc:
+                failed += 1
+                record["response"] = None
+                record["error"] = {"message": str(exc)}
+            else:
+                content = json.dumps(payload, ensure_ascii=False)
+                record["response"] = {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"role": "assistant", "content": content}}]},
+                }
+            results.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return failed
@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 from typing import Any
 
+from medlabs_sdk.providers.client_registry import ClientRegistry, _LeasedClient
+
 
 class OpenAIClient:
     """OpenAI-compatible structured generation transport.
@@ -17,11 +19,12 @@ class OpenAIClient:
         api_key: str | None = None,
         base_url: str | None = None,
         openai_client: Any | None = None,
+        client_registry: ClientRegistry | None = None,
     ) -> None:
         self.model = model
         self.api_key = api_key
         self.base_url = base_url
-        self._openai = openai_client
+        self._openai = _LeasedClient(openai_client, client_registry)
 
     def generate_structured(
         self,
@@ -34,45 +37,34 @@ class OpenAIClient:
         openai_client = self._resolve_openai_client()
 
         response = openai_client.chat.completions.create(
-            model=self.model,
-            temperature=temperature,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": input_text},
-            ],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "medlabs_extract",
-                    "schema": output_schema,
-                },
-            },
+            **_completion_request(
+                model=self.model,
+                system_prompt=system_prompt,
+                input_text=input_text,
+                output_schema=output_schema,
+                temperature=temperature,
+            )
         )
+        return _payload_from_response(response)
 
-        content = response.choices[0].message.content
-        payload_text = self._content_to_text(content)
-        payload = json.loads(payload_text)
-        if not isinstance(payload, dict):
-            raise RuntimeError("OpenAI response JSON must be an object")
-        return payload
+    def close(self) -> None:
+        """Release the shared SDK client; it is closed once no other user holds it."""
+
+        self._openai.release()
 
     def _resolve_openai_client(self) -> Any:
-        if self._openai is not None:
-            return self._openai
+        return self._openai.get(("openai", self.base_url, self.api_key), self._create_client)
 
+    def _create_client(self, registry: ClientRegistry) -> Any:
         try:
-            from openai import OpenAI
+            from openai import DefaultHttpxClient, OpenAI
         except ImportError as exc:  # pragma: no cover - dependency error path
             raise RuntimeError("Install optional dependency 'openai' to use OpenAIClient") from exc
 
-        kwargs: dict[str, Any] = {}
-        if self.api_key:
-            kwargs["api_key"] = self.api_key
-        if self.base_url:
-            kwargs["base_url"] = self.base_url
-
-        self._openai = OpenAI(**kwargs)
-        return self._openai
+        return OpenAI(
+            **_client_kwargs(api_key=self.api_key, base_url=self.base_url),
+            http_client=DefaultHttpxClient(limits=registry.pool_limits.httpx_limits()),
+        )
 
     @staticmethod
     def _content_to_text(content: Any) -> str:
@@ -91,3 +83,112 @@ class OpenAIClient:
                 return joined
 
         raise RuntimeError("OpenAI response did not contain JSON content")
+
+
+class AsyncOpenAIClient:
+    """Asyncio variant of `OpenAIClient` built on `openai.AsyncOpenAI`.
+
+    SDK clients are shared only within one event loop; each loop gets its own pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        model: str = "gpt-4o-mini",
+        api_key: str | None = None,
+        base_url: str | None = None,
+        openai_client: Any | None = None,
+        client_registry: ClientRegistry | None = None,
+    ) -> None:
+        self.model = model
+        self.api_key = api_key
+        self.base_url = base_url
+        self._openai = _LeasedClient(openai_client, client_registry, per_loop=True)
+
+    async def generate_structured(
+        self,
+        *,
+        system_prompt: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+    ) -> dict[str, Any]:
+        openai_client = self._resolve_openai_client()
+
+        response = await openai_client.chat.completions.create(
+            **_completion_request(
+                model=self.model,
+                system_prompt=system_prompt,
+                input_text=input_text,
+                output_schema=output_schema,
+                temperature=temperature,
+            )
+        )
+        return _payload_from_response(response)
+
+    def close(self) -> None:
+        """Release the SDK clients leased for each event loop this client ran on."""
+
+        self._openai.release()
+
+    def _resolve_openai_client(self) -> Any:
+        return self._openai.get(("async_openai", self.base_url, self.api_key), self._create_client)
+
+    def _create_client(self, registry: ClientRegistry) -> Any:
+        try:
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+        except ImportError as exc:  # pragma: no cover - dependency error path
+            raise RuntimeError(
+                "Install optional dependency 'openai' to use AsyncOpenAIClient"
+            ) from exc
+
+        return AsyncOpenAI(
+            **_client_kwargs(api_key=self.api_key, base_url=self.base_url),
+            http_client=DefaultAsyncHttpxClient(limits=registry.pool_limits.httpx_limits()),
+        )
+
+
+def _client_kwargs(*, api_key: str | None, base_url: str | None) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {}
+    if api_key:
+        kwargs["api_key"] = api_key
+    if base_url:
+        kwargs["base_url"] = base_url
+    return kwargs
+
+
+def _completion_request(
+    *,
+    model: str,
+    system_prompt: str,
+    input_text: str,
+    output_schema: dict[str, Any],
+    temperature: float,
+) -> dict[str, Any]:
+    return {
+        "model": model,
+        "temperature": temperature,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": input_text},
+        ],
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "medlabs_extract",
+                "schema": output_schema,
+            },
+        },
+    }
+
+
+def _payload_from_response(response: Any) -> dict[str, Any]:
+    return _payload_from_content(response.choices[0].message.content)
+
+
+def _payload_from_content(content: Any) -> dict[str, Any]:
+    payload_text = OpenAIClient._content_to_text(content)
+    payload = json.loads(payload_text)
+    if not isinstance(payload, dict):
+        raise RuntimeError("OpenAI response JSON must be an object")
+    return payload
@@ -1,15 +1,73 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
 from typing import Any
 
-from medlabs_sdk.contracts import PromptProvider, StructuredGenerator
+from medlabs_sdk.contracts import (
+    AsyncPromptProvider,
+    AsyncStructuredGenerator,
+    PromptProvider,
+    StructuredGenerator,
+)
+from medlabs_sdk.providers.client_registry import close_resource
 
 _LOGGER = logging.getLogger(__name__)
 _DEFAULT_FALLBACK_PROMPT = "Извлеки согласно схемы и верни только JSON."
 
 
-class PromptedLLMClient:
+def _model_identity(generator: Any) -> str:
+    identity = getattr(generator, "model_identity", None)
+    if isinstance(identity, str):
+        return identity
+    return str(getattr(generator, "model", ""))
+
+
+class _PromptFallbackMixin:
+    fallback_prompt: str
+    strict_prompt_provider: bool
+
+    def _prompt_without_provider(self) -> str:
+        if self.strict_prompt_provider:
+            raise RuntimeError("Prompt provider is required but not configured")
+        return self.fallback_prompt
+
+    def _prompt_after_provider_error(
+        self,
+        exc: Exception,
+        *,
+        prompt_name: str,
+        prompt_version: str,
+    ) -> str:
+        if self.strict_prompt_provider:
+            raise exc
+        _LOGGER.warning(
+            "Prompt provider failed, using fallback prompt",
+            extra={
+                "prompt_name": prompt_name,
+                "prompt_version": prompt_version,
+            },
+        )
+        return self.fallback_prompt
+
+    def _checked_prompt(self, prompt: Any, *, prompt_name: str, prompt_version: str) -> str:
+        if not isinstance(prompt, str) or not prompt.strip():
+            if self.strict_prompt_provider:
+                raise RuntimeError("Prompt provider returned empty prompt")
+            _LOGGER.warning(
+                "Prompt provider returned empty prompt, using fallback",
+                extra={
+                    "prompt_name": prompt_name,
+                    "prompt_version": prompt_version,
+                },
+            )
+            return self.fallback_prompt
+
+        return prompt
+
+
+class PromptedLLMClient(_PromptFallbackMixin):
     """Adapter that composes prompt storage with model transport.
 
     - PromptProvider resolves prompt by (name, version)
@@ -37,11 +95,15 @@ class PromptedLLMClient:
         input_text: str,
         output_schema: dict[str, Any],
         temperature: float = 0.0,
+        system_prompt: str | None = None,
     ) -> dict[str, Any]:
-        system_prompt = self._resolve_prompt(
-            prompt_name=prompt_name,
-            prompt_version=prompt_version,
-        )
+        """`system_prompt`, e.g. `prompt_text` from `cache_identity`, skips prompt lookup."""
+
+        if system_prompt is None:
+            system_prompt = self._resolve_prompt(
+                prompt_name=prompt_name,
+                prompt_version=prompt_version,
+            )
         return self.generator.generate_structured(
             system_prompt=system_prompt,
             input_text=input_text,
@@ -49,39 +111,132 @@ class PromptedLLMClient:
             temperature=temperature,
         )
 
+    def close(self) -> None:
+        close_resource(self.generator)
+        close_resource(self.prompt_provider)
+
+    def cache_identity(self, *, prompt_name: str, prompt_version: str) -> dict[str, str]:
+        """Resolved prompt text and model, used to key extraction caches.
+
+        `model` identifies everything that may answer (all models of a
+        `RoutingGenerator`); `model_name` is the single model requests can be sent
+        to, or "" when there is none.
+        """
+
+        return {
+            "prompt_text": self._resolve_prompt(
+                prompt_name=prompt_name,
+                prompt_version=prompt_version,
+            ),
+            "model": _model_identity(self.generator),
+            "model_name": str(getattr(self.generator, "model", "")),
+        }
+
     def _resolve_prompt(self, *, prompt_name: str, prompt_version: str) -> str:
         if self.prompt_provider is None:
-            if self.strict_prompt_provider:
-                raise RuntimeError("Prompt provider is required but not configured")
-            return self.fallback_prompt
+            return self._prompt_without_provider()
 
         try:
             prompt = self.prompt_provider.get_prompt(
                 prompt_name=prompt_name,
                 prompt_version=prompt_version,
             )
-        except Exception:
-            if self.strict_prompt_provider:
-                raise
-            _LOGGER.warning(
-                "Prompt provider failed, using fallback prompt",
-                extra={
-                    "prompt_name": prompt_name,
-                    "prompt_version": prompt_version,
-                },
+        except Exception as exc:
+            return self._prompt_after_provider_error(
+                exc,
+                prompt_name=prompt_name,
+                prompt_version=prompt_version,
             )
-            return self.fallback_prompt
 
-        if not isinstance(prompt, str) or not prompt.strip():
-            if self.strict_prompt_provider:
-                raise RuntimeError("Prompt provider returned empty prompt")
-            _LOGGER.warning(
-                "Prompt provider returned empty prompt, using fallback",
-                extra={
-                    "prompt_name": prompt_name,
-                    "prompt_version": prompt_version,
-                },
+        return self._checked_prompt(
+            prompt,
+            prompt_name=prompt_name,
+            prompt_version=prompt_version,
+        )
+
+
+class AsyncPromptedLLMClient(_PromptFallbackMixin):
+    """Asyncio counterpart of `PromptedLLMClient`.
+
+    Accepts both async and sync prompt providers; a sync provider is called in a
+    worker thread so prompt lookups do not block the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        prompt_provider: AsyncPromptProvider | PromptProvider | None,
+        generator: AsyncStructuredGenerator,
+        fallback_prompt: str = _DEFAULT_FALLBACK_PROMPT,
+        strict_prompt_provider: bool = False,
+    ) -> None:
+        self.prompt_provider = prompt_provider
+        self.generator = generator
+        self.fallback_prompt = fallback_prompt
+        self.strict_prompt_provider = strict_prompt_provider
+
+    async def extract_structured(
+        self,
+        *,
+        prompt_name: str,
+        prompt_version: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+        system_prompt: str | None = None,
+    ) -> dict[str, Any]:
+        if system_prompt is None:
+            system_prompt = await self._aresolve_prompt(
+                prompt_name=prompt_name,
+                prompt_version=prompt_version,
             )
-            return self.fallback_prompt
+        return await self.generator.generate_structured(
+            system_prompt=system_prompt,
+            input_text=input_text,
+            output_schema=output_schema,
+            temperature=temperature,
+        )
 
-        return prompt
+    def close(self) -> None:
+        close_resource(self.generator)
+        close_resource(self.prompt_provider)
+
+    async def acache_identity(self, *, prompt_name: str, prompt_version: str) -> dict[str, str]:
+        return {
+            "prompt_text": await self._aresolve_prompt(
+                prompt_name=prompt_name,
+                prompt_version=prompt_version,
+            ),
+            "model": _model_identity(self.generator),
+            "model_name": str(getattr(self.generator, "model", "")),
+        }
+
+    async def _aresolve_prompt(self, *, prompt_name: str, prompt_version: str) -> str:
+        provider = self.prompt_provider
+        if provider is None:
+            return self._prompt_without_provider()
+
+        try:
+            if inspect.iscoroutinefunction(provider.get_prompt):
+                prompt = await provider.get_prompt(
+                    prompt_name=prompt_name,
+                    prompt_version=prompt_version,
+                )
+            else:
+                prompt = await asyncio.to_thread(
+                    provider.get_prompt,
+                    prompt_name=prompt_name,
+                    prompt_version=prompt_version,
+                )
+        except Exception as exc:
+            return self._prompt_after_provider_error(
+                exc,
+                prompt_name=prompt_name,
+                prompt_version=prompt_version,
+            )
+
+        return self._checked_prompt(
+            prompt,
+            prompt_name=prompt_name,
+            prompt_version=prompt_version,
+        )
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import random
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from medlabs_sdk.contracts import StructuredGenerator
+from medlabs_sdk.core.extract.resilience import is_retryable_error
+from medlabs_sdk.providers.client_registry import close_resource
+
+_CLOSED = "closed"
+_OPEN = "open"
+_HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True, slots=True)
+class RouteBackend:
+    """One `StructuredGenerator` behind a `RoutingGenerator`, e.g. an OpenAI-compatible endpoint.
+
+    `weight` scales the backend's share of traffic relative to the others.
+    """
+
+    name: str
+    generator: StructuredGenerator
+    weight: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.weight <= 0:
+            raise ValueError("weight must be > 0")
+
+
+@dataclass(slots=True)
+class _BackendState:
+    backend: RouteBackend
+    latency_s: float | None = None
+    error_rate: float = 0.0
+    inflight: int = 0
+    requests: int = 0
+    successes: int = 0
+    failures: int = 0
+    fallbacks: int = 0
+    circuit: str = _CLOSED
+    circuit_opens: int = 0
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+
+
+class RoutingGenerator:
+    """Load-balancing `StructuredGenerator` over several backends.
+
+    - each request goes to a backend drawn with probability proportional to
+      `weight * (1 - error_rate) / (latency * (inflight + 1))`, where latency and
+      error rate are EWMAs (`ewma_alpha`) of the backend's recent calls
+    - when a call fails with an error accepted by `fallback_on` (timeouts,
+      connection errors, 429/5xx by default), the request falls back to the
+      remaining backends in the same weighted order
+    - `failure_threshold` consecutive failures open a backend's circuit: it gets no
+      traffic for `cooldown_s`, then a single probe request decides whether it closes
+
+    Other errors (e.g. a rejected request) are raised without fallback and do not
+    count against the backend.
+
+    The router is synchronous; `MedLabsPipeline` runs it for `aparse_*` in worker
+    threads instead of using an async client.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[RouteBackend],
+        *,
+        ewma_alpha: float = 0.2,
+        failure_threshold: int = 5,
+        cooldown_s: float = 30.0,
+        fallback_on: Callable[[BaseException], bool] = is_retryable_error,
+        clock: Callable[[], float] = monotonic,
+        random_fraction: Callable[[], float] = random.random,
+    ) -> None:
+        if not backends:
+            raise ValueError("At least one backend is required")
+        names = [backend.name for backend in backends]
+        if len(set(names)) != len(names):
+            raise ValueError("Backend names must be unique")
+        if not 0 < ewma_alpha <= 1:
+            raise ValueError("ewma_alpha must be in (0, 1]")
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        self.backends = tuple(backends)
+        self.ewma_alpha = ewma_alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown_s = cooldown_s
+        self.fallback_on = fallback_on
+        self._clock = clock
+        self._random = random_fraction
+        self._states = [_BackendState(backend=backend) for backend in self.backends]
+        self._lock = threading.Lock()
+
+    @property
+    def model(self) -> str:
+        """The model every backend serves, or "" when backends run different models."""
+
+        models = self._models()
+        return models[0] if len(models) == 1 else ""
+
+    @property
+    def model_identity(self) -> str:
+        # Keys extraction caches (`PromptedLLMClient.cache_identity`): answers may come
+        # from any backend. Not a model name; never send it to a provider.
+        return "|".join(self._models())
+
+    def generate_structured(
+        self,
+        *,
+        system_prompt: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+    ) -> dict[str, Any]:
+        route = self._route()
+        if not route:
+            raise RuntimeError("All LLM backends are unavailable (circuit open)")
+
+        last_error: BaseException | None = None
+        for position, state in enumerate(route):
+            if position > 0 and not self._admit(state):
+                continue
+            start = self._clock()
+            try:
+                payload = state.backend.generator.generate_structured(
+                    system_prompt=system_prompt,
+                    input_text=input_text,
+                    output_schema=output_schema,
+                    temperature=temperature,
+                )
+            except Exception as exc:
+                if not self.fallback_on(exc):
+                    self._record_neutral(state)
+                    raise
+                self._record_failure(state)
+                last_error = exc
+                continue
+            self._record_success(state, self._clock() - start, fallback=position > 0)
+            return payload
+
+        assert last_error is not None
+        raise last_error
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                state.backend.name: {
+                    "requests": state.requests,
+                    "successes": state.successes,
+                    "failures": state.failures,
+                    "fallbacks": state.fallbacks,
+                    "inflight": state.inflight,
+                    "latency_ewma_ms": (
+                        None if state.latency_s is None else round(state.latency_s * 1000, 3)
+                    ),
+                    "error_rate": round(state.error_rate, 4),
+                    "circuit": self._circuit(state, self._clock()),
+                    "circuit_opens": state.circuit_opens,
+                }
+                for state in self._states
+            }
+
+    def close(self) -> None:
+        for backend in self.backends:
+            close_resource(backend.generator)
+
+    def __enter__(self) -> RoutingGenerator:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _models(self) -> list[str]:
+        return list(
+            dict.fromkeys(str(getattr(backend.generator, "model", "")) for backend in self.backends)
+        )
+
+    def _route(self) -> list[_BackendState]:
+        """Available backends in weighted random order; the first one is admitted."""
+
+        with self._lock:
+            now = self._clock()
+            candidates = [
+                state
+                for state in self._states
+                if self._circuit(state, now) != _OPEN and not state.probing
+            ]
+            known = [state.latency_s for state in candidates if state.latency_s is not None]
+            # Unmeasured backends are assumed as fast as the fastest one so they get tried.
+            default_latency = min(known) if known else 1.0
+            shares = [
+                state.backend.weight
+                * max(0.01, 1.0 - state.error_rate)
+                / (max(state.latency_s or default_latency, 1e-6) * (state.inflight + 1))
+                for state in candidates
+            ]
+            top = max(shares, default=1.0)
+            # Weighted sampling without replacement (Efraimidis-Spirakis keys u ** (1 / w)).
+            keyed = [
+                (self._random() ** (top / share), state)
+                for share, state in zip(shares, candidates, strict=True)
+            ]
+            keyed.sort(key=lambda item: item[0], reverse=True)
+            route = [state for _, state in keyed]
+            if route:
+                self._admit_locked(route[0], now)
+            return route
+
+    def _admit(self, state: _BackendState) -> bool:
+        with self._lock:
+            now = self._clock()
+            if self._circuit(state, now) == _OPEN or state.probing:
+                return False
+            self._admit_locked(state, now)
+            return True
+
+    def _admit_locked(self, state: _BackendState, now: float) -> None:
+        if self._circuit(state, now) == _HALF_OPEN:
+            state.circuit = _HALF_OPEN
+            state.probing = True
+        state.requests += 1
+        state.inflight += 1
+
+    def _circuit(self, state: _BackendState, now: float) -> str:
+        if state.circuit == _OPEN and now - state.opened_at >= self.cooldown_s:
+            return _HALF_OPEN
+        return state.circuit
+
+    def _record_success(self, state: _BackendState, latency_s: float, *, fallback: bool) -> None:
+        alpha = self.ewma_alpha
+        with self._lock:
+            state.inflight -= 1
+            state.successes += 1
+            state.fallbacks += int(fallback)
+            state.latency_s = (
+                latency_s
+                if state.latency_s is None
+                else alpha * latency_s + (1 - alpha) * state.latency_s
+            )
+            state.error_rate *= 1 - alpha
+            state.consecutive_failures = 0
+            state.circuit = _CLOSED
+            state.probing = False
+
+    def _record_failure(self, state: _BackendState) -> None:
+        alpha = self.ewma_alpha
+        with self._lock:
+            state.inflight -= 1
+            state.failures += 1
+            state.error_rate = alpha + (1 - alpha) * state.error_rate
+            state.consecutive_failures += 1
+            if state.probing or state.consecutive_failures >= self.failure_threshold:
+                if state.circuit != _OPEN:
+                    state.circuit_opens += 1
+                state.circuit = _OPEN
+                state.opened_at = self._clock()
+            state.probing = False
+
+    def _record_neutral(self, state: _BackendState) -> None:
+        with self._lock:
+            state.inflight -= 1
+            state.probing = False
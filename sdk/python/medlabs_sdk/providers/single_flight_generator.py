@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from time import monotonic
+from typing import Any
+
+from medlabs_sdk.contracts import StructuredGenerator
+from medlabs_sdk.providers.client_registry import close_resource
+from medlabs_sdk.providers.prompted_llm_client import _model_identity
+
+_RequestKey = tuple[str, str, str, float]
+
+
+class TokenBucket:
+    """Thread-safe token bucket: refills `rate` tokens per second up to `burst`."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        *,
+        clock: Callable[[], float] = monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available; returns the seconds spent waiting."""
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+class SingleFlightGenerator:
+    """Single-flight and rate-limiting front for a `StructuredGenerator`.
+
+    - identical requests in flight share one upstream call (single-flight)
+    - upstream calls are capped by `max_concurrency` and, when `rate_per_second`
+      is set, by a token bucket of `burst` tokens
+
+    Requests are sent as soon as a slot is free: chat-completion endpoints take one
+    request per call, so holding requests back to gather a batch would only add latency.
+    """
+
+    def __init__(
+        self,
+        generator: StructuredGenerator,
+        *,
+        max_concurrency: int = 8,
+        rate_per_second: float | None = None,
+        burst: float | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self.generator = generator
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = TokenBucket(rate_per_second, burst) if rate_per_second else None
+        self.requests = 0
+        self.coalesced = 0
+        self.upstream_calls = 0
+        self._inflight: dict[_RequestKey, Future[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._closed = False
+
+    @property
+    def model(self) -> str:
+        # Keeps `PromptedLLMClient.cache_identity` the same as for the bare generator.
+        return str(getattr(self.generator, "model", ""))
+
+    @property
+    def model_identity(self) -> str:
+        return _model_identity(self.generator)
+
+    def generate_structured(
+        self,
+        *,
+        system_prompt: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+    ) -> dict[str, Any]:
+        key = (
+            system_prompt,
+            input_text,
+            json.dumps(output_schema, sort_keys=True, ensure_ascii=False),
+            temperature,
+        )
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SingleFlightGenerator is closed")
+            self.requests += 1
+            future = self._inflight.get(key)
+            leader = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if leader:
+            # The key is registered before waiting for a slot, so identical requests
+            # still coalesce while the upstream is saturated.
+            self._call(
+                key,
+                future,
+                system_prompt=system_prompt,
+                input_text=input_text,
+                output_schema=output_schema,
+                temperature=temperature,
+            )
+        # Every caller gets its own copy: the payload is shared by all coalesced callers.
+        return copy.deepcopy(future.result())
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "upstream_calls": self.upstream_calls,
+        }
+
+    def close(self) -> None:
+        """Reject new requests and close the generator; calls in flight still finish."""
+
+        with self._lock:
+            self._closed = True
+        close_resource(self.generator)
+
+    def __enter__(self) -> SingleFlightGenerator:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _call(self, key: _RequestKey, future: Future[dict[str, Any]], **kwargs: Any) -> None:
+        try:
+            with self._slots:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                with self._lock:
+                    self.upstream_calls += 1
+                payload = self.generator.generate_structured(**kwargs)
+        except BaseException as exc:
+            self._settle(key)
+            future.set_exception(exc)
+        else:
+            self._settle(key)
+            future.set_result(payload)
+
+    def _settle(self, key: _RequestKey) -> None:
+        # Results are not cached: the next identical request makes a new call.
+        with self._lock:
+            self._inflight.pop(key, None)
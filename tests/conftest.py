@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from medlabs_sdk.core.normalize import names as names_module
+from medlabs_sdk.core.normalize import units as units_module
+
+
+@pytest.fixture
+def isolated_aliases() -> Iterator[None]:
+    """Undo `register_name_alias`/`register_unit_alias` calls made by a test."""
+
+    tables = [
+        (names_module, names_module._ALIAS_MAP, names_module._canonicalize_name),
+        (units_module, units_module._UNIT_ALIASES, units_module._normalize_unit),
+    ]
+    snapshots = [dict(table) for _, table, _ in tables]
+    yield
+    for (module, table, memo), snapshot in zip(tables, snapshots, strict=True):
+        with module._alias_lock:
+            table.clear()
+            table.update(snapshot)
+            # Moving the generation forward (never back) keeps memoized lookups and
+            # compiled panel plans from the test from being served again.
+            module._alias_generation += 1
+        memo.cache_clear()
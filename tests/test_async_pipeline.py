@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import medlabs_sdk.pipeline as pipeline_module
+import pytest
+from medlabs_sdk.pipeline import MedLabsPipeline
+from medlabs_sdk.providers.noop_tracer import NoopTracer
+from medlabs_sdk.providers.openai_client import AsyncOpenAIClient
+from medlabs_sdk.providers.prompted_llm_client import AsyncPromptedLLMClient
+
+_PAYLOAD: dict[str, Any] = {
+    "fields": [
+        {
+            "name_raw": "WBC",
+            "value_raw": "5,4",
+            "unit_raw": "x10^9/L",
+            "ref_raw": "4.0-10.0",
+            "confidence": 0.95,
+        }
+    ]
+}
+
+
+class AsyncMockLLMClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def extract_structured(
+        self,
+        *,
+        prompt_name: str,
+        prompt_version: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+    ) -> dict[str, Any]:
+        del prompt_name, prompt_version, input_text, output_schema, temperature
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return _PAYLOAD
+
+
+class SyncMockLLMClient:
+    def extract_structured(self, **kwargs: Any) -> dict[str, Any]:
+        del kwargs
+        return _PAYLOAD
+
+
+def test_aparse_text_runs_workflow_with_async_client() -> None:
+    client = AsyncMockLLMClient()
+    pipeline = MedLabsPipeline(
+        async_llm_client=client,
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        tracer=NoopTracer(),
+    )
+
+    async def run() -> list[Any]:
+        return await asyncio.gather(
+            *(
+                pipeline.aparse_text(
+                    "mock input",
+                    panel="CBC",
+                    document_meta={"document_id": f"doc-{index}"},
+                )
+                for index in range(5)
+            )
+        )
+
+    results = asyncio.run(run())
+
+    assert client.calls == 5
+    assert all(result.validation.is_valid for result in results)
+    assert pipeline.last_state is not None
+    assert [step.pipeline_step for step in pipeline.last_state.steps] == [
+        "ingest",
+        "extract",
+        "normalize",
+        "map",
+        "validate",
+    ]
+    assert all(isinstance(step.duration_ms, float) for step in pipeline.last_state.steps)
+
+
+def test_aparse_text_runs_cpu_stages_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    threads: dict[str, int] = {}
+
+    def record(name: str, func: Any) -> Any:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            threads[name] = threading.get_ident()
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    for name in ("normalize", "to_standard_panel", "validate_jsonschema"):
+        monkeypatch.setattr(pipeline_module, name, record(name, getattr(pipeline_module, name)))
+    pipeline = MedLabsPipeline(
+        async_llm_client=AsyncMockLLMClient(),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        tracer=NoopTracer(),
+    )
+
+    async def run() -> tuple[int, Any]:
+        return threading.get_ident(), await pipeline.aparse_text("mock input", panel="CBC")
+
+    loop_thread, result = asyncio.run(run())
+
+    assert result.validation.is_valid
+    assert set(threads) == {"normalize", "to_standard_panel", "validate_jsonschema"}
+    assert loop_thread not in threads.values()
+
+
+def test_aparse_text_falls_back_to_sync_client() -> None:
+    pipeline = MedLabsPipeline(
+        llm_client=SyncMockLLMClient(),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        tracer=NoopTracer(),
+    )
+
+    result = asyncio.run(pipeline.aparse_text("mock input", panel="CBC"))
+
+    assert result.validation.is_valid
+    assert len(result.mapped.data["observations"]) == 1
+
+
+class FakeAsyncCompletions:
+    def __init__(self) -> None:
+        self.request: dict[str, Any] | None = None
+
+    async def create(self, **kwargs: Any) -> Any:
+        self.request = kwargs
+        message = SimpleNamespace(content=json.dumps(_PAYLOAD))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class SyncPromptProvider:
+    def get_prompt(self, *, prompt_name: str, prompt_version: str) -> str:
+        return f"prompt:{prompt_name}:{prompt_version}"
+
+
+class AsyncPromptProvider:
+    async def get_prompt(self, *, prompt_name: str, prompt_version: str) -> str:
+        return f"async-prompt:{prompt_name}:{prompt_version}"
+
+
+def test_async_prompted_client_uses_async_openai_transport() -> None:
+    completions = FakeAsyncCompletions()
+    openai_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    generator = AsyncOpenAIClient(model="test-model", openai_client=openai_client)
+
+    for provider, expected_prompt in (
+        (SyncPromptProvider(), "prompt:medlabs.extract:v1"),
+        (AsyncPromptProvider(), "async-prompt:medlabs.extract:v1"),
+    ):
+        client = AsyncPromptedLLMClient(prompt_provider=provider, generator=generator)
+        payload = asyncio.run(
+            client.extract_structured(
+                prompt_name="medlabs.extract",
+                prompt_version="v1",
+                input_text="hello",
+                output_schema={"type": "object"},
+            )
+        )
+
+        assert payload == _PAYLOAD
+        assert completions.request is not None
+        assert completions.request["model"] == "test-model"
+        assert completions.request["messages"][0]["content"] == expected_prompt
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from medlabs_sdk.bulk import BulkExtraction
+from medlabs_sdk.core.extract import RegexExtractor
+from medlabs_sdk.core.map import DeterministicIds
+from medlabs_sdk.core.models import RawDocument
+from medlabs_sdk.pipeline import BatchItem, MedLabsPipeline
+from medlabs_sdk.providers import (
+    PromptedLLMClient,
+    RouteBackend,
+    RoutingGenerator,
+    run_batch_file,
+)
+
+BIOCHEM_TEXT = "Glucose 4.9 mmol/L (3.9-5.5)\nCreatinine 74 umol/L (62-106)\nALT 22 U/L (0-40)"
+
+
+class RegexGenerator:
+    """Stand-in model: answers with the regex extraction of the input text."""
+
+    model = "stub-model"
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.fail_on = fail_on
+        self.calls = 0
+        self._extractor = RegexExtractor()
+
+    def generate_structured(
+        self,
+        *,
+        system_prompt: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+    ) -> dict[str, Any]:
+        del system_prompt, output_schema, temperature
+        self.calls += 1
+        if self.fail_on is not None and self.fail_on in input_text:
+            raise RuntimeError("model overloaded")
+        report = self._extractor.extract(RawDocument(text=input_text))
+        return {
+            "fields": [
+                {
+                    "name_raw": field.name_raw,
+                    "value_raw": field.value_raw,
+                    "unit_raw": field.unit_raw,
+                    "ref_raw": field.ref_raw,
+                    "confidence": 0.9,
+                }
+                for field in report.fields
+            ]
+        }
+
+
+def _pipeline(**kwargs: Any) -> MedLabsPipeline:
+    return MedLabsPipeline(
+        llm_client=PromptedLLMClient(prompt_provider=None, generator=RegexGenerator()),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        id_strategy=DeterministicIds(),
+        **kwargs,
+    )
+
+
+def _items() -> list[BatchItem]:
+    return [
+        BatchItem(source=BIOCHEM_TEXT, panel="BIOCHEM", document_meta={"document_id": "doc-a"}),
+        BatchItem(
+            source=BIOCHEM_TEXT.replace("4.9", "8.2"),
+            panel="BIOCHEM",
+            document_meta={"document_id": "doc-b"},
+        ),
+    ]
+
+
+def test_bulk_results_match_synchronous_parsing(tmp_path: Path) -> None:
+    pipeline = _pipeline()
+    bulk = BulkExtraction(pipeline, tmp_path)
+
+    assert bulk.prepare(_items()) == 2
+    request = json.loads(bulk.requests_path.read_text(encoding="utf-8").splitlines()[0])
+    assert request["url"] == "/v1/chat/completions"
+    assert request["body"]["model"] == "stub-model"
+    assert request["body"]["messages"][1]["content"] == BIOCHEM_TEXT
+
+    assert run_batch_file(bulk.requests_path, tmp_path / "results.jsonl", RegexGenerator()) == 0
+    results = list(bulk.run(tmp_path / "results.jsonl"))
+
+    assert [result.ok for result in results] == [True, True]
+    for batch_result, item in zip(results, _items(), strict=True):
+        direct = pipeline.parse_text(
+            item.source, panel=item.panel, document_meta=item.document_meta
+        )
+        assert batch_result.result is not None
+        assert batch_result.result.mapped.data == direct.mapped.data
+        assert batch_result.result.validation.is_valid
+    assert [step.pipeline_step for step in results[0].steps] == [
+        "extract",
+        "normalize",
+        "map",
+        "validate",
+    ]
+    assert results[0].steps[0].attrs == {"source": "batch", "requests": 1}
+
+
+def test_interrupted_run_resumes_from_checkpoint(tmp_path: Path) -> None:
+    bulk = BulkExtraction(_pipeline(), tmp_path)
+    bulk.prepare(_items())
+    results_path = tmp_path / "results.jsonl"
+    run_batch_file(bulk.requests_path, results_path, RegexGenerator(fail_on="8.2"))
+
+    first = list(bulk.run(results_path))
+    assert [result.ok for result in first] == [True, False]
+    assert "model overloaded" in str(first[1].error)
+
+    # Simulate a crash in the middle of writing the next checkpoint entry.
+    with bulk.checkpoint_path.open("a", encoding="utf-8") as checkpoint:
+        checkpoint.write('{"index": 1, "res')
+
+    run_batch_file(bulk.requests_path, results_path, RegexGenerator())
+    second = list(bulk.run(results_path))
+
+    assert [result.ok for result in second] == [True, True]
+    assert second[0].steps == []  # loaded from the checkpoint
+    assert second[0].result == first[0].result
+    assert second[1].steps
+    checkpoint_lines = bulk.checkpoint_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["index"] for line in checkpoint_lines] == [0, 1]
+
+
+def test_chunked_documents_are_merged(tmp_path: Path) -> None:
+    pipeline = _pipeline(max_chunk_chars=32)
+    bulk = BulkExtraction(pipeline, tmp_path)
+
+    assert bulk.prepare(_items()[:1]) == 3
+    run_batch_file(bulk.requests_path, tmp_path / "results.jsonl", RegexGenerator())
+    (result,) = bulk.run(tmp_path / "results.jsonl")
+
+    direct = pipeline.parse_text(
+        BIOCHEM_TEXT, panel="BIOCHEM", document_meta={"document_id": "doc-a"}
+    )
+    assert result.result is not None
+    assert result.result.mapped.data == direct.mapped.data
+    assert result.result.extracted.meta["chunk_count"] == 3
+
+
+def test_missing_results_are_reported(tmp_path: Path) -> None:
+    bulk = BulkExtraction(_pipeline(), tmp_path)
+    bulk.prepare(_items())
+    results_path = tmp_path / "results.jsonl"
+    run_batch_file(bulk.requests_path, results_path, RegexGenerator())
+    results_path.write_text(
+        results_path.read_text(encoding="utf-8").splitlines()[0] + "\n", encoding="utf-8"
+    )
+
+    results = list(bulk.run(results_path))
+
+    assert results[0].ok
+    assert "no entry for 'doc-1-0'" in str(results[1].error)
+
+
+def test_results_are_read_in_document_order_from_any_file_order(tmp_path: Path) -> None:
+    bulk = BulkExtraction(_pipeline(), tmp_path)
+    bulk.prepare(_items())
+    results_path = tmp_path / "results.jsonl"
+    run_batch_file(bulk.requests_path, results_path, RegexGenerator())
+    lines = results_path.read_text(encoding="utf-8").splitlines()
+    results_path.write_text("\n".join(reversed(lines)) + "\n\n", encoding="utf-8")
+
+    results = list(bulk.run(results_path))
+
+    assert [result.ok for result in results] == [True, True]
+    assert [result.item.document_meta for result in results] == [
+        item.document_meta for item in _items()
+    ]
+
+
+def test_unreadable_pdf_is_an_errored_item(tmp_path: Path) -> None:
+    bulk = BulkExtraction(_pipeline(), tmp_path)
+    items = [
+        _items()[0],
+        BatchItem(source=str(tmp_path / "missing.pdf"), panel="BIOCHEM", kind="pdf"),
+        _items()[1],
+    ]
+
+    assert bulk.prepare(items) == 2
+    run_batch_file(bulk.requests_path, tmp_path / "results.jsonl", RegexGenerator())
+    results = list(bulk.run(tmp_path / "results.jsonl"))
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert "Ingest failed" in str(results[1].error)
+
+
+def test_client_without_identity_needs_explicit_prompt(tmp_path: Path) -> None:
+    class BareClient:
+        def extract_structured(self, **kwargs: Any) -> dict[str, Any]:
+            return {"fields": []}
+
+    pipeline = MedLabsPipeline(
+        llm_client=BareClient(), prompt_name="medlabs.extract", prompt_version="v1"
+    )
+
+    with pytest.raises(RuntimeError, match="system prompt and a single model"):
+        BulkExtraction(pipeline, tmp_path).prepare(_items())
+    assert (
+        BulkExtraction(pipeline, tmp_path, system_prompt="Extract.", model="m").prepare(_items())
+        == 2
+    )
+
+
+def test_routed_models_need_an_explicit_batch_model(tmp_path: Path) -> None:
+    hosted, vllm = RegexGenerator(), RegexGenerator()
+    vllm.model = "stub-model-vllm"
+    router = RoutingGenerator([RouteBackend("hosted", hosted), RouteBackend("vllm", vllm)])
+    pipeline = MedLabsPipeline(
+        llm_client=PromptedLLMClient(prompt_provider=None, generator=router),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+    )
+
+    with pytest.raises(RuntimeError, match="single model"):
+        BulkExtraction(pipeline, tmp_path).prepare(_items())
+
+    bulk = BulkExtraction(pipeline, tmp_path, model="stub-model")
+    bulk.prepare(_items())
+    requests = [json.loads(line) for line in bulk.requests_path.read_text().splitlines()]
+    assert {request["body"]["model"] for request in requests} == {"stub-model"}
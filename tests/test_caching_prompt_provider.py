@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from medlabs_sdk.providers.caching_prompt_provider import (
+    CachingPromptProvider,
+    StaticPromptProvider,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class BlockingPromptProvider(StaticPromptProvider):
+    def __init__(self) -> None:
+        super().__init__({("medlabs.extract", "v1"): "prompt v1"})
+        self.release = threading.Event()
+        self.fail = False
+
+    def get_prompt(self, *, prompt_name: str, prompt_version: str) -> str:
+        if self.calls > 0:
+            self.release.wait(timeout=5)
+        if self.fail:
+            self.calls += 1
+            raise RuntimeError("provider down")
+        return super().get_prompt(prompt_name=prompt_name, prompt_version=prompt_version)
+
+
+def test_caching_prompt_provider_serves_hits_without_provider_call() -> None:
+    provider = StaticPromptProvider({("medlabs.extract", "v1"): "prompt v1"})
+    cached = CachingPromptProvider(provider, ttl_seconds=60, clock=FakeClock())
+
+    for _ in range(100):
+        assert cached.get_prompt(prompt_name="medlabs.extract", prompt_version="v1") == "prompt v1"
+
+    assert provider.calls == 1
+    assert (cached.hits, cached.misses) == (99, 1)
+
+
+def test_caching_prompt_provider_refreshes_stale_prompt_in_background() -> None:
+    clock = FakeClock()
+    provider = BlockingPromptProvider()
+    cached = CachingPromptProvider(provider, ttl_seconds=10, stale_ttl_seconds=100, clock=clock)
+    cached.get_prompt(prompt_name="medlabs.extract", prompt_version="v1")
+
+    provider.prompts[("medlabs.extract", "v1")] = "prompt v2"
+    clock.now = 20
+    assert cached.get_prompt(prompt_name="medlabs.extract", prompt_version="v1") == "prompt v1"
+    assert cached.get_prompt(prompt_name="medlabs.extract", prompt_version="v1") == "prompt v1"
+
+    provider.release.set()
+    for thread in threading.enumerate():
+        if thread.name == "medlabs-prompt-refresh":
+            thread.join(timeout=5)
+
+    assert provider.calls == 2
+    assert cached.get_prompt(prompt_name="medlabs.extract", prompt_version="v1") == "prompt v2"
+
+
+def test_caching_prompt_provider_serves_last_known_good_on_failure() -> None:
+    clock = FakeClock()
+    provider = BlockingPromptProvider()
+    provider.release.set()
+    cached = CachingPromptProvider(
+        provider,
+        ttl_seconds=10,
+        stale_ttl_seconds=0,
+        clock=clock,
+    )
+    cached.get_prompt(prompt_name="medlabs.extract", prompt_version="v1")
+
+    provider.fail = True
+    clock.now = 1000
+
+    assert cached.get_prompt(prompt_name="medlabs.extract", prompt_version="v1") == "prompt v1"
+    assert cached.refresh_errors == 1
+    with pytest.raises(RuntimeError, match="provider down"):
+        cached.get_prompt(prompt_name="medlabs.extract", prompt_version="v2")
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from typing import Any
+
+from medlabs_sdk.core.extract import AIExtractor, AsyncAIExtractor
+from medlabs_sdk.core.extract.chunking import split_document
+from medlabs_sdk.core.models import RawDocument
+from medlabs_sdk.pipeline import MedLabsPipeline
+from medlabs_sdk.providers.noop_tracer import NoopTracer
+
+_LINE_RE = re.compile(r"^(?P<name>\w+) (?P<value>[\d.]+)$", re.MULTILINE)
+
+
+def _payload_for(input_text: str) -> dict[str, Any]:
+    fields = [
+        {
+            "name_raw": match.group("name"),
+            "value_raw": match.group("value"),
+            "unit_raw": "x10^9/L",
+            "evidence": {"page": 1, "raw_text": match.group(0)},
+        }
+        for match in _LINE_RE.finditer(input_text)
+    ]
+    return {"fields": fields, "warnings": []}
+
+
+class PageEchoLLMClient:
+    """Returns one field per `NAME value` line, always citing page 1 of its input."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.inputs: list[str] = []
+
+    def extract_structured(self, *, input_text: str, **kwargs: Any) -> dict[str, Any]:
+        del kwargs
+        self.inputs.append(input_text)
+        time.sleep(self.delay)
+        payload = _payload_for(input_text)
+        if not payload["fields"]:
+            payload["fields"] = ["not-an-object"]
+        return payload
+
+
+class AsyncPageEchoLLMClient:
+    async def extract_structured(self, *, input_text: str, **kwargs: Any) -> dict[str, Any]:
+        del kwargs
+        await asyncio.sleep(0.01)
+        return _payload_for(input_text)
+
+
+def _document(page_count: int) -> RawDocument:
+    pages = [f"WBC{index} {index}.5\nHEADER 1.0" for index in range(page_count)]
+    return RawDocument(text="\n\n".join(pages), pages=pages)
+
+
+def test_chunked_extraction_merges_pages_concurrently() -> None:
+    client = PageEchoLLMClient(delay=0.05)
+    extractor = AIExtractor(
+        client,
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        chunk_pages=1,
+        max_concurrency=20,
+    )
+
+    start = time.perf_counter()
+    report = extractor.extract(_document(20))
+    elapsed = time.perf_counter() - start
+
+    assert len(client.inputs) == 20
+    assert elapsed < 0.5
+    names = [field.name_raw for field in report.fields]
+    assert names[:3] == ["WBC0", "HEADER", "WBC1"]
+    assert names.count("HEADER") == 20
+    assert len(report.fields) == 40
+    assert [field.evidence["page"] for field in report.fields if field.name_raw == "WBC7"] == [8]
+    assert report.meta["chunk_count"] == 20
+
+
+def test_chunked_extraction_prefixes_chunk_warnings() -> None:
+    pages = ["WBC 5.5", "no values here"]
+    extractor = AIExtractor(
+        PageEchoLLMClient(),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        chunk_pages=1,
+    )
+
+    report = extractor.extract(RawDocument(text="\n\n".join(pages), pages=pages))
+
+    assert report.warnings == ["chunk 2: fields[0] is not an object"]
+
+
+def test_merge_keeps_equal_fields_from_different_chunks() -> None:
+    extractor = AIExtractor(
+        PageEchoLLMClient(),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        max_chunk_chars=8,
+    )
+
+    report = extractor.extract(RawDocument(text="GLU 5.1\nGLU 5.1\nGLU 5.1"))
+
+    assert [field.name_raw for field in report.fields] == ["GLU"] * 3
+
+
+def test_merge_drops_repeats_within_a_chunk_page() -> None:
+    document = _document(4)
+    extractor = AsyncAIExtractor(
+        AsyncPageEchoLLMClient(),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        chunk_pages=2,
+    )
+
+    report = asyncio.run(extractor.extract(document))
+
+    # The stub cites page 1 of each two-page chunk for both HEADER lines.
+    assert [field.evidence["page"] for field in report.fields if field.name_raw == "HEADER"] == [
+        1,
+        3,
+    ]
+
+
+def test_split_document_uses_char_windows_without_pages() -> None:
+    text = "\n".join(f"LINE{index} {index}.0" for index in range(10))
+
+    chunks = split_document(RawDocument(text=text), max_chunk_chars=40)
+
+    assert all(len(chunk.text) <= 40 for chunk in chunks)
+    assert "".join(chunk.text for chunk in chunks) == text
+    assert all(chunk.first_page is None for chunk in chunks)
+
+
+def test_async_chunked_extraction_matches_sync_merge() -> None:
+    document = _document(6)
+    extractor = AsyncAIExtractor(
+        AsyncPageEchoLLMClient(),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        chunk_pages=2,
+    )
+
+    report = asyncio.run(extractor.extract(document))
+
+    assert [field.evidence["page"] for field in report.fields if field.name_raw == "WBC2"] == [3]
+    assert report.meta["chunk_count"] == 3
+
+
+def test_pipeline_records_chunk_count() -> None:
+    pipeline = MedLabsPipeline(
+        llm_client=PageEchoLLMClient(),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        tracer=NoopTracer(),
+        max_chunk_chars=20,
+    )
+
+    pipeline.parse_text("WBC 5.5\nRBC 4.6\nHGB 14.1", panel="CBC")
+
+    assert pipeline.last_state is not None
+    assert pipeline.last_state.steps[1].attrs == {"chunks": 2}
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from medlabs_sdk.pipeline import MedLabsPipeline, PipelineRuntimeConfig
+from medlabs_sdk.providers import (
+    AsyncOpenAIClient,
+    ClientRegistry,
+    LangfusePromptProvider,
+    LangfuseTracer,
+    OpenAIClient,
+    PoolLimits,
+    shared_client_registry,
+)
+
+
+class FakeSdkClient:
+    def __init__(self) -> None:
+        self.closed = 0
+
+    def close(self) -> None:
+        self.closed += 1
+
+
+class FakeAsyncSdkClient:
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.closed_on: list[asyncio.AbstractEventLoop] = []
+
+    async def close(self) -> None:
+        self.closed_on.append(asyncio.get_running_loop())
+
+
+class Closable:
+    def __init__(self) -> None:
+        self.closed = 0
+
+    def close(self) -> None:
+        self.closed += 1
+
+    def extract_structured(self, **kwargs: Any) -> dict[str, Any]:
+        return {"fields": []}
+
+
+@pytest.fixture
+def created(monkeypatch: pytest.MonkeyPatch) -> list[FakeSdkClient]:
+    clients: list[FakeSdkClient] = []
+    lock = threading.Lock()
+
+    def create(self: Any, registry: ClientRegistry) -> FakeSdkClient:
+        del self, registry
+        with lock:
+            clients.append(FakeSdkClient())
+            return clients[-1]
+
+    for provider in (OpenAIClient, LangfusePromptProvider, LangfuseTracer):
+        monkeypatch.setattr(provider, "_create_client", create)
+    return clients
+
+
+def test_concurrent_providers_share_one_client(created: list[FakeSdkClient]) -> None:
+    registry = ClientRegistry()
+    generators = [
+        OpenAIClient(api_key="key", base_url="http://llm", client_registry=registry)
+        for _ in range(16)
+    ]
+    barrier = threading.Barrier(len(generators))
+
+    def resolve(generator: OpenAIClient) -> Any:
+        barrier.wait()
+        return generator._resolve_openai_client()
+
+    with ThreadPoolExecutor(max_workers=len(generators)) as pool:
+        clients = list(pool.map(resolve, generators))
+
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
+    assert len(registry) == 1
+
+
+def test_client_is_closed_when_last_user_releases(created: list[FakeSdkClient]) -> None:
+    registry = ClientRegistry()
+    first = OpenAIClient(api_key="key", client_registry=registry)
+    second = OpenAIClient(api_key="key", client_registry=registry)
+    first._resolve_openai_client()
+    second._resolve_openai_client()
+
+    first.close()
+    first.close()
+    assert created[0].closed == 0
+
+    second.close()
+    assert created[0].closed == 1
+    assert len(registry) == 0
+
+
+def test_clients_are_keyed_by_endpoint_and_credentials(created: list[FakeSdkClient]) -> None:
+    registry = ClientRegistry()
+    OpenAIClient(api_key="a", client_registry=registry)._resolve_openai_client()
+    OpenAIClient(api_key="b", client_registry=registry)._resolve_openai_client()
+    OpenAIClient(
+        api_key="a", base_url="http://other", client_registry=registry
+    )._resolve_openai_client()
+
+    credentials = {"public_key": "pk", "secret_key": "sk", "host": "http://lf"}
+    LangfusePromptProvider(**credentials, client_registry=registry)._resolve_langfuse_client()
+    LangfuseTracer(**credentials, client_registry=registry)._resolve_langfuse_client()
+
+    assert len(created) == 4
+
+    registry.close()
+    assert [client.closed for client in created] == [1, 1, 1, 1]
+
+
+def test_explicit_client_is_left_open() -> None:
+    sdk_client = FakeSdkClient()
+    generator = OpenAIClient(openai_client=sdk_client)
+
+    assert generator._resolve_openai_client() is sdk_client
+    generator.close()
+    assert sdk_client.closed == 0
+
+
+def test_shared_registry_per_pool_limits() -> None:
+    limits = PoolLimits(max_connections=8, max_keepalive_connections=4)
+
+    assert shared_client_registry(limits) is shared_client_registry(PoolLimits(8, 4))
+    assert shared_client_registry(limits) is not shared_client_registry()
+    assert shared_client_registry().pool_limits == PoolLimits()
+
+
+def test_shared_registry_close_leaves_leased_clients_open(
+    created: list[FakeSdkClient],
+) -> None:
+    generator = OpenAIClient(api_key="shared-close", base_url="http://shared")
+    generator._resolve_openai_client()
+
+    shared_client_registry().close()
+    assert created[0].closed == 0
+
+    generator.close()
+    assert created[0].closed == 1
+
+
+def test_async_clients_are_leased_per_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        AsyncOpenAIClient, "_create_client", lambda self, registry: FakeAsyncSdkClient()
+    )
+    registry = ClientRegistry()
+    generator = AsyncOpenAIClient(api_key="key", client_registry=registry)
+    other = AsyncOpenAIClient(api_key="key", client_registry=registry)
+
+    async def resolve() -> tuple[Any, Any]:
+        return generator._resolve_openai_client(), other._resolve_openai_client()
+
+    first, first_other = asyncio.run(resolve())
+    second, _ = asyncio.run(resolve())
+
+    assert first is first_other
+    assert second is not first
+    assert second.loop is not first.loop
+    # The first loop is closed: its client is dropped, not closed on a new loop.
+    assert first.closed_on == []
+
+    async def close_inside_loop() -> None:
+        third, _ = await resolve()
+        generator.close()
+        other.close()
+        await asyncio.sleep(0)
+        assert third.closed_on == [third.loop]
+
+    asyncio.run(close_inside_loop())
+    assert len(registry) == 0
+
+
+def test_pipeline_closes_only_the_clients_it_created(monkeypatch: pytest.MonkeyPatch) -> None:
+    llm_client, async_llm_client, tracer = Closable(), Closable(), Closable()
+    runtime = PipelineRuntimeConfig(
+        llm_client=llm_client,  # type: ignore[arg-type]
+        async_llm_client=async_llm_client,  # type: ignore[arg-type]
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        tracer=tracer,  # type: ignore[arg-type]
+        schema_dir=None,
+        log_level="WARNING",
+    )
+    monkeypatch.setattr(
+        MedLabsPipeline, "_runtime_from_settings", classmethod(lambda cls, settings: runtime)
+    )
+
+    with MedLabsPipeline():
+        pass
+    assert [llm_client.closed, async_llm_client.closed, tracer.closed] == [1, 1, 1]
+
+    caller_client = Closable()
+    with MedLabsPipeline(
+        llm_client=caller_client,  # type: ignore[arg-type]
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+    ):
+        pass
+    assert caller_client.closed == 0
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+from medlabs_sdk.core.extract import (
+    AIExtractor,
+    AsyncAIExtractor,
+    ExtractPolicy,
+    ResilientCaller,
+    is_retryable_error,
+)
+from medlabs_sdk.core.models import RawDocument
+from medlabs_sdk.pipeline import MedLabsPipeline
+
+PAYLOAD = {"fields": [{"name_raw": "WBC", "value_raw": "5.4", "unit_raw": "10^9/L"}]}
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class ScriptedClient:
+    """Each call pops the next behaviour: a delay in seconds or an exception to raise."""
+
+    def __init__(self, *script: float | Exception) -> None:
+        self.script = list(script)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _next(self) -> float | Exception:
+        with self._lock:
+            self.calls += 1
+            return self.script.pop(0) if self.script else 0.0
+
+    def extract_structured(self, **kwargs: Any) -> dict[str, Any]:
+        step = self._next()
+        if isinstance(step, Exception):
+            raise step
+        time.sleep(step)
+        return PAYLOAD
+
+
+class AsyncScriptedClient(ScriptedClient):
+    async def extract_structured(self, **kwargs: Any) -> dict[str, Any]:  # type: ignore[override]
+        step = self._next()
+        if isinstance(step, Exception):
+            raise step
+        await asyncio.sleep(step)
+        return PAYLOAD
+
+
+def _extractor(client: Any, policy: ExtractPolicy) -> AIExtractor:
+    return AIExtractor(client, prompt_name="p", prompt_version="v", policy=policy)
+
+
+def test_retryable_errors_are_retried_with_backoff() -> None:
+    client = ScriptedClient(RateLimitError("slow down"), ConnectionError("reset"), 0.0)
+    extractor = _extractor(client, ExtractPolicy(max_attempts=3, backoff_base_s=0.001))
+
+    report = extractor.extract(RawDocument(text="WBC 5.4"))
+
+    assert client.calls == 3
+    assert [field.name_raw for field in report.fields] == ["WBC"]
+    attempts = report.meta["llm_attempts"]
+    assert [(item["attempt"], item["status"]) for item in attempts] == [
+        (1, "error"),
+        (2, "error"),
+        (3, "ok"),
+    ]
+    assert attempts[0]["error"] == "RateLimitError"
+
+
+def test_non_retryable_errors_fail_fast() -> None:
+    client = ScriptedClient(ValueError("bad schema"))
+    extractor = _extractor(client, ExtractPolicy(max_attempts=3, backoff_base_s=0.001))
+
+    with pytest.raises(ValueError, match="bad schema"):
+        extractor.extract(RawDocument(text="WBC 5.4"))
+    assert client.calls == 1
+
+
+def test_slow_call_times_out_and_is_retried() -> None:
+    client = ScriptedClient(1.0, 0.0)
+    extractor = _extractor(
+        client, ExtractPolicy(timeout_s=0.05, max_attempts=2, backoff_base_s=0.001)
+    )
+
+    start = time.perf_counter()
+    report = extractor.extract(RawDocument(text="WBC 5.4"))
+
+    assert time.perf_counter() - start < 0.5
+    assert [item["status"] for item in report.meta["llm_attempts"]] == ["timeout", "ok"]
+
+
+def test_hedged_request_takes_the_first_answer() -> None:
+    client = ScriptedClient(1.0, 0.0)
+    extractor = _extractor(client, ExtractPolicy(hedge=True, hedge_initial_delay_s=0.02))
+
+    start = time.perf_counter()
+    report = extractor.extract(RawDocument(text="WBC 5.4"))
+
+    assert time.perf_counter() - start < 0.5
+    assert client.calls == 2
+    (winner,) = report.meta["llm_attempts"]
+    assert winner["hedge"] is True
+    assert winner["status"] == "ok"
+
+
+def test_deadline_starts_when_the_call_starts() -> None:
+    caller = ResilientCaller(ExtractPolicy(timeout_s=0.1, max_attempts=1, max_workers=1))
+    blocker = threading.Thread(target=caller.call, args=(lambda: time.sleep(0.08),))
+    blocker.start()
+    time.sleep(0.01)
+
+    # Queued behind the blocker for ~70 ms, then runs for 50 ms: within its own deadline.
+    result, attempts = caller.call(lambda: time.sleep(0.05) or "ok")
+    blocker.join()
+    caller.close()
+
+    assert result == "ok"
+    assert [item["status"] for item in attempts] == ["ok"]
+
+
+def test_hedge_is_skipped_without_a_free_worker() -> None:
+    client = ScriptedClient(0.1)
+    caller = ResilientCaller(ExtractPolicy(hedge=True, hedge_initial_delay_s=0.01, max_workers=1))
+
+    _, attempts = caller.call(lambda: client.extract_structured())
+    caller.close()
+
+    assert client.calls == 1
+    assert [item["hedge"] for item in attempts] == [False]
+
+
+def test_winning_hedge_latency_is_measured_from_the_first_send() -> None:
+    client = ScriptedClient(1.0, 0.05)
+    caller = ResilientCaller(ExtractPolicy(hedge=True, hedge_initial_delay_s=0.05))
+
+    caller.call(lambda: client.extract_structured())
+    caller.close()
+
+    (latency_s,) = caller._latencies
+    assert latency_s >= 0.1
+
+
+def test_hedge_delay_follows_observed_latency_quantile() -> None:
+    caller = ResilientCaller(
+        ExtractPolicy(hedge=True, hedge_min_samples=10, hedge_initial_delay_s=2.0)
+    )
+    assert caller.hedge_delay_s() == 2.0
+
+    for latency_ms in range(1, 101):
+        caller._observe(latency_ms / 1000)
+
+    assert caller.hedge_delay_s() == pytest.approx(0.096)
+
+
+def test_backoff_is_exponential_with_full_jitter() -> None:
+    caller = ResilientCaller(
+        ExtractPolicy(backoff_base_s=0.5, backoff_max_s=3.0), random_fraction=lambda: 1.0
+    )
+
+    assert [caller.backoff_s(attempt) for attempt in (1, 2, 3, 4)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_async_extractor_hedges_and_cancels_the_loser() -> None:
+    client = AsyncScriptedClient(1.0, 0.0)
+    extractor = AsyncAIExtractor(
+        client,
+        prompt_name="p",
+        prompt_version="v",
+        policy=ExtractPolicy(hedge=True, hedge_initial_delay_s=0.02, timeout_s=0.5),
+    )
+
+    start = time.perf_counter()
+    report = asyncio.run(extractor.extract(RawDocument(text="WBC 5.4")))
+
+    assert time.perf_counter() - start < 0.5
+    assert [item["hedge"] for item in report.meta["llm_attempts"]] == [True]
+
+
+def test_attempts_are_recorded_in_extract_step_attrs() -> None:
+    client = ScriptedClient(RateLimitError("slow down"), 0.0)
+    pipeline = MedLabsPipeline(
+        llm_client=client,
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        extract_policy=ExtractPolicy(max_attempts=2, backoff_base_s=0.001),
+    )
+
+    pipeline.parse_text("WBC 5.4 10^9/L", panel="CBC")
+
+    assert pipeline.last_state is not None
+    extract_step = next(
+        step for step in pipeline.last_state.steps if step.pipeline_step == "extract"
+    )
+    assert extract_step.attrs["retries"] == 1
+    assert extract_step.attrs["hedged"] == 0
+    assert [item["status"] for item in extract_step.attrs["attempts"]] == ["error", "ok"]
+    # Attempts and steps share one duration type.
+    assert isinstance(extract_step.duration_ms, float)
+    assert all(isinstance(item["duration_ms"], float) for item in extract_step.attrs["attempts"])
+
+
+def test_retryable_error_classification() -> None:
+    assert is_retryable_error(TimeoutError())
+    assert is_retryable_error(RateLimitError())
+    assert not is_retryable_error(ValueError())
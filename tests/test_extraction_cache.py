@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from medlabs_sdk.core.extract import (
+    AIExtractor,
+    InMemoryExtractionCache,
+    SqliteExtractionCache,
+    extraction_cache_key,
+)
+from medlabs_sdk.core.models import RawDocument
+from medlabs_sdk.pipeline import MedLabsPipeline
+from medlabs_sdk.providers.noop_tracer import NoopTracer
+from medlabs_sdk.providers.prompted_llm_client import PromptedLLMClient
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingGenerator:
+    model = "test-model"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate_structured(self, **kwargs: Any) -> dict[str, Any]:
+        del kwargs
+        self.calls += 1
+        return {
+            "fields": [
+                {
+                    "name_raw": "WBC",
+                    "value_raw": "5,4",
+                    "unit_raw": "x10^9/L",
+                    "evidence": {"page": 1},
+                }
+            ]
+        }
+
+
+class MutablePromptProvider:
+    def __init__(self) -> None:
+        self.prompt = "prompt v1"
+        self.lookups = 0
+
+    def get_prompt(self, *, prompt_name: str, prompt_version: str) -> str:
+        del prompt_name, prompt_version
+        self.lookups += 1
+        return self.prompt
+
+
+def test_in_memory_cache_evicts_lru_and_expires() -> None:
+    clock = FakeClock()
+    cache = InMemoryExtractionCache(max_entries=2, ttl_seconds=10, clock=clock)
+
+    cache.set("a", {"fields": [1]})
+    cache.set("b", {"fields": [2]})
+    assert cache.get("a") == {"fields": [1]}
+    cache.set("c", {"fields": [3]})
+
+    assert cache.get("b") is None
+    assert cache.get("c") == {"fields": [3]}
+
+    clock.now += 11
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_sqlite_cache_persists_and_bounds_size(tmp_path: Path) -> None:
+    clock = FakeClock()
+    path = tmp_path / "extract-cache.sqlite"
+    cache = SqliteExtractionCache(path, max_entries=2, ttl_seconds=60, clock=clock)
+    cache.set("a", {"fields": ["a"]})
+    clock.now += 1
+    cache.set("b", {"fields": ["b"]})
+    clock.now += 1
+    cache.set("c", {"fields": ["c"]})
+    cache.close()
+
+    reopened = SqliteExtractionCache(path, max_entries=2, ttl_seconds=60, clock=clock)
+    assert len(reopened) == 2
+    assert reopened.get("a") is None
+    assert reopened.get("c") == {"fields": ["c"]}
+
+    clock.now += 120
+    assert reopened.get("c") is None
+    reopened.close()
+
+
+def test_sqlite_cache_indexes_and_evicts_only_over_capacity(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = SqliteExtractionCache(
+        tmp_path / "cache.sqlite", max_entries=3, ttl_seconds=60, clock=clock
+    )
+    indexes = {
+        row[0]
+        for row in cache._connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    assert {"extraction_cache_accessed_at", "extraction_cache_created_at"} <= indexes
+
+    for key in "abc":
+        cache.set(key, {"fields": [key]})
+        clock.now += 1
+    cache.set("a", {"fields": ["a2"]})
+    assert len(cache) == 3
+
+    cache.set("d", {"fields": ["d"]})
+    assert len(cache) == 3
+    assert cache.get("b") is None
+    assert cache.get("a") == {"fields": ["a2"]}
+
+    clock.now += 61
+    cache.set("e", {"fields": ["e"]})
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_ai_extractor_cache_key_tracks_prompt_text() -> None:
+    generator = CountingGenerator()
+    prompt_provider = MutablePromptProvider()
+    client = PromptedLLMClient(prompt_provider=prompt_provider, generator=generator)
+    cache = InMemoryExtractionCache()
+    extractor = AIExtractor(
+        client,
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        cache=cache,
+    )
+    document = RawDocument(text="WBC 5,4")
+
+    first = extractor.extract(document)
+    second = extractor.extract(document)
+    prompt_provider.prompt = "prompt v2"
+    third = extractor.extract(document)
+
+    assert generator.calls == 2
+    assert first.meta["extraction_cache"] == {"hits": 0, "misses": 1}
+    assert second.meta["extraction_cache"] == {"hits": 1, "misses": 0}
+    assert third.meta["extraction_cache"] == {"hits": 0, "misses": 1}
+    assert second.fields[0].evidence is not first.fields[0].evidence
+
+
+def test_extraction_cache_key_is_content_addressed() -> None:
+    base = {
+        "input_text": "WBC 5,4",
+        "prompt_name": "medlabs.extract",
+        "prompt_version": "v1",
+        "prompt_text": "prompt",
+        "model": "m",
+        "output_schema": {"type": "object"},
+    }
+
+    assert extraction_cache_key(**base) == extraction_cache_key(**base)
+    assert extraction_cache_key(**base) != extraction_cache_key(**{**base, "model": "m2"})
+
+
+def test_pipeline_records_cache_hits_in_step_attrs() -> None:
+    generator = CountingGenerator()
+    pipeline = MedLabsPipeline(
+        llm_client=PromptedLLMClient(prompt_provider=None, generator=generator),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        tracer=NoopTracer(),
+        extraction_cache=InMemoryExtractionCache(),
+    )
+
+    pipeline.parse_text("WBC 5,4", panel="CBC")
+    pipeline.parse_text("WBC 5,4", panel="CBC")
+
+    assert generator.calls == 1
+    assert pipeline.last_state is not None
+    extract_step = pipeline.last_state.steps[1]
+    assert extract_step.pipeline_step == "extract"
+    assert extract_step.attrs == {"cache_hits": 1, "cache_misses": 0}
+
+
+def test_prompt_is_resolved_once_per_document() -> None:
+    generator = CountingGenerator()
+    prompt_provider = MutablePromptProvider()
+    extractor = AIExtractor(
+        PromptedLLMClient(prompt_provider=prompt_provider, generator=generator),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        cache=InMemoryExtractionCache(),
+        max_chunk_chars=10,
+    )
+
+    extractor.extract(RawDocument(text="WBC 5,4\nRBC 4,5\nHGB 140"))
+
+    assert generator.calls == 3
+    assert prompt_provider.lookups == 1
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import mmap
+import pickle
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from medlabs_sdk.core import TextPages
+from medlabs_sdk.core.codec import dumps_json, loads_json
+from medlabs_sdk.core.ingest import PdfIngestError, PdfIngestor
+
+
+def _make_pdf(page_texts: list[str]) -> bytes:
+    """Build a minimal uncompressed PDF with one Helvetica text line per page."""
+
+    page_count = len(page_texts)
+    font_id = 3 + 2 * page_count
+    objects: list[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        (
+            "<< /Type /Pages /Kids ["
+            + " ".join(f"{3 + 2 * index} 0 R" for index in range(page_count))
+            + f"] /Count {page_count} >>"
+        ).encode(),
+    ]
+    for index, text in enumerate(page_texts):
+        content = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            (
+                "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                f"/Resources << /Font << /F1 {font_id} 0 R >> >> "
+                f"/Contents {4 + 2 * index} 0 R >>"
+            ).encode()
+        )
+        objects.append(
+            b"<< /Length " + str(len(content)).encode() + b" >>\nstream\n" + content
+            + b"\nendstream"
+        )
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets: list[int] = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode()
+    output += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode()
+    return bytes(output)
+
+
+PAGE_TEXTS = [f"WBC 5.{index} x10^9/L (4.0-10.0)" for index in range(10)]
+
+
+def test_pdf_ingestor_accepts_path_bytes_stream_and_mmap(tmp_path: Path) -> None:
+    pdf_bytes = _make_pdf(PAGE_TEXTS[:3])
+    pdf_path = tmp_path / "report.pdf"
+    pdf_path.write_bytes(pdf_bytes)
+    ingestor = PdfIngestor()
+
+    from_path = ingestor.ingest(str(pdf_path))
+    from_bytes = ingestor.ingest(pdf_bytes)
+    from_stream = ingestor.ingest(BytesIO(pdf_bytes))
+    with open(pdf_path, "rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        from_mmap = ingestor.ingest(mapped)
+
+    assert from_path.pages == PAGE_TEXTS[:3]
+    assert from_path.source == str(pdf_path)
+    assert from_bytes.source == "inline-pdf"
+    for document in (from_bytes, from_stream, from_mmap):
+        assert document.pages == from_path.pages
+        assert document.text == from_path.text
+    assert from_path.meta == {"page_count": 3, "text_size": len(from_path.text)}
+
+
+def test_pdf_ingestor_iterates_pages_lazily(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "report.pdf"
+    pdf_path.write_bytes(_make_pdf(PAGE_TEXTS[:4]))
+
+    pages = PdfIngestor().iter_pages(pdf_path)
+
+    assert next(pages) == PAGE_TEXTS[0]
+    assert list(pages) == PAGE_TEXTS[1:4]
+
+
+def test_pdf_ingestor_extracts_pages_in_parallel(tmp_path: Path) -> None:
+    pdf_bytes = _make_pdf(PAGE_TEXTS)
+    pdf_path = tmp_path / "report.pdf"
+    pdf_path.write_bytes(pdf_bytes)
+    with PdfIngestor(workers=3, parallel_min_pages=4) as ingestor:
+        assert ingestor.ingest(pdf_path).pages == PAGE_TEXTS
+        pool = ingestor._executor
+        assert ingestor.ingest(pdf_bytes).pages == PAGE_TEXTS
+        assert pool is not None and ingestor._executor is pool
+    assert ingestor._executor is None
+
+
+def test_pdf_pages_are_views_into_the_document_text(tmp_path: Path) -> None:
+    document = PdfIngestor().ingest(_make_pdf(PAGE_TEXTS[:3]))
+
+    assert isinstance(document.pages, TextPages)
+    assert document.pages.text is document.text
+    assert document.text == "\n\n".join(PAGE_TEXTS[:3])
+    assert document.pages[1:] == PAGE_TEXTS[1:3]
+    assert pickle.loads(pickle.dumps(document)) == document
+    assert loads_json(dumps_json(document))["pages"] == PAGE_TEXTS[:3]
+
+
+def test_text_pages_keep_empty_pages_out_of_the_text() -> None:
+    pages = TextPages.join(["a", "", "b"])
+
+    assert pages.text == "a\n\nb"
+    assert pages == ["a", "", "b"]
+
+
+def test_pdf_ingestor_rejects_pdf_without_text() -> None:
+    with pytest.raises(PdfIngestError, match="OCR required"):
+        PdfIngestor().ingest(_make_pdf([""]))
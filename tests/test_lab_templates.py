@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+from medlabs_sdk.core.extract import LabTemplate, RegexExtractor, TemplateRegistry
+from medlabs_sdk.core.extract.templates import DEFAULT_TEMPLATES
+from medlabs_sdk.core.models import RawDocument
+
+_TABLE_LAB = LabTemplate(
+    name="tablelab",
+    name_pattern=r"[A-Za-z][A-Za-z ]{1,40}?",
+    value_pattern=r"[0-9]+(?:\.[0-9]+)?",
+    unit_pattern=r"\S+",
+    ref_pattern=r"[0-9.]+\s*-\s*[0-9.]+",
+    ref_open="[",
+    ref_close="]",
+    fingerprint=r"TableLab\s+Diagnostics",
+    priority=10,
+    confidence=0.9,
+)
+
+
+def test_default_templates_parse_latin_and_cyrillic_lines() -> None:
+    report = RegexExtractor().extract(
+        RawDocument(
+            text=(
+                "WBC 5.4 x10^9/L (4.0-10.0)\n"
+                "Гемоглобин 145 г/л 130-160\n"
+                "Глюкоза 5,2 ммоль/л\n"
+                "Нитриты отрицательно\n"
+                "Комментарий врача:"
+            )
+        )
+    )
+
+    parsed = [(f.name_raw, f.value_raw, f.unit_raw, f.ref_raw) for f in report.fields]
+    assert parsed == [
+        ("WBC", "5.4", "x10^9/L", "4.0-10.0"),
+        ("Гемоглобин", "145", "г/л", "130-160"),
+        ("Глюкоза", "5,2", "ммоль/л", ""),
+        ("Нитриты", "отрицательно", "", ""),
+    ]
+    assert report.meta["lab_template"] is None
+    assert report.meta["template_matches"] == {"generic": 1, "generic-cyrillic": 3}
+
+
+def test_fingerprint_selects_lab_template_from_first_page() -> None:
+    registry = TemplateRegistry([*DEFAULT_TEMPLATES, _TABLE_LAB])
+    document = RawDocument(
+        text="TableLab Diagnostics, Moscow\nHemoglobin 14.1 g/dL [13.0 - 17.0]\nColor: Yellow",
+        pages=["TableLab Diagnostics, Moscow\nHemoglobin 14.1 g/dL [13.0 - 17.0]", "Color: Yellow"],
+    )
+
+    report = RegexExtractor(registry).extract(document)
+
+    assert report.meta["lab_template"] == "tablelab"
+    first, second = report.fields
+    assert (first.name_raw, first.ref_raw, first.confidence) == ("Hemoglobin", "13.0 - 17.0", 0.9)
+    assert (second.name_raw, second.value_raw) == ("Color", "Yellow")
+    assert registry.detect("no lab header here") is None
+
+
+def test_registry_orders_by_priority_and_replaces_by_name() -> None:
+    registry = TemplateRegistry(DEFAULT_TEMPLATES)
+    registry.register(_TABLE_LAB)
+    assert registry.templates[0].name == "tablelab"
+
+    registry.register(LabTemplate(name="tablelab", name_pattern="x", value_pattern="y"))
+    assert [template.name for template in registry.templates].count("tablelab") == 1
+    assert registry.templates[0].name == "generic"
+
+
+def test_registry_rejects_named_groups_in_field_patterns() -> None:
+    registry = TemplateRegistry()
+    with pytest.raises(ValueError, match="named groups"):
+        registry.register(
+            LabTemplate(name="bad", name_pattern=r"(?P<name>\w+)", value_pattern=r"\d+")
+        )
+
+
+def test_match_line_skips_a_lab_missing_from_the_registry() -> None:
+    registry = TemplateRegistry(DEFAULT_TEMPLATES)
+
+    match = registry.match_line("WBC 5.4 x10^9/L (4.0-10.0)", lab=_TABLE_LAB)
+
+    assert match is not None
+    assert (match.template.name, match.value) == ("generic", "5.4")
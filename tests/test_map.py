@@ -1,5 +1,19 @@
-from medlabs_sdk.core.map import to_standard_panel
+import json
+import pickle
+from datetime import datetime, timezone
+
+import pytest
+from medlabs_sdk.core.map import (
+    CounterIds,
+    DeterministicIds,
+    register_observation_code,
+    register_panel_code_alias,
+    to_standard_panel,
+)
+from medlabs_sdk.core.map import ids as ids_module
+from medlabs_sdk.core.map.to_standard import _panel_plan
 from medlabs_sdk.core.models import NormalizedObservation, NormalizedReport, RawDocument
+from medlabs_sdk.core.normalize import register_unit_alias
 
 
 def test_map_creates_canonical_panel_payload() -> None:
@@ -105,3 +119,173 @@ def test_map_uses_unit_hint_for_ambiguous_russian_names() -> None:
 
     assert len(panel.data["observations"]) == 1
     assert panel.data["observations"][0]["code"]["code"] == "6690-2"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(2.0, "<2 mmol/L"), (0.15, "<0.15 mmol/L"), (1234567.5, "<1234567.5 mmol/L")],
+)
+def test_map_reports_censored_values_as_text(value: float, expected: str) -> None:
+    report = NormalizedReport(
+        document=RawDocument(text="dummy", meta={"document_id": "doc-3"}),
+        observations=[
+            NormalizedObservation(
+                code="glucose",
+                value=value,
+                unit="mmol/L",
+                ref_low=3.9,
+                ref_high=5.5,
+                source_name="Glucose",
+                comparator="<",
+            )
+        ],
+    )
+
+    observation = to_standard_panel(report, panel="BIOCHEM").data["observations"][0]
+
+    assert observation["value"] == expected
+    assert observation["interpretation"] == "unknown"
+
+
+def test_map_plan_is_rebuilt_when_code_maps_are_extended() -> None:
+    report = NormalizedReport(
+        document=RawDocument(text="dummy", meta={"document_id": "doc-4"}),
+        observations=[
+            NormalizedObservation(code="wbc", value=5.4, unit="10*9/L", source_name="WBC"),
+            NormalizedObservation(
+                code="test_reticulocytes",
+                value=1.2,
+                unit="%",
+                source_name="Retic",
+            ),
+        ],
+    )
+
+    before = to_standard_panel(report, panel="CBC")
+    assert [item["code"]["code"] for item in before.data["observations"]] == ["6690-2"]
+
+    register_observation_code(
+        "test_reticulocytes",
+        {"system": "LOINC", "code": "4679-7", "display": "Reticulocytes/100 erythrocytes"},
+        panels=["CBC"],
+    )
+    register_panel_code_alias("CBC", "test_retic", "test_reticulocytes")
+    report.observations.append(
+        NormalizedObservation(code="test_retic", value=1.3, unit="%", source_name="RET%")
+    )
+
+    after = to_standard_panel(report, panel="CBC")
+    assert [item["code"]["code"] for item in after.data["observations"]] == [
+        "6690-2",
+        "4679-7",
+        "4679-7",
+    ]
+    assert after.data["observations"][1]["value"]["unit_display"] == "%"
+
+
+def _two_observation_report(document_id: str) -> NormalizedReport:
+    return NormalizedReport(
+        document=RawDocument(
+            text="dummy",
+            meta={"document_id": document_id, "report_date": "2026-02-07"},
+        ),
+        observations=[
+            NormalizedObservation(code="wbc", value=5.4, unit="10*9/L", source_name="WBC"),
+            NormalizedObservation(code="rbc", value=4.6, unit="10*12/L", source_name="RBC"),
+        ],
+    )
+
+
+def test_map_deterministic_ids_give_byte_identical_panels() -> None:
+    def render(document_id: str) -> bytes:
+        panel = to_standard_panel(
+            _two_observation_report(document_id), panel="CBC", ids=DeterministicIds()
+        )
+        return json.dumps(panel.data, sort_keys=True).encode("utf-8")
+
+    assert render("doc-1") == render("doc-1")
+    assert render("doc-1") != render("doc-2")
+    observation_ids = [item["id"] for item in json.loads(render("doc-1"))["observations"]]
+    assert observation_ids[0].startswith("obs-cbc-001-")
+    assert len(set(observation_ids)) == 2
+
+
+def test_map_counter_ids_are_sequential() -> None:
+    ids = CounterIds()
+
+    panel = to_standard_panel(_two_observation_report("doc-1"), panel="CBC", ids=ids)
+
+    assert [item["id"] for item in panel.data["observations"]] == [
+        "obs-cbc-001-000001",
+        "obs-cbc-002-000002",
+    ]
+    assert panel.data["id"] == "panel-cbc-00000003"
+
+
+def test_map_deterministic_ids_hash_the_document_text_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    keys: list[str] = []
+    document_key = ids_module._document_key
+
+    def counting_document_key(document: RawDocument) -> str:
+        keys.append(document.text)
+        return document_key(document)
+
+    monkeypatch.setattr(ids_module, "_document_key", counting_document_key)
+    report = _two_observation_report("doc-1")
+    del report.document.meta["document_id"]
+    ids = DeterministicIds()
+
+    first = to_standard_panel(report, panel="CBC", ids=ids)
+
+    # One hasher per digest size (panel and observation ids), not one per observation.
+    assert len(keys) == 2
+    assert (
+        pickle.loads(pickle.dumps(ids)).panel_id(panel_code="CBC", document=report.document)
+        == first.data["id"]
+    )
+
+
+def test_map_report_date_comes_from_the_clock_only_without_reproducible_ids() -> None:
+    report = _two_observation_report("doc-1")
+    del report.document.meta["report_date"]
+
+    panel = to_standard_panel(report, panel="CBC", ids=DeterministicIds())
+    assert panel.data["source"]["report_date"] == "1970-01-01"
+    assert "Document has no report date, using 1970-01-01" in panel.warnings
+
+    report.document.meta["collected_at"] = "2026-02-06T08:30:00Z"
+    panel = to_standard_panel(report, panel="CBC", ids=DeterministicIds())
+    assert panel.data["source"]["report_date"] == "2026-02-06"
+    assert not panel.warnings
+
+    del report.document.meta["collected_at"]
+    today = datetime.now(timezone.utc).date().isoformat()
+    panel = to_standard_panel(report, panel="CBC")
+    assert panel.data["source"]["report_date"] == today
+    assert f"Document has no report date, using {today}" in panel.warnings
+
+
+def test_map_plans_follow_registered_unit_aliases(isolated_aliases: None) -> None:
+    before = _panel_plan("CBC")
+    assert ("wbc", "test-cells/uL") not in before.known
+
+    register_unit_alias("test cells per ul", "test-cells/uL")
+
+    after = _panel_plan("CBC")
+    assert after is not before
+    assert after.known[("wbc", "test-cells/uL")].unit_code == "test-cells/uL"
+
+
+def test_map_unknown_pairs_use_a_bounded_memo() -> None:
+    plan = _panel_plan("CBC")
+    report = _two_observation_report("doc-1")
+    report.observations[0].unit = "test-unmapped-unit"
+
+    to_standard_panel(report, panel="CBC")
+    to_standard_panel(report, panel="CBC")
+
+    info = plan.overflow.cache_info()  # type: ignore[attr-defined]
+    assert info.maxsize is not None
+    assert info.hits >= 1
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import pickle
+from dataclasses import asdict
+
+import pytest
+from medlabs_sdk.core.models import (
+    EMPTY_EVIDENCE,
+    ExtractedField,
+    NormalizedObservation,
+    ValidationIssue,
+)
+
+
+def test_models_are_slotted_and_share_empty_evidence() -> None:
+    first = NormalizedObservation(code="wbc", value=5.4, unit="10*9/L")
+    second = ExtractedField(name_raw="WBC", value_raw="5,4")
+
+    assert not hasattr(first, "__dict__")
+    assert first.evidence is EMPTY_EVIDENCE
+    assert second.evidence is EMPTY_EVIDENCE
+    assert pickle.loads(pickle.dumps(first)).evidence is EMPTY_EVIDENCE
+    assert asdict(first)["evidence"] == {}
+    assert asdict(ValidationIssue(path="$", description="ok", severity="warning")) == {
+        "path": "$",
+        "description": "ok",
+        "severity": "warning",
+    }
+
+
+def test_empty_evidence_is_read_only() -> None:
+    observation = NormalizedObservation(code="wbc", value=5.4, unit="10*9/L")
+
+    with pytest.raises(TypeError):
+        observation.evidence["page"] = 1
+    with pytest.raises(TypeError):
+        observation.evidence.update(page=1)
+
+    observation.evidence = {**observation.evidence, "page": 1}
+    assert observation.evidence == {"page": 1}
+    assert EMPTY_EVIDENCE == {}
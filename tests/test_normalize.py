@@ -1,5 +1,21 @@
+import re
+
+import pytest
 from medlabs_sdk.core.models import ExtractedField, ExtractedReport, RawDocument
-from medlabs_sdk.core.normalize import normalize
+from medlabs_sdk.core.normalize import (
+    UnitConverter,
+    canonicalize_name,
+    name_cache_stats,
+    normalize,
+    normalize_many,
+    normalize_unit,
+    parse_float,
+    parse_range,
+    parse_value,
+    register_name_alias,
+    register_unit_alias,
+    unit_cache_stats,
+)
 
 
 def test_normalize_parses_commas_and_ranges() -> None:
@@ -77,3 +93,224 @@ def test_normalize_supports_helix_units_and_aliases() -> None:
     assert neutrophils.ref_high == 4.98
     assert urine_leukocytes.code == "urine_leukocytes"
     assert urine_leukocytes.unit == "{cells}/uL"
+
+
+def test_normalize_many_matches_per_report_normalize() -> None:
+    def report(*fields: ExtractedField) -> ExtractedReport:
+        return ExtractedReport(
+            document=RawDocument(text="dummy"),
+            fields=list(fields),
+            warnings=["upstream"],
+            meta={"extractor": "test"},
+        )
+
+    reports = [
+        report(
+            ExtractedField(name_raw="WBC", value_raw="5,4", unit_raw="x10^9/L", ref_raw="4-10"),
+            ExtractedField(name_raw="  ", value_raw="1"),
+            ExtractedField(name_raw="Glucose", value_raw="4.9", unit_raw="mmol/L", ref_raw="> 3.9"),
+        ),
+        report(),
+        report(
+            ExtractedField(name_raw="WBC", value_raw="6,1", unit_raw="x10^9/L", ref_raw="4-10"),
+            ExtractedField(name_raw="Color", value_raw=" Yellow "),
+        ),
+    ]
+
+    assert normalize_many(reports) == [normalize(item) for item in reports]
+
+
+def test_register_aliases_invalidate_memoized_lookups(isolated_aliases: None) -> None:
+    assert canonicalize_name("Тестовый показатель X") == "тестовый_показатель_x"
+    assert normalize_unit("test-units/l") == "test-units/l"
+
+    register_name_alias("Тестовый  показатель X", "test_analyte")
+    register_unit_alias("TEST-units/L", "U/L")
+
+    assert canonicalize_name("Тестовый показатель X") == "test_analyte"
+    assert normalize_unit("test-units/l") == "U/L"
+
+
+def test_registered_aliases_do_not_leak_between_tests() -> None:
+    assert canonicalize_name("Тестовый показатель X") == "тестовый_показатель_x"
+    assert normalize_unit("test-units/l") == "test-units/l"
+
+
+def test_memoized_lookups_report_hits_and_intern_results() -> None:
+    raw = "".join(["Gluc", "ose "])
+    first = canonicalize_name(raw)
+    hits_before = name_cache_stats()["hits"]
+
+    second = canonicalize_name(raw)
+
+    assert first is second
+    assert name_cache_stats()["hits"] == hits_before + 1
+    normalize_unit("mmol/L")
+    normalize_unit("mmol/L")
+    stats = unit_cache_stats()
+    assert stats["hits"] >= 1
+    assert 0.0 < stats["hit_rate"] <= 1.0
+
+
+_LEGACY_RANGE_RE = re.compile(r"(-?\d+(?:[\.,]\d+)?)\s*[-–]\s*(-?\d+(?:[\.,]\d+)?)")
+_LEGACY_NUMBER_RE = re.compile(r"-?\d+(?:[\.,]\d+)?")
+
+
+def _legacy_parse_float(value_raw: str) -> float | None:
+    value = value_raw.strip()
+    if not value or _LEGACY_RANGE_RE.search(value):
+        return None
+    match = _LEGACY_NUMBER_RE.search(value)
+    return float(match.group(0).replace(",", ".")) if match else None
+
+
+def _legacy_parse_range(ref_raw: str) -> tuple[float | None, float | None]:
+    match = _LEGACY_RANGE_RE.search(ref_raw.strip())
+    if not match:
+        return None, None
+    return float(match.group(1).replace(",", ".")), float(match.group(2).replace(",", "."))
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "5,4",
+        "14.1",
+        "-3.5",
+        "<0.01",
+        "> 3.9",
+        "<5-10",
+        ">= 1,5 - 3",
+        "1:5-10",
+        "10-20 /hpf",
+        "4,0 – 10,0",
+        "Negative",
+        "",
+        "  ",
+    ],
+)
+def test_parse_float_and_range_stay_compatible(raw: str) -> None:
+    assert parse_float(raw) == _legacy_parse_float(raw)
+    assert parse_range(raw) == _legacy_parse_range(raw)
+
+
+@pytest.mark.parametrize(
+    ("raw", "kind", "number", "comparator"),
+    [
+        ("5,4", "number", 5.4, ""),
+        ("<0.01 ng/mL", "comparator", 0.01, "<"),
+        ("≥ 100", "comparator", 100.0, ">="),
+        ("1:160", "titer", None, ""),
+        ("0-2 /hpf", "range", None, ""),
+        ("<5-10", "range", None, ""),
+        ("Trace", "qualitative", None, ""),
+        (" ", "empty", None, ""),
+    ],
+)
+def test_parse_value_classifies_lab_values(
+    raw: str,
+    kind: str,
+    number: float | None,
+    comparator: str,
+) -> None:
+    parsed = parse_value(raw)
+
+    assert (parsed.kind, parsed.number, parsed.comparator) == (kind, number, comparator)
+
+
+def test_normalize_keeps_comparator_and_titer_values() -> None:
+    report = ExtractedReport(
+        document=RawDocument(text="dummy"),
+        fields=[
+            ExtractedField(name_raw="Troponin I", value_raw="<0.01", unit_raw="ng/mL"),
+            ExtractedField(name_raw="ANA", value_raw="1:160"),
+        ],
+    )
+
+    troponin, ana = normalize(report).observations
+
+    assert (troponin.value, troponin.comparator) == (0.01, "<")
+    assert (ana.value, ana.comparator) == ("1:160", "")
+
+
+def test_unit_converter_converts_value_and_reference_range() -> None:
+    report = ExtractedReport(
+        document=RawDocument(text="dummy"),
+        fields=[
+            ExtractedField(name_raw="Glucose", value_raw="90", unit_raw="mg/dL", ref_raw="70-100"),
+            ExtractedField(name_raw="Creatinine", value_raw="1.0", unit_raw="mg/dL"),
+            ExtractedField(name_raw="HGB", value_raw="141", unit_raw="g/L", ref_raw="130-170"),
+            ExtractedField(name_raw="Urea", value_raw="5.2", unit_raw="mmol/L"),
+            ExtractedField(name_raw="Protein", value_raw="Negative", unit_raw="g/dL"),
+        ],
+    )
+    converter = UnitConverter()
+
+    glucose, creatinine, hemoglobin, urea, protein = normalize(
+        report, converter=converter
+    ).observations
+
+    assert (glucose.value, glucose.unit, glucose.original_unit) == (4.9957, "mmol/L", "mg/dL")
+    assert (glucose.ref_low, glucose.ref_high) == (3.8855, 5.5507)
+    assert (creatinine.value, creatinine.unit) == (88.4017, "umol/L")
+    assert (hemoglobin.value, hemoglobin.unit, hemoglobin.ref_high) == (14.1, "g/dL", 17.0)
+    assert (urea.value, urea.unit, urea.original_unit) == (5.2, "mmol/L", "")
+    assert (protein.value, protein.unit) == ("Negative", "g/dL")
+    assert normalize_many([report], converter=converter)[0] == normalize(
+        report, converter=converter
+    )
+
+
+def test_unit_converter_tells_urea_from_urea_nitrogen() -> None:
+    report = ExtractedReport(
+        document=RawDocument(text="dummy"),
+        fields=[
+            ExtractedField(name_raw="Urea", value_raw="30", unit_raw="mg/dL"),
+            ExtractedField(name_raw="BUN", value_raw="14", unit_raw="mg/dL"),
+        ],
+    )
+
+    normalized = normalize(report, converter=UnitConverter())
+    urea, bun = normalized.observations
+
+    assert (urea.code, urea.value, urea.unit) == ("urea", 4.995, "mmol/L")
+    assert (bun.code, bun.value, bun.unit) == ("bun", 4.9975, "mmol/L")
+
+    from medlabs_sdk.core.map import to_standard_panel
+
+    observations = to_standard_panel(normalized, panel="BIOCHEM").data["observations"]
+    assert [item["code"]["code"] for item in observations] == ["22664-7", "14937-7"]
+
+
+def test_unit_converter_accepts_per_litre_mass_and_molar_units() -> None:
+    report = ExtractedReport(
+        document=RawDocument(text="dummy"),
+        fields=[
+            ExtractedField(name_raw="Urea", value_raw="300", unit_raw="мг/л"),
+            ExtractedField(name_raw="Glucose", value_raw="0,005", unit_raw="mol/l"),
+        ],
+    )
+
+    urea, glucose = normalize(report, converter=UnitConverter()).observations
+
+    assert (urea.value, urea.unit, urea.original_unit) == (4.995, "mmol/L", "mg/L")
+    assert (glucose.value, glucose.unit, glucose.original_unit) == (5.0, "mmol/L", "mol/L")
+
+
+def test_default_conversion_targets_pass_panel_schemas() -> None:
+    from medlabs_sdk.core.map import to_standard_panel
+    from medlabs_sdk.core.validate import validate_jsonschema
+
+    report = ExtractedReport(
+        document=RawDocument(text="dummy", meta={"report_date": "2026-02-07"}),
+        fields=[ExtractedField(name_raw="HGB", value_raw="141", unit_raw="g/L")],
+    )
+
+    panel = to_standard_panel(normalize(report, converter=UnitConverter()), panel="CBC")
+
+    assert validate_jsonschema(panel.data, panel_code="CBC").is_valid
+
+
+def test_unit_converter_rejects_unreachable_target_unit() -> None:
+    with pytest.raises(ValueError, match="hemoglobin"):
+        UnitConverter({"hemoglobin": "mmol/L"})
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+from medlabs_sdk.core.map import CounterIds
+from medlabs_sdk.core.validate import jsonschema as jsonschema_module
+from medlabs_sdk.pipeline import BatchItem, MedLabsPipeline
+from medlabs_sdk.providers.noop_tracer import NoopTracer
+
+
+class SlowMockLLMClient:
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def extract_structured(
+        self,
+        *,
+        prompt_name: str,
+        prompt_version: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+    ) -> dict[str, Any]:
+        del prompt_name, prompt_version, output_schema, temperature
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if input_text == "broken":
+                raise RuntimeError("LLM failure")
+            return {
+                "fields": [
+                    {
+                        "name_raw": "WBC",
+                        "value_raw": input_text,
+                        "unit_raw": "x10^9/L",
+                        "ref_raw": "4.0-10.0",
+                        "confidence": 0.9,
+                    }
+                ]
+            }
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _pipeline(client: SlowMockLLMClient) -> MedLabsPipeline:
+    return MedLabsPipeline(
+        llm_client=client,
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        tracer=NoopTracer(),
+    )
+
+
+def _items(values: list[str]) -> list[BatchItem]:
+    return [
+        BatchItem(
+            source=value,
+            panel="CBC",
+            document_meta={"document_id": f"doc-{index}", "report_date": "2026-02-07"},
+        )
+        for index, value in enumerate(values)
+    ]
+
+
+def test_parse_many_overlaps_extract_and_keeps_input_order() -> None:
+    client = SlowMockLLMClient()
+    pipeline = _pipeline(client)
+    values = ["5.1", "5.2", "5.3", "5.4", "5.5", "5.6"]
+
+    results = list(pipeline.parse_many(_items(values), concurrency=3))
+
+    assert [item.index for item in results] == list(range(len(values)))
+    assert all(item.ok for item in results)
+    assert client.max_active > 1
+    observed = [
+        item.result.mapped.data["observations"][0]["value"]["value"]
+        for item in results
+        if item.result is not None
+    ]
+    assert observed == [float(value) for value in values]
+    assert [step.pipeline_step for step in results[0].steps] == [
+        "ingest",
+        "extract",
+        "normalize",
+        "map",
+        "validate",
+    ]
+
+
+def test_parse_many_reports_errors_per_item() -> None:
+    pipeline = _pipeline(SlowMockLLMClient(delay=0.0))
+
+    results = list(
+        pipeline.parse_many(_items(["5.1", "broken", "5.3"]), concurrency=2, ordered=False)
+    )
+
+    assert sorted(item.index for item in results) == [0, 1, 2]
+    failed = [item for item in results if not item.ok]
+    assert len(failed) == 1
+    assert failed[0].index == 1
+    assert isinstance(failed[0].error, RuntimeError)
+    assert [step.pipeline_step for step in failed[0].steps] == ["ingest"]
+
+
+def test_parse_many_runs_cpu_steps_in_process_pool() -> None:
+    pipeline = _pipeline(SlowMockLLMClient(delay=0.0))
+
+    results = list(pipeline.parse_many(_items(["5.1", "5.2"]), concurrency=2, cpu_workers=1))
+
+    assert all(item.ok for item in results)
+    assert results[1].result is not None
+    assert results[1].result.validation.is_valid
+    assert [step.pipeline_step for step in results[1].steps][-3:] == [
+        "normalize",
+        "map",
+        "validate",
+    ]
+
+
+def test_parse_many_rejects_counter_ids_in_process_pool() -> None:
+    pipeline = MedLabsPipeline(
+        llm_client=SlowMockLLMClient(delay=0.0),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        id_strategy=CounterIds(),
+    )
+
+    with pytest.raises(ValueError, match="CounterIds"):
+        list(pipeline.parse_many(_items(["5.1"]), cpu_workers=1))
+    assert all(item.ok for item in pipeline.parse_many(_items(["5.1"])))
+
+
+class UnitMismatchLLMClient:
+    def extract_structured(self, **kwargs: Any) -> dict[str, Any]:
+        del kwargs
+        return {
+            "fields": [
+                {"name_raw": "WBC", "value_raw": "5", "unit_raw": "mmol/L"},
+                {"name_raw": "HGB", "value_raw": "140", "unit_raw": "mmol/L"},
+            ]
+        }
+
+
+@pytest.mark.parametrize("cpu_workers", [None, 1])
+@pytest.mark.parametrize(("fail_fast", "errors"), [(False, 2), (True, 1)])
+def test_parse_many_applies_validation_fail_fast(
+    cpu_workers: int | None, fail_fast: bool, errors: int
+) -> None:
+    pipeline = MedLabsPipeline(
+        llm_client=UnitMismatchLLMClient(),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        validation_fail_fast=fail_fast,
+    )
+
+    (item,) = pipeline.parse_many(_items(["x"]), cpu_workers=cpu_workers)
+
+    assert item.result is not None
+    assert not item.result.validation.is_valid
+    assert item.result.validation.error_count == errors
+
+
+@pytest.mark.parametrize("cpu_workers", [None, 1])
+@pytest.mark.parametrize("mode", ["fused", "reference"])
+def test_parse_many_validates_in_either_mode(cpu_workers: int | None, mode: str) -> None:
+    pipeline = MedLabsPipeline(
+        llm_client=UnitMismatchLLMClient(),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        validation_mode=mode,  # type: ignore[arg-type]
+    )
+
+    (item,) = pipeline.parse_many(_items(["x"]), cpu_workers=cpu_workers)
+
+    assert item.result is not None
+    assert item.result.validation.error_count == 2
+
+
+def test_reference_mode_skips_the_fused_validator(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fused(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("fused validator used in reference mode")
+
+    monkeypatch.setattr(jsonschema_module, "validate_fused", fused)
+    pipeline = MedLabsPipeline(
+        llm_client=SlowMockLLMClient(delay=0.0),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        validation_mode="reference",
+    )
+
+    (item,) = pipeline.parse_many(_items(["5.1"]))
+
+    assert item.result is not None
+    assert item.result.validation.is_valid
+
+
+def test_pipeline_rejects_unknown_validation_mode() -> None:
+    with pytest.raises(ValueError, match="validation mode"):
+        MedLabsPipeline(
+            llm_client=UnitMismatchLLMClient(),
+            prompt_name="medlabs.extract",
+            prompt_version="v1",
+            validation_mode="strict",  # type: ignore[arg-type]
+        )
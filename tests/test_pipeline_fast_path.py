@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from medlabs_sdk.core.extract import RegexExtractor
+from medlabs_sdk.pipeline import MedLabsPipeline
+from medlabs_sdk.providers.noop_tracer import NoopTracer
+
+
+class CountingLLMClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def extract_structured(self, **kwargs: Any) -> dict[str, Any]:
+        del kwargs
+        self.calls += 1
+        return {"fields": [{"name_raw": "WBC", "value_raw": "5,4", "unit_raw": "x10^9/L"}]}
+
+
+def _pipeline(client: CountingLLMClient, **kwargs: Any) -> MedLabsPipeline:
+    return MedLabsPipeline(
+        llm_client=client,
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+        tracer=NoopTracer(),
+        fast_extractor=RegexExtractor(),
+        **kwargs,
+    )
+
+
+def test_fast_path_skips_llm_when_coverage_is_high() -> None:
+    client = CountingLLMClient()
+    pipeline = _pipeline(client)
+
+    result = pipeline.parse_text(
+        "WBC 5.4 x10^9/L (4.0-10.0)\nRBC 4.65 x10^12/L (4.2-5.6)\nHGB 14.1 g/dL (13.0-17.0)",
+        panel="CBC",
+    )
+
+    assert client.calls == 0
+    assert result.validation.is_valid
+    assert len(result.mapped.data["observations"]) == 3
+    assert pipeline.workflow_edges[:2] == (
+        ("fast_extract", "normalize", "fast_path"),
+        ("fast_extract", "extract", "llm_fallback"),
+    )
+    assert pipeline.last_state is not None
+    steps = pipeline.last_state.steps
+    assert [step.pipeline_step for step in steps] == [
+        "ingest",
+        "fast_extract",
+        "normalize",
+        "map",
+        "validate",
+    ]
+    assert steps[1].attrs["decision"] == "fast_path"
+    assert steps[1].attrs["coverage"] == 1.0
+    assert steps[1].attrs["llm_calls_saved"] == 1
+
+
+def test_fast_path_falls_back_to_llm_below_threshold() -> None:
+    client = CountingLLMClient()
+    pipeline = _pipeline(client, fast_path_min_coverage=0.9)
+
+    pipeline.parse_text("WBC 5.4 x10^9/L\nFoo 1\nBar 2", panel="CBC")
+
+    assert client.calls == 1
+    assert pipeline.last_state is not None
+    steps = pipeline.last_state.steps
+    assert [step.pipeline_step for step in steps][:3] == ["ingest", "fast_extract", "extract"]
+    assert steps[1].attrs["decision"] == "llm_fallback"
+    assert steps[1].attrs["llm_calls_saved"] == 0
+
+
+def test_fast_path_respects_confidence_threshold() -> None:
+    client = CountingLLMClient()
+    pipeline = _pipeline(client, fast_path_min_confidence=0.5)
+
+    pipeline.parse_text("WBC 5.4 x10^9/L (4.0-10.0)", panel="CBC")
+
+    assert client.calls == 1
+
+
+def test_fast_path_coverage_counts_unparsed_result_lines() -> None:
+    client = CountingLLMClient()
+    pipeline = _pipeline(client)
+    unparsed = "\n".join(f"{index}) Analyte-{index}: 5,{index}" for index in range(19))
+
+    pipeline.parse_text(f"WBC 5.4 x10^9/L (4.0-10.0)\n{unparsed}", panel="CBC")
+
+    assert client.calls == 1
+    assert pipeline.last_state is not None
+    fast_step = pipeline.last_state.steps[1]
+    assert fast_step.attrs["fields"] == 1
+    assert fast_step.attrs["coverage"] == 0.05
+    assert fast_step.attrs["decision"] == "llm_fallback"
+
+
+def test_fast_path_normalizes_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    import medlabs_sdk.pipeline as pipeline_module
+
+    calls = []
+    real_normalize = pipeline_module.normalize
+
+    def counting_normalize(*args: Any, **kwargs: Any) -> Any:
+        calls.append(1)
+        return real_normalize(*args, **kwargs)
+
+    monkeypatch.setattr(pipeline_module, "normalize", counting_normalize)
+    client = CountingLLMClient()
+    pipeline = _pipeline(client)
+
+    result = pipeline.parse_text(
+        "WBC 5.4 x10^9/L (4.0-10.0)\nHGB 14.1 g/dL (13.0-17.0)",
+        panel="CBC",
+    )
+
+    assert client.calls == 0
+    assert len(calls) == 1
+    assert len(result.normalized.observations) == 2
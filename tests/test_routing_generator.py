@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from medlabs_sdk.pipeline import MedLabsPipeline
+from medlabs_sdk.providers import PromptedLLMClient, RouteBackend, RoutingGenerator
+
+REQUEST = {"system_prompt": "sys", "input_text": "WBC 5.4", "output_schema": {}}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StubGenerator:
+    """Answers after `latency_s` of fake time, or raises `error` while it is set."""
+
+    def __init__(self, name: str, clock: FakeClock, latency_s: float = 0.01) -> None:
+        self.model = f"model-{name}"
+        self.name = name
+        self.clock = clock
+        self.latency_s = latency_s
+        self.error: Exception | None = None
+        self.calls = 0
+        self.closed = False
+
+    def generate_structured(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls += 1
+        self.clock.now += self.latency_s
+        if self.error is not None:
+            raise self.error
+        return {"fields": [], "backend": self.name}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _router(
+    *stubs: StubGenerator, weights: tuple[float, ...] = (), **kwargs: Any
+) -> RoutingGenerator:
+    backends = [
+        RouteBackend(stub.name, stub, weight=weights[index] if weights else 1.0)
+        for index, stub in enumerate(stubs)
+    ]
+    return RoutingGenerator(
+        backends,
+        clock=stubs[0].clock,
+        random_fraction=random.Random(3).random,
+        **kwargs,
+    )
+
+
+def test_traffic_follows_ewma_latency() -> None:
+    clock = FakeClock()
+    fast = StubGenerator("fast", clock, latency_s=0.01)
+    slow = StubGenerator("slow", clock, latency_s=0.05)
+    router = _router(fast, slow)
+
+    for _ in range(500):
+        router.generate_structured(**REQUEST)
+
+    stats = router.stats()
+    assert stats["fast"]["requests"] > 3 * stats["slow"]["requests"]
+    assert stats["slow"]["requests"] > 0
+    assert stats["fast"]["latency_ewma_ms"] == pytest.approx(10.0)
+    assert stats["slow"]["latency_ewma_ms"] == pytest.approx(50.0)
+
+
+def test_weights_scale_the_traffic_share() -> None:
+    clock = FakeClock()
+    hosted = StubGenerator("hosted", clock)
+    vllm = StubGenerator("vllm", clock)
+    router = _router(hosted, vllm, weights=(1.0, 3.0))
+
+    for _ in range(1000):
+        router.generate_structured(**REQUEST)
+
+    assert 0.65 < vllm.calls / 1000 < 0.85
+
+
+def test_retryable_failures_fall_back_to_other_backends() -> None:
+    clock = FakeClock()
+    broken = StubGenerator("broken", clock)
+    healthy = StubGenerator("healthy", clock)
+    broken.error = ConnectionError("connection refused")
+    router = _router(broken, healthy, failure_threshold=100)
+
+    answers = {router.generate_structured(**REQUEST)["backend"] for _ in range(50)}
+
+    stats = router.stats()
+    assert answers == {"healthy"}
+    assert stats["broken"]["failures"] == broken.calls > 0
+    assert stats["healthy"]["fallbacks"] == broken.calls
+    assert stats["broken"]["error_rate"] > 0.5
+
+
+def test_circuit_opens_then_a_probe_closes_it() -> None:
+    clock = FakeClock()
+    flaky = StubGenerator("flaky", clock)
+    steady = StubGenerator("steady", clock)
+    flaky.error = TimeoutError()
+    router = _router(flaky, steady, failure_threshold=2, cooldown_s=10.0)
+
+    while router.stats()["flaky"]["circuit"] != "open":
+        router.generate_structured(**REQUEST)
+    calls_when_opened = flaky.calls
+
+    for _ in range(20):
+        router.generate_structured(**REQUEST)
+    assert flaky.calls == calls_when_opened
+
+    flaky.error = None
+    clock.now += 10.0
+    assert router.stats()["flaky"]["circuit"] == "half_open"
+    while flaky.calls == calls_when_opened:
+        router.generate_structured(**REQUEST)
+
+    stats = router.stats()["flaky"]
+    assert stats["circuit"] == "closed"
+    assert stats["circuit_opens"] == 1
+
+
+def test_failed_probe_reopens_the_circuit() -> None:
+    clock = FakeClock()
+    down = StubGenerator("down", clock)
+    down.error = ConnectionError()
+    router = _router(down, failure_threshold=1, cooldown_s=5.0)
+
+    with pytest.raises(ConnectionError):
+        router.generate_structured(**REQUEST)
+    with pytest.raises(RuntimeError, match="circuit open"):
+        router.generate_structured(**REQUEST)
+
+    clock.now += 5.0
+    with pytest.raises(ConnectionError):
+        router.generate_structured(**REQUEST)
+    assert router.stats()["down"]["circuit"] == "open"
+    assert router.stats()["down"]["circuit_opens"] == 2
+
+
+def test_non_retryable_errors_are_raised_without_fallback() -> None:
+    clock = FakeClock()
+    first = StubGenerator("first", clock)
+    second = StubGenerator("second", clock)
+    first.error = second.error = ValueError("invalid request")
+    router = _router(first, second, failure_threshold=1)
+
+    with pytest.raises(ValueError):
+        router.generate_structured(**REQUEST)
+
+    assert first.calls + second.calls == 1
+    assert all(item["failures"] == 0 for item in router.stats().values())
+    assert all(item["circuit"] == "closed" for item in router.stats().values())
+
+
+def test_concurrent_requests_are_counted_per_backend() -> None:
+    clock = FakeClock()
+    stubs = [StubGenerator(name, clock, latency_s=0.0) for name in ("a", "b", "c")]
+    router = RoutingGenerator([RouteBackend(stub.name, stub) for stub in stubs])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: router.generate_structured(**REQUEST), range(300)))
+
+    stats = router.stats()
+    assert sum(item["successes"] for item in stats.values()) == 300
+    assert all(item["inflight"] == 0 for item in stats.values())
+
+
+def test_router_behind_prompted_client_in_pipeline() -> None:
+    clock = FakeClock()
+    stubs = [StubGenerator("hosted", clock), StubGenerator("vllm", clock)]
+    router = RoutingGenerator([RouteBackend(stub.name, stub) for stub in stubs])
+    client = PromptedLLMClient(prompt_provider=None, generator=router)
+
+    with MedLabsPipeline(
+        llm_client=client,
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+    ) as pipeline:
+        pipeline.parse_text("WBC 5.4 10^9/L", panel="CBC")
+
+    identity = client.cache_identity(prompt_name="p", prompt_version="v")
+    assert identity["model"] == router.model_identity == "model-hosted|model-vllm"
+    assert identity["model_name"] == router.model == ""
+    assert sum(stub.calls for stub in stubs) == 1
+    client.close()
+    assert all(stub.closed for stub in stubs)
+
+
+def test_model_is_the_shared_backend_model() -> None:
+    clock = FakeClock()
+    first, second = StubGenerator("a", clock), StubGenerator("b", clock)
+    second.model = first.model
+
+    router = _router(first, second)
+
+    assert router.model == router.model_identity == "model-a"
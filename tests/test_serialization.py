@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from medlabs_sdk.core import codec
+from medlabs_sdk.core.models import PipelineResult, StandardPanel
+from medlabs_sdk.pipeline import MedLabsPipeline
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURES = sorted((ROOT / "standard" / "examples" / "v0.1").glob("*/*.json"))
+
+
+class MockLLMClient:
+    def extract_structured(self, **kwargs: Any) -> dict[str, Any]:
+        del kwargs
+        return {
+            "fields": [
+                {
+                    "name_raw": "WBC",
+                    "value_raw": "5,4",
+                    "unit_raw": "x10^9/L",
+                    "ref_raw": "4.0-10.0",
+                    "evidence": {"line": 10, "page": 1, "raw_text": "WBC 5,4 x10^9/L"},
+                    "confidence": 0.95,
+                },
+                {"name_raw": "Глюкоза", "value_raw": "<2", "unit_raw": "ммоль/л"},
+            ]
+        }
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "json":
+        monkeypatch.setattr(codec, "_orjson", None)
+    elif codec.json_backend() != "orjson":
+        pytest.skip("orjson is not installed")
+    return codec.json_backend()
+
+
+def _pipeline_result() -> PipelineResult:
+    pipeline = MedLabsPipeline(
+        llm_client=MockLLMClient(),
+        prompt_name="medlabs.extract",
+        prompt_version="v1",
+    )
+    return pipeline.parse_text(
+        "WBC 5,4 x10^9/L",
+        panel="CBC",
+        document_meta={"document_id": "doc-1", "report_date": "2026-02-07"},
+    )
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.stem)
+def test_standard_panel_json_round_trip(fixture: Path, json_backend: str) -> None:
+    payload = json.loads(fixture.read_text(encoding="utf-8"))
+
+    panel = StandardPanel.from_json_bytes(fixture.read_bytes())
+    restored = StandardPanel.from_json_bytes(panel.to_json_bytes())
+
+    assert panel.data == payload
+    assert restored.data == payload
+    assert json.loads(panel.to_json_bytes()) == payload
+
+
+def test_pipeline_result_json_round_trip(json_backend: str) -> None:
+    result = _pipeline_result()
+
+    restored = PipelineResult.from_json_bytes(result.to_json_bytes())
+
+    assert restored == result
+    assert restored.extracted.document is restored.document
+
+
+def test_json_backends_produce_equivalent_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    result = _pipeline_result()
+    fast = result.to_json_bytes()
+    monkeypatch.setattr(codec, "_orjson", None)
+
+    assert json.loads(result.to_json_bytes()) == json.loads(fast)
+
+
+def test_pipeline_result_msgpack_round_trip() -> None:
+    pytest.importorskip("msgpack")
+    result = _pipeline_result()
+
+    assert PipelineResult.from_msgpack(result.to_msgpack()) == result
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter, sleep
+from typing import Any
+
+import pytest
+from medlabs_sdk.providers import PromptedLLMClient, SingleFlightGenerator, TokenBucket
+
+SCHEMA = {"type": "object"}
+
+
+class SlowGenerator:
+    """Stand-in for a remote model: fixed latency, records calls and peak concurrency."""
+
+    model = "stub-model"
+
+    def __init__(self, latency_s: float = 0.05, fail: bool = False) -> None:
+        self.latency_s = latency_s
+        self.fail = fail
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak_active = 0
+        self._lock = threading.Lock()
+
+    def generate_structured(
+        self,
+        *,
+        system_prompt: str,
+        input_text: str,
+        output_schema: dict[str, Any],
+        temperature: float = 0.0,
+    ) -> dict[str, Any]:
+        del system_prompt, output_schema, temperature
+        with self._lock:
+            self.calls.append(input_text)
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        try:
+            sleep(self.latency_s)
+            if self.fail:
+                raise RuntimeError("upstream unavailable")
+            return {"fields": [{"name_raw": input_text}]}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _call(generator: SingleFlightGenerator, text: str) -> dict[str, Any]:
+    return generator.generate_structured(
+        system_prompt="Extract.",
+        input_text=text,
+        output_schema=SCHEMA,
+    )
+
+
+def _concurrently(generator: SingleFlightGenerator, texts: list[str]) -> list[dict[str, Any]]:
+    with ThreadPoolExecutor(max_workers=len(texts)) as pool:
+        return list(pool.map(lambda text: _call(generator, text), texts))
+
+
+def test_identical_concurrent_requests_share_one_call() -> None:
+    upstream = SlowGenerator()
+    with SingleFlightGenerator(upstream) as generator:
+        results = _concurrently(generator, ["WBC 5.4"] * 8)
+
+    assert upstream.calls == ["WBC 5.4"]
+    assert all(result == {"fields": [{"name_raw": "WBC 5.4"}]} for result in results)
+    assert generator.stats()["coalesced"] == 7
+
+    # Callers get independent payloads.
+    results[0]["fields"].clear()
+    assert results[1]["fields"]
+
+
+def test_requests_are_not_cached_after_completion() -> None:
+    upstream = SlowGenerator(latency_s=0.0)
+    with SingleFlightGenerator(upstream) as generator:
+        _call(generator, "WBC 5.4")
+        _call(generator, "WBC 5.4")
+
+    assert len(upstream.calls) == 2
+
+
+def test_concurrency_is_capped() -> None:
+    upstream = SlowGenerator(latency_s=0.02)
+    with SingleFlightGenerator(upstream, max_concurrency=2) as generator:
+        _concurrently(generator, [f"line {index}" for index in range(8)])
+
+    assert len(upstream.calls) == 8
+    assert upstream.peak_active <= 2
+
+
+def test_errors_reach_every_coalesced_caller() -> None:
+    upstream = SlowGenerator(fail=True)
+    with SingleFlightGenerator(upstream) as generator:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(_call, generator, "WBC 5.4") for _ in range(4)]
+            for future in futures:
+                with pytest.raises(RuntimeError, match="upstream unavailable"):
+                    future.result()
+
+    assert len(upstream.calls) == 1
+
+
+def test_lone_request_is_sent_without_waiting() -> None:
+    upstream = SlowGenerator(latency_s=0.0)
+    with SingleFlightGenerator(upstream) as generator:
+        start = perf_counter()
+        for _ in range(20):
+            _call(generator, "WBC 5.4")
+        elapsed = perf_counter() - start
+
+    assert elapsed < 0.02
+    assert generator.stats() == {"requests": 20, "coalesced": 0, "upstream_calls": 20}
+
+
+def test_closed_generator_rejects_requests() -> None:
+    generator = SingleFlightGenerator(SlowGenerator(latency_s=0.0))
+    generator.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        _call(generator, "WBC 5.4")
+
+
+def test_prompted_client_cache_identity_is_unchanged() -> None:
+    upstream = SlowGenerator(latency_s=0.0)
+    bare = PromptedLLMClient(prompt_provider=None, generator=upstream)
+    with SingleFlightGenerator(upstream) as generator:
+        wrapped = PromptedLLMClient(prompt_provider=None, generator=generator)
+
+        assert wrapped.cache_identity(prompt_name="p", prompt_version="v") == (
+            bare.cache_identity(prompt_name="p", prompt_version="v")
+        )
+
+
+def test_token_bucket_waits_for_refill() -> None:
+    now = [0.0]
+    waits: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        waits.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=10, burst=2, clock=lambda: now[0], sleep=fake_sleep)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.1)
+    assert waits == [pytest.approx(0.1)]
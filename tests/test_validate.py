@@ -1,7 +1,11 @@
+import copy
 import json
+from collections.abc import Callable
 from pathlib import Path
 
-from medlabs_sdk.core.validate import validate_jsonschema
+import pytest
+from medlabs_sdk.core.models import ValidationIssue, ValidationResult
+from medlabs_sdk.core.validate import validate_jsonschema, validate_rules
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -37,3 +41,154 @@ def test_validate_jsonschema_reports_path_and_severity() -> None:
     assert result.errors
     assert result.errors[0].path == "/"
     assert result.errors[0].severity == "error"
+
+
+def test_validate_jsonschema_reuses_cached_validator() -> None:
+    from medlabs_sdk.core.validate import jsonschema as jsonschema_module
+
+    jsonschema_module.clear_validator_cache()
+    warmed = jsonschema_module.warm_validators()
+    assert warmed == ("CBC", "BIOCHEM", "URINALYSIS")
+
+    schema_path = jsonschema_module._schema_path_for_panel("CBC")
+    first = jsonschema_module._compiled_validator(schema_path)
+    second = jsonschema_module._compiled_validator(schema_path)
+    assert first is second
+
+
+def test_validate_jsonschema_picks_up_edited_schema(tmp_path: Path) -> None:
+    import os
+    import shutil
+
+    from medlabs_sdk.core.validate import jsonschema as jsonschema_module
+
+    schema_dir = tmp_path / "schema"
+    shutil.copytree(ROOT / "standard" / "schema" / "v0.1", schema_dir)
+    fixture = ROOT / "standard" / "examples" / "v0.1" / "cbc" / "cbc-example-1.json"
+    payload = json.loads(fixture.read_text(encoding="utf-8"))
+
+    assert validate_jsonschema(payload, panel_code="CBC", schema_dir=schema_dir).is_valid
+
+    cbc_schema_path = schema_dir / "cbc.json"
+    cbc_schema = json.loads(cbc_schema_path.read_text(encoding="utf-8"))
+    cbc_schema["required"] = ["unknown_required_field"]
+    cbc_schema_path.write_text(json.dumps(cbc_schema), encoding="utf-8")
+    stat = cbc_schema_path.stat()
+    os.utime(cbc_schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    result = validate_jsonschema(payload, panel_code="CBC", schema_dir=schema_dir)
+
+    assert not result.is_valid
+    assert "unknown_required_field" in result.errors[0].description
+    jsonschema_module.clear_validator_cache()
+
+
+def _payload_with_two_unit_errors() -> dict:
+    quantity = {"value": 1.0, "unit_code": "", "unit_system": "LOCAL"}
+    return {
+        "observations": [
+            {"value": dict(quantity)},
+            {"value": dict(quantity)},
+        ]
+    }
+
+
+def test_validation_result_buckets_issues_by_severity() -> None:
+    result = validate_rules(_payload_with_two_unit_errors())
+
+    assert not result.is_valid
+    assert (result.error_count, result.warning_count) == (2, 2)
+    assert [issue.severity for issue in result.errors] == ["error", "error"]
+
+    result.issues.append(ValidationIssue(path="/", description="late", severity="error"))
+    assert result.error_count == 3
+    assert ValidationResult(is_valid=True, issues=list(result.issues)).warning_count == 2
+
+
+def test_validate_fail_fast_stops_at_first_error() -> None:
+    payload = _payload_with_two_unit_errors()
+
+    rules = validate_rules(payload, fail_fast=True)
+    schema = validate_jsonschema(payload, panel_code="CBC", fail_fast=True)
+
+    assert not rules.is_valid
+    assert [issue.path for issue in rules.issues] == ["/observations/0/value/unit_code"]
+    assert not schema.is_valid
+    assert schema.error_count == 1
+    assert validate_jsonschema(payload, panel_code="CBC").error_count > 1
+
+
+def _first_quantity(payload: dict) -> dict:
+    values = (item["value"] for item in payload["observations"])
+    return next(value for value in values if isinstance(value, dict))
+
+
+_MUTATIONS: list[Callable[[dict], object]] = [
+    lambda payload: None,
+    lambda payload: payload.pop("source"),
+    lambda payload: payload.update(extra=1, status="draft", panel_name=5),
+    lambda payload: payload["panel_code"].update(code=5, unexpected="x"),
+    lambda payload: payload.update(observations=[]),
+    lambda payload: payload.update(observations="x"),
+    lambda payload: payload["observations"].append("not-an-object"),
+    lambda payload: payload["observations"][0].update(value=5.4, interpretation=None),
+    lambda payload: _first_quantity(payload).update(unit_code="mg/L", unit_system="X"),
+    lambda payload: payload["observations"][0].update(
+        reference_range={"low": {"value": "1", "unit_code": "g/L"}, "foo": 1}
+    ),
+    lambda payload: payload["observations"][1]["source"].update(page=0, line=1.5, bbox=[1, "a"]),
+    lambda payload: payload["observations"][1].pop("code"),
+    lambda payload: payload["observations"][2].update(specimen={"type": 1, "site": "x"}),
+]
+
+
+@pytest.mark.parametrize("panel", ["cbc", "biochem", "urinalysis"])
+@pytest.mark.parametrize("mutation", range(len(_MUTATIONS)))
+def test_fused_validation_matches_reference_engine(panel: str, mutation: int) -> None:
+    fixture = ROOT / "standard" / "examples" / "v0.1" / panel / f"{panel}-example-1.json"
+    payload = json.loads(fixture.read_text(encoding="utf-8"))
+    _MUTATIONS[mutation](payload)
+
+    reference = validate_jsonschema(copy.deepcopy(payload), panel_code=panel, mode="reference")
+    fused = validate_jsonschema(payload, panel_code=panel)
+
+    assert fused == reference
+    assert (fused.error_count, fused.warning_count) == (
+        reference.error_count,
+        reference.warning_count,
+    )
+
+
+def test_fused_validator_matches_bundled_schemas() -> None:
+    from medlabs_sdk.core.validate import schema_content_fingerprint
+    from medlabs_sdk.core.validate.fused import SCHEMA_FINGERPRINT
+
+    # Fails when standard/schema/v0.1 changes: mirror the change in fused.py,
+    # then update SCHEMA_FINGERPRINT.
+    assert schema_content_fingerprint(ROOT / "standard" / "schema" / "v0.1") == SCHEMA_FINGERPRINT
+
+
+def test_edited_bundled_schema_falls_back_to_reference(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import shutil
+
+    from medlabs_sdk.core.validate import jsonschema as jsonschema_module
+
+    schema_dir = tmp_path / "schema"
+    shutil.copytree(ROOT / "standard" / "schema" / "v0.1", schema_dir)
+    monkeypatch.setattr(jsonschema_module, "_default_schema_dir", lambda: schema_dir)
+    fixture = ROOT / "standard" / "examples" / "v0.1" / "cbc" / "cbc-example-1.json"
+    payload = json.loads(fixture.read_text(encoding="utf-8"))
+    assert validate_jsonschema(payload, panel_code="CBC").is_valid
+
+    cbc_schema_path = schema_dir / "cbc.json"
+    cbc_schema = json.loads(cbc_schema_path.read_text(encoding="utf-8"))
+    cbc_schema["required"] = ["unknown_required_field"]
+    cbc_schema_path.write_text(json.dumps(cbc_schema), encoding="utf-8")
+
+    result = validate_jsonschema(payload, panel_code="CBC")
+
+    assert not result.is_valid
+    assert "unknown_required_field" in result.errors[0].description
+    jsonschema_module.clear_validator_cache()